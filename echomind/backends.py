@@ -0,0 +1,533 @@
+import io
+import os
+import time
+import wave
+import queue
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Awaitable, Callable, Type
+
+import httpx
+import numpy as np
+from openai import AsyncOpenAI, OpenAI
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------
+# Backend interface & registry
+# -------------------------------------------------
+class TranscriptionBackend:
+    """
+    One way of turning a TranscriptionRequest into text.
+
+    `remote` backends go through the Transcriber's RequestScheduler
+    (rate limit, retries, deadlines); local ones are called directly.
+    `timeout` is the scheduler's per-attempt budget (None for local).
+    """
+
+    name = "base"
+    remote = False
+    model = ""
+    # Can return per-segment timestamps (needed for request batching)
+    supports_segments = False
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether transcribe_stream_async yields real incremental text."""
+        return False
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "TranscriptionBackend":
+        raise NotImplementedError
+
+    def transcribe(self, request, timeout: Optional[float] = None) -> str:
+        raise NotImplementedError
+
+    async def transcribe_async(self, request, timeout: Optional[float] = None) -> str:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.transcribe, request, timeout)
+
+    async def transcribe_segments_async(
+        self, request, timeout: Optional[float] = None, model: Optional[str] = None
+    ) -> list[tuple[float, float, str]]:
+        """[(start, end, text), ...] for the request's audio."""
+        raise NotImplementedError
+
+    async def transcribe_stream_async(
+        self,
+        request,
+        on_delta: Callable[[str], Awaitable[None]],
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Like transcribe_async, but awaits on_delta(text_so_far) as partial
+        text arrives. Non-streaming backends just return the final text.
+        """
+        return await self.transcribe_async(request, timeout)
+
+    def reconfigure(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
+        if model and model != self.model:
+            logger.info("Backend %s model changed: %s -> %s", self.name, self.model, model)
+            self.model = model
+
+    async def warm_up(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+BACKENDS: Dict[str, Type[TranscriptionBackend]] = {}
+
+
+def register_backend(*names: str) -> Callable[[Type[TranscriptionBackend]], Type[TranscriptionBackend]]:
+    """Class decorator: make a backend selectable by `transcription_backend`."""
+    def decorator(cls: Type[TranscriptionBackend]) -> Type[TranscriptionBackend]:
+        for name in names:
+            BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def create_backend(name: str, cfg: Dict[str, Any]) -> TranscriptionBackend:
+    try:
+        cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown transcription backend '{name}'. Available: {sorted(BACKENDS)}"
+        ) from None
+    return cls.from_config(cfg)
+
+
+# -------------------------------------------------
+# OpenAI (remote)
+# -------------------------------------------------
+@dataclass
+class PoolSettings:
+    """HTTP connection pool shared by every request of one Transcriber."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 120.0
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+
+@register_backend("openai")
+class OpenAIBackend(TranscriptionBackend):
+    """
+    OpenAI's transcription endpoint. Sync and async clients each keep a
+    pooled, keep-alive HTTP connection set (see PoolSettings), so
+    back-to-back chunks reuse the same TLS connections. The async client
+    is created on first use, inside the event loop that will drive it.
+    Retries are left to the RequestScheduler.
+    """
+
+    name = "openai"
+    remote = True
+    supports_segments = True
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini-transcribe",
+        pool: Optional[PoolSettings] = None,
+    ) -> None:
+        computed_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if not computed_key:
+            raise ValueError(
+                "No OpenAI API key provided. "
+                "Set OPENAI_API_KEY env var or add 'openai_api_key' in config.json."
+            )
+
+        self.api_key = computed_key
+        self.model = model
+        self.pool = pool or PoolSettings()
+        self.client = self._build_client()
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._warmed_up = False
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "OpenAIBackend":
+        return cls(
+            api_key=cfg.get("openai_api_key") or None,
+            model=cfg.get("transcription_model", "gpt-4o-mini-transcribe"),
+            pool=PoolSettings(
+                max_connections=cfg.get("http_max_connections", 20),
+                max_keepalive_connections=cfg.get("http_keepalive_connections", 10),
+                keepalive_expiry=cfg.get("http_keepalive_expiry", 120.0),
+                timeout=cfg.get("request_timeout", 30.0),
+            ),
+        )
+
+    def reconfigure(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
+        """
+        The API client is only rebuilt when the key actually changes, so a
+        model switch keeps warm connections.
+        """
+        super().reconfigure(model=model)
+
+        computed_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if computed_key and computed_key != self.api_key:
+            self.api_key = computed_key
+            self.client = self._build_client()
+            # Rebuilt lazily on the next async call
+            self._async_client = None
+            self._warmed_up = False
+            logger.info("OpenAI client rebuilt with new key")
+
+    def _build_client(self) -> OpenAI:
+        return OpenAI(
+            api_key=self.api_key,
+            timeout=self.pool.timeouts(),
+            max_retries=0,
+            http_client=httpx.Client(
+                limits=self.pool.limits(),
+                timeout=self.pool.timeouts(),
+            ),
+        )
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                timeout=self.pool.timeouts(),
+                max_retries=0,
+                http_client=httpx.AsyncClient(
+                    limits=self.pool.limits(),
+                    timeout=self.pool.timeouts(),
+                ),
+            )
+        return self._async_client
+
+    def transcribe(self, request, timeout: Optional[float] = None) -> str:
+        result = self.client.audio.transcriptions.create(
+            model=request.model or self.model,
+            file=request.as_file(),
+            language=request.language,
+            temperature=request.temperature,
+            timeout=timeout,
+        )
+        return (result.text or "").strip()
+
+    async def transcribe_async(self, request, timeout: Optional[float] = None) -> str:
+        result = await self.async_client.audio.transcriptions.create(
+            model=request.model or self.model,
+            file=request.as_file(),
+            language=request.language,
+            temperature=request.temperature,
+            timeout=timeout,
+        )
+        return (result.text or "").strip()
+
+    @property
+    def supports_streaming(self) -> bool:
+        # whisper-1 ignores stream=True; the gpt-4o transcribe models stream
+        return not self.model.startswith("whisper")
+
+    async def transcribe_stream_async(
+        self,
+        request,
+        on_delta: Callable[[str], Awaitable[None]],
+        timeout: Optional[float] = None,
+    ) -> str:
+        if not self.supports_streaming:
+            return await self.transcribe_async(request, timeout)
+
+        stream = await self.async_client.audio.transcriptions.create(
+            model=request.model or self.model,
+            file=request.as_file(),
+            language=request.language,
+            temperature=request.temperature,
+            stream=True,
+            timeout=timeout,
+        )
+        text = ""
+        async for event in stream:
+            if event.type == "transcript.text.delta":
+                text += event.delta
+                await on_delta(text)
+            elif event.type == "transcript.text.done":
+                text = event.text
+        return text.strip()
+
+    async def transcribe_segments_async(
+        self, request, timeout: Optional[float] = None, model: Optional[str] = None
+    ) -> list[tuple[float, float, str]]:
+        """
+        Segment-level timestamps need verbose_json, which only whisper-1
+        supports today; hence the separate `model`.
+        """
+        result = await self.async_client.audio.transcriptions.create(
+            model=model or self.model,
+            file=request.as_file(),
+            language=request.language,
+            temperature=request.temperature,
+            response_format="verbose_json",
+            timestamp_granularities=["segment"],
+            timeout=timeout,
+        )
+
+        segments = []
+        for seg in getattr(result, "segments", None) or []:
+            if isinstance(seg, dict):
+                segments.append((seg["start"], seg["end"], seg["text"]))
+            else:
+                segments.append((seg.start, seg.end, seg.text))
+        if not segments and (result.text or "").strip():
+            segments.append((0.0, 0.0, result.text))
+        return segments
+
+    async def warm_up(self) -> None:
+        """
+        Open a pooled connection ahead of the first chunk, so it doesn't
+        pay DNS + TLS setup. Cheap metadata call; failures are only logged.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+
+        started = time.monotonic()
+        try:
+            await self.async_client.models.retrieve(self.model)
+            logger.info("OpenAI warm-up done in %.0f ms", (time.monotonic() - started) * 1000)
+        except Exception as exc:
+            logger.warning("OpenAI warm-up failed: %s", exc)
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        self.client.close()
+
+
+# -------------------------------------------------
+# Local CPU (faster-whisper / CTranslate2)
+# -------------------------------------------------
+WHISPER_SAMPLERATE = 16000
+
+
+def wav_to_whisper_audio(wav_bytes: bytes) -> np.ndarray:
+    """WAV bytes -> mono float32 in [-1, 1] at 16 kHz, as Whisper expects."""
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        channels = wf.getnchannels()
+        samplerate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        audio = audio[: len(audio) - len(audio) % channels].reshape(-1, channels).mean(axis=1)
+
+    if samplerate != WHISPER_SAMPLERATE and len(audio):
+        n_out = int(len(audio) * WHISPER_SAMPLERATE / samplerate)
+        audio = np.interp(
+            np.linspace(0, len(audio) - 1, n_out),
+            np.arange(len(audio)),
+            audio,
+        ).astype(np.float32)
+    return audio
+
+
+@register_backend("faster-whisper", "local")
+class FasterWhisperBackend(TranscriptionBackend):
+    """
+    Offline transcription on the CPU with faster-whisper (CTranslate2).
+
+    The model is loaded once, on first use. All requests go through one
+    worker thread that collects whatever is queued (up to `batch_size`,
+    waiting at most `batch_window` seconds) and runs it as one batch
+    through BatchedInferencePipeline, so concurrent sessions/uploads
+    share a single forward pass instead of contending for the model.
+    """
+
+    name = "faster-whisper"
+    remote = False
+
+    def __init__(
+        self,
+        model: str = "small",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        language: Optional[str] = "en",
+        batch_size: int = 8,
+        batch_window: float = 0.05,
+    ) -> None:
+        self.model = model
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.language = language
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+
+        self._model = None
+        self._pipeline = None
+        self._load_lock = threading.Lock()
+        self._queue: "queue.Queue[tuple[np.ndarray, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "FasterWhisperBackend":
+        return cls(
+            model=cfg.get("local_model", "small"),
+            compute_type=cfg.get("local_compute_type", "int8"),
+            cpu_threads=cfg.get("local_cpu_threads", 0),
+            batch_size=cfg.get("local_batch_size", 8),
+            batch_window=cfg.get("local_batch_window_ms", 50) / 1000.0,
+        )
+
+    def reconfigure(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
+        # Model names are per backend; local_model changes rebuild the backend.
+        pass
+
+    def _load(self):
+        with self._load_lock:
+            if self._model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as exc:
+                    raise RuntimeError(
+                        "The local backend needs faster-whisper: pip install faster-whisper"
+                    ) from exc
+
+                started = time.monotonic()
+                self._model = WhisperModel(
+                    self.model,
+                    device="cpu",
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                )
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                    self._pipeline = BatchedInferencePipeline(model=self._model)
+                except ImportError:
+                    self._pipeline = None  # older faster-whisper: one clip per pass
+                logger.info(
+                    "Loaded local model %s (%s) in %.1fs",
+                    self.model, self.compute_type, time.monotonic() - started,
+                )
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="faster-whisper", daemon=True
+                )
+                self._worker.start()
+
+    def _submit(self, request) -> Future:
+        self._load()
+        future: Future = Future()
+        self._queue.put((wav_to_whisper_audio(request.payload), future))
+        return future
+
+    def transcribe(self, request, timeout: Optional[float] = None) -> str:
+        future = self._submit(request)
+        try:
+            return future.result(timeout)
+        finally:
+            future.cancel()  # no-op once resolved; else the worker skips it
+
+    async def transcribe_async(self, request, timeout: Optional[float] = None) -> str:
+        loop = asyncio.get_event_loop()
+        future = await loop.run_in_executor(None, self._submit, request)
+        # Cancelling the wrapper (timeout, caller gone) cancels `future` too
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    async def warm_up(self) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._load)
+        except Exception as exc:
+            logger.warning("Local model warm-up failed: %s", exc)
+
+    # ---- batching worker ----
+    def _run_worker(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Callers that gave up meanwhile don't need a pass; the rest
+            # can no longer be cancelled once marked running
+            batch = [(audio, future) for audio, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                texts = self._infer(batch)
+            except Exception as exc:
+                texts = [exc] * len(batch)
+            for (_, future), result in zip(batch, texts):
+                try:
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                except Exception as exc:
+                    # e.g. the caller's event loop closed; don't take the worker down
+                    logger.debug("Dropped local result: %s", exc)
+
+    def _infer(self, batch: list) -> list[str]:
+        if self._pipeline is None or len(batch) == 1:
+            return [self._transcribe_one(audio) for audio, _ in batch]
+
+        # Lay the clips end to end with a gap and hand the pipeline their
+        # boundaries, so each clip is one item of a single batched pass.
+        gap = np.zeros(WHISPER_SAMPLERATE // 2, dtype=np.float32)
+        pieces, spans, offset = [], [], 0.0
+        for audio, _ in batch:
+            duration = len(audio) / WHISPER_SAMPLERATE
+            spans.append((offset, offset + duration))
+            pieces.extend([audio, gap])
+            offset += duration + len(gap) / WHISPER_SAMPLERATE
+
+        segments, _ = self._pipeline.transcribe(
+            np.concatenate(pieces),
+            language=self.language,
+            batch_size=len(batch),
+            clip_timestamps=[{"start": start, "end": end} for start, end in spans],
+            without_timestamps=True,
+        )
+        return assign_segments_to_spans(
+            [(seg.start, seg.end, seg.text) for seg in segments], spans
+        )
+
+    def _transcribe_one(self, audio: np.ndarray) -> str:
+        segments, _ = self._model.transcribe(audio, language=self.language, beam_size=1)
+        return " ".join(seg.text.strip() for seg in segments).strip()
+
+
+def assign_segments_to_spans(segments: list, spans: list) -> list[str]:
+    """
+    Map timestamped segments [(start, end, text), ...] of a concatenated
+    recording back onto the original clips [(start, end), ...] by each
+    segment's midpoint. Returns one joined text per clip.
+    """
+    texts: list[list[str]] = [[] for _ in spans]
+    for start, end, text in segments:
+        mid = (start + end) / 2.0
+        best = min(
+            range(len(spans)),
+            key=lambda i: 0.0 if spans[i][0] <= mid <= spans[i][1]
+            else min(abs(mid - spans[i][0]), abs(mid - spans[i][1])),
+        )
+        texts[best].append(text.strip())
+    return [" ".join(t for t in parts if t).strip() for parts in texts]
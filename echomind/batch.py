@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Headless batch transcription: walk a directory of recordings and write
+one transcript per file, using the same silence splitting, gating and
+Transcriber as the service (settings from ~/.echomind/config.json).
+
+    python batch.py ~/Recordings --out ~/Transcripts [--workers 4] [--format json]
+
+Files are spread over a pool of worker processes, each with its own
+Transcriber; the configured rate limit is divided between them. Workers
+don't write to the service's echomind.log (it may be running); their
+warnings go to stderr. Transcripts keep the source's extension
+(talk.mp3 -> talk.mp3.txt), so recordings that differ only in it don't
+overwrite each other. Progress
+is checkpointed in <out>/.echomind-batch.json after every file, and long
+files also keep their finished segments in a .partial.jsonl next to the
+transcript, so an interrupted run picks up where it stopped. Files that
+changed since they were transcribed are done again; --restart ignores
+the checkpoint altogether.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Optional
+
+AUDIO_EXTENSIONS = {
+    ".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg", ".opus",
+    ".aiff", ".aif", ".caf", ".wma", ".mp4", ".mov", ".webm",
+}
+CHECKPOINT_NAME = ".echomind-batch.json"
+
+
+# -------------------------------------------------
+# Checkpoint (parent process only)
+# -------------------------------------------------
+class Checkpoint:
+    """relative path -> {"status", "size", "mtime_ns", ...}, rewritten atomically."""
+
+    def __init__(self, path: Path, restart: bool = False) -> None:
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        if path.exists() and not restart:
+            try:
+                self.files = json.loads(path.read_text()).get("files", {})
+            except (OSError, ValueError):
+                print(f"Ignoring unreadable checkpoint {path}")
+
+    @staticmethod
+    def fingerprint(path: Path) -> Dict[str, int]:
+        st = path.stat()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def is_done(self, rel: str, path: Path) -> bool:
+        entry = self.files.get(rel)
+        if not entry or entry.get("status") != "done":
+            return False
+        fp = self.fingerprint(path)
+        return entry.get("size") == fp["size"] and entry.get("mtime_ns") == fp["mtime_ns"]
+
+    def record(self, rel: str, entry: Dict[str, Any]) -> None:
+        self.files[rel] = entry
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"files": self.files}, indent=2))
+        os.replace(tmp, self.path)
+
+
+# -------------------------------------------------
+# Worker process
+#   One Transcriber and one event loop per worker, reused for every file
+#   it gets, so the API client's connection pool stays warm.
+# -------------------------------------------------
+worker = None
+
+
+class Worker:
+    def __init__(self, workers: int) -> None:
+        import logging
+
+        # The service module is the one place the config becomes components.
+        # Importing it attaches file handlers to echomind.log, which a live
+        # service is rotating; keep the worker out of it.
+        log = logging.getLogger("EchoMind")
+        log.disabled = True
+        import service
+
+        for handler in [h for h in log.handlers if isinstance(h, logging.FileHandler)]:
+            log.removeHandler(handler)
+            handler.close()
+        log.disabled = False
+
+        self.service = service
+        cfg = dict(service.config)
+        # Share the configured rate limit between the pool's processes
+        cfg["rate_limit_rpm"] = cfg.get("rate_limit_rpm", 50.0) / workers
+        cfg["rate_limit_burst"] = max(1, int(cfg.get("rate_limit_burst", 10)) // workers)
+        self.config = cfg
+        self.transcriber = service.transcriber_factory(cfg)
+        self.loop = asyncio.new_event_loop()
+
+
+def init_worker(workers: int) -> None:
+    global worker
+    worker = Worker(workers)
+
+
+def decode_to_wav(path: Path, tmpdir: str) -> Path:
+    """`path` itself if it's 16-bit WAV, else an ffmpeg conversion in tmpdir."""
+    import wave
+
+    try:
+        with wave.open(str(path), "rb") as wf:
+            if wf.getsampwidth() == 2:
+                return path
+    except (wave.Error, EOFError):
+        pass
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("not a 16-bit WAV and ffmpeg is not installed")
+
+    wav_path = Path(tmpdir) / (path.stem + ".pcm.wav")
+    proc = subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-i", str(path), "-acodec", "pcm_s16le", str(wav_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"could not decode audio: {proc.stderr.decode(errors='replace').strip()}")
+    return wav_path
+
+
+def load_partial(partial_path: Path) -> Dict[tuple, Dict[str, Any]]:
+    """Segments finished by an earlier run, keyed by their frame span."""
+    done = {}
+    if not partial_path.exists():
+        return done
+    for line in partial_path.read_text().splitlines():
+        try:
+            seg = json.loads(line)
+        except ValueError:
+            continue  # torn last line from an interrupted write
+        done[(seg["start_frame"], seg["end_frame"])] = seg
+    return done
+
+
+async def transcribe_segments(wav_path: Path, segments, partial_path: Path, concurrency: int) -> tuple[list, int]:
+    """Results for every segment, and how many of them got no answer."""
+    from gating import read_wav_span
+
+    service = worker.service
+    max_age = worker.config.get("upload_max_segment_age", 300.0)
+    done = load_partial(partial_path)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    with partial_path.open("a") as partial:
+
+        async def transcribe_segment(segment):
+            key = (segment.start_frame, segment.end_frame)
+            if key in done:
+                return done[key], True
+            async with semaphore:
+                wav_bytes = await loop.run_in_executor(
+                    None, read_wav_span, wav_path, segment.start_frame, segment.end_frame
+                )
+                marks = {}
+                text = await worker.transcriber.transcribe_bytes_async(
+                    wav_bytes, source="file", timings=marks, max_age=max_age
+                )
+            # A failed request also comes back as "", but without an answer
+            # ("received"); only answered segments are checkpointed, the
+            # rest are retried next run
+            keep = "received" in marks
+            if service.looks_like_noise(text or ""):
+                text = ""
+            result = {
+                "index": segment.index,
+                "start_frame": segment.start_frame,
+                "end_frame": segment.end_frame,
+                "start": round(segment.start, 3),
+                "end": round(segment.end, 3),
+                "text": text,
+            }
+            if keep:
+                partial.write(json.dumps(result) + "\n")
+                partial.flush()
+            return result, keep
+
+        outcomes = await asyncio.gather(*(transcribe_segment(s) for s in segments))
+    return [result for result, _ in outcomes], sum(not keep for _, keep in outcomes)
+
+
+def format_time(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def write_transcript(out_path: Path, source: Path, results: list, fmt: str) -> None:
+    lines = [r for r in sorted(results, key=lambda r: r["start_frame"]) if r["text"]]
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    if fmt == "json":
+        segments = [{k: r[k] for k in ("start", "end", "text")} for r in lines]
+        tmp.write_text(json.dumps({"source": str(source), "segments": segments}, indent=2, ensure_ascii=False))
+    else:
+        tmp.write_text("".join(f"[{format_time(r['start'])}] {r['text']}\n" for r in lines))
+    os.replace(tmp, out_path)
+
+
+def transcribe_file(path: str, out_path: str, fmt: str, concurrency: int) -> Dict[str, Any]:
+    """Worker task: one recording -> one transcript. Returns a summary for the checkpoint."""
+    from gating import split_on_silence
+
+    service = worker.service
+    cfg = worker.config
+    path, out_path = Path(path), Path(out_path)
+    partial_path = out_path.with_name(out_path.name + ".partial.jsonl")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+
+    with tempfile.TemporaryDirectory(prefix="echomind-batch-") as tmpdir:
+        wav_path = decode_to_wav(path, tmpdir)
+        # Same splitting and gating as POST /transcribe/file
+        segments = split_on_silence(
+            wav_path,
+            window_seconds=cfg.get("chunk_duration", 2),
+            max_segment_seconds=cfg.get("upload_max_segment_seconds", 30),
+            rms_threshold=service.gate_settings(cfg)["system_threshold"],
+            silence_rms=service.silence_settings(cfg)["rms_threshold"],
+            silence_peak=service.silence_settings(cfg)["peak_threshold"],
+        )
+        results, failed = worker.loop.run_until_complete(
+            transcribe_segments(wav_path, segments, partial_path, concurrency)
+        )
+        if failed:
+            # The .partial.jsonl stays for the next run
+            raise RuntimeError(
+                f"{failed} of {len(segments)} segment requests failed; "
+                f"the others are kept for the next run"
+            )
+
+    write_transcript(out_path, path, results, fmt)
+    partial_path.unlink(missing_ok=True)
+    return {
+        "segments": len(segments),
+        "audio_seconds": round(segments[-1].end, 1) if segments else 0.0,
+        "elapsed": round(time.monotonic() - started, 1),
+    }
+
+
+# -------------------------------------------------
+# Main
+# -------------------------------------------------
+def find_recordings(root: Path, out_dir: Path) -> list[Path]:
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Don't descend into the output directory if it's inside the input
+        dirnames[:] = sorted(d for d in dirnames if Path(dirpath, d).resolve() != out_dir.resolve())
+        for name in sorted(filenames):
+            if Path(name).suffix.lower() in AUDIO_EXTENSIONS and not name.startswith("."):
+                found.append(Path(dirpath, name))
+    return found
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Transcribe a directory of recordings")
+    parser.add_argument("input", type=Path, help="directory to walk (recursively)")
+    parser.add_argument("--out", type=Path, help="where transcripts go (default: <input>/transcripts)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--concurrency", type=int, default=4, help="segments in flight per worker")
+    parser.add_argument("--format", choices=("txt", "json"), default="txt")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and redo every file")
+    args = parser.parse_args(argv)
+
+    root = args.input.expanduser().resolve()
+    if not root.is_dir():
+        parser.error(f"{root} is not a directory")
+    out_dir = (args.out.expanduser() if args.out else root / "transcripts").resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, args.workers)
+
+    checkpoint = Checkpoint(out_dir / CHECKPOINT_NAME, restart=args.restart)
+    recordings = find_recordings(root, out_dir)
+    todo = [p for p in recordings if not checkpoint.is_done(str(p.relative_to(root)), p)]
+    print(f"{len(recordings)} recordings, {len(recordings) - len(todo)} already done, {len(todo)} to go")
+    if not todo:
+        return 0
+
+    failed = 0
+    started = time.monotonic()
+    # spawn: workers must not inherit this process's state (or threads) via fork
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(todo)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(min(workers, len(todo)),),
+    ) as pool:
+        futures = {}
+        for path in todo:
+            rel = path.relative_to(root)
+            out_path = out_dir / rel.with_name(f"{rel.name}.{args.format}")
+            future = pool.submit(transcribe_file, str(path), str(out_path), args.format, args.concurrency)
+            futures[future] = (str(rel), path, out_path)
+
+        try:
+            for n, future in enumerate(as_completed(futures), 1):
+                rel, path, out_path = futures[future]
+                entry = {**Checkpoint.fingerprint(path), "output": str(out_path.relative_to(out_dir))}
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    failed += 1
+                    checkpoint.record(rel, {**entry, "status": "failed", "error": str(e)})
+                    print(f"[{n}/{len(todo)}] {rel}: FAILED ({e})")
+                    continue
+                checkpoint.record(rel, {**entry, "status": "done", **summary})
+                print(
+                    f"[{n}/{len(todo)}] {rel}: {summary['segments']} segments, "
+                    f"{format_time(summary['audio_seconds'])} audio in {summary['elapsed']:.0f}s"
+                )
+        except KeyboardInterrupt:
+            print("Interrupted; progress is saved, run again to resume")
+            pool.shutdown(wait=False, cancel_futures=True)
+            return 130
+
+    print(f"Done in {format_time(time.monotonic() - started)}: {len(todo) - failed} ok, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
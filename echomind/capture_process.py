@@ -0,0 +1,485 @@
+import sys
+import time
+import atexit
+import logging
+import threading
+import multiprocessing as mp
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from recorder import ChunkRecorder
+
+logger = logging.getLogger("EchoMind")
+
+
+# -------------------------------------------------
+# Shared-memory ring
+#   One writer (the capture child's audio callback), one reader (the
+#   service). Frames are int16, only the 3 columns the chunks use
+#   (system 0-1, mic 2). The header lives in the same block:
+#     write_pos   total frames ever written (the index into the ring is
+#                 write_pos % capacity); the reader keeps its own read_pos
+#     channels    columns valid since layout_pos (moves on device switch)
+#     overflows   PortAudio input overflows seen by the callback
+#     heartbeat   monotonic ms of the last callback, to detect a stall
+#     clock_pos   write_pos of the last block's first frame, and
+#     clock_us    its capture time (epoch us), to stamp chunks with
+#   followed by the peak-hold levels (system, mic) as float64.
+#   The writer updates the header and frames under a process-shared
+#   lock and the reader copies the header under it, so a published
+#   write_pos never gets ahead of its frames, whatever order the CPU
+#   makes plain stores visible in (ARM / Apple Silicon).
+# -------------------------------------------------
+WRITE_POS, CHANNELS, LAYOUT_POS, OVERFLOWS, HEARTBEAT, CLOCK_POS, CLOCK_US = range(7)
+HEADER_SLOTS = 8
+LEVEL_SLOTS = 2
+DATA_OFFSET = 128
+
+
+class SharedRing:
+    COLUMNS = 3
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, lock) -> None:
+        self.shm = shm
+        self.capacity = capacity
+        self.lock = lock
+        buf = shm.buf
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=buf)
+        self.levels = np.ndarray((LEVEL_SLOTS,), dtype=np.float64, buffer=buf, offset=HEADER_SLOTS * 8)
+        self.data = np.ndarray((capacity, self.COLUMNS), dtype=np.int16, buffer=buf, offset=DATA_OFFSET)
+
+    @classmethod
+    def size(cls, capacity: int) -> int:
+        return DATA_OFFSET + capacity * cls.COLUMNS * 2
+
+    @classmethod
+    def create(cls, capacity: int, lock) -> "SharedRing":
+        ring = cls(shared_memory.SharedMemory(create=True, size=cls.size(capacity)), capacity, lock)
+        ring.header[:] = 0
+        ring.levels[:] = 0.0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, capacity: int, lock) -> "SharedRing":
+        return cls(shared_memory.SharedMemory(name=name), capacity, lock)
+
+    # Writer side (holding self.lock) ---------------------------------
+    def write(self, block: np.ndarray) -> None:
+        frames = len(block)
+        if not frames:
+            return
+        cols = min(block.shape[1], self.COLUMNS)
+        pos = int(self.header[WRITE_POS])
+        if cols != self.header[CHANNELS]:
+            self.header[LAYOUT_POS] = pos
+            self.header[CHANNELS] = cols
+
+        start = pos % self.capacity
+        first = min(frames, self.capacity - start)
+        self.data[start:start + first, :cols] = block[:first, :cols]
+        self.data[: frames - first, :cols] = block[first:, :cols]
+        self.header[WRITE_POS] = pos + frames
+
+    # Reader side -----------------------------------------------------
+    def snapshot(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """
+        A consistent copy of the header, or None if the writer has held
+        the lock for `timeout` (it died or stalled mid-write).
+        """
+        if not self.lock.acquire(timeout=timeout):
+            return None
+        try:
+            return self.header.copy()
+        finally:
+            self.lock.release()
+
+    def view(self, start: int, frames: int, cols: int) -> np.ndarray:
+        """Frames [start, start + frames) - a view into the ring unless they wrap."""
+        begin = start % self.capacity
+        end = begin + frames
+        if end <= self.capacity:
+            return self.data[begin:end, :cols]
+        return np.concatenate((self.data[begin:, :cols], self.data[: end - self.capacity, :cols]))
+
+    def close(self) -> None:
+        # Drop our views before closing, or the mapping can't be released
+        self.header = self.levels = self.data = None
+        self.shm.close()
+
+
+# -------------------------------------------------
+# Capture child
+# -------------------------------------------------
+class RingWriter(ChunkRecorder):
+    """The capture child's recorder: its callback writes into the ring instead of a queue."""
+
+    def __init__(self, ring: SharedRing, **kwargs) -> None:
+        self.ring = ring
+        # Two streams overlap briefly during a device switch
+        self._write_lock = threading.Lock()
+        self._written_generation = 0
+        super().__init__(**kwargs)
+
+    def _callback(self, indata, frames, time_info, status, generation=0):
+        if status:
+            print("Recorder status:", status)
+            if status.input_overflow:
+                self.ring.header[OVERFLOWS] += 1
+        with self._write_lock, self.ring.lock:
+            if generation < self._written_generation:
+                return  # the old stream of a device switch; the new one has taken over
+            if generation > self._written_generation:
+                if self._written_generation:
+                    # Switched stream: the reader starts its chunk over from here
+                    self.ring.header[LAYOUT_POS] = self.ring.header[WRITE_POS]
+                self._written_generation = generation
+            self.ring.header[CLOCK_US] = int(self._block_time(time_info, frames) * 1e6)
+            self.ring.header[CLOCK_POS] = self.ring.header[WRITE_POS]
+            self.ring.write(indata)
+        self._update_levels(indata)
+        self.ring.levels[:] = (self.levels["system"], self.levels["mic"])
+        self.ring.header[HEARTBEAT] = int(time.monotonic() * 1000)
+
+
+def capture_main(shm_name: str, capacity: int, lock, conn, options: dict) -> None:
+    """
+    Child process entry point: open the device, then serve start / stop /
+    set_device commands from the service until it says exit or goes away.
+    """
+    ring = SharedRing.attach(shm_name, capacity, lock)
+    try:
+        writer = RingWriter(ring, **options)
+    except Exception as e:
+        conn.send(("error", str(e)))
+        ring.close()
+        return
+
+    def state():
+        return {"device": writer.device, "channels": writer.channels}
+
+    conn.send(("ok", state()))
+    try:
+        while True:
+            try:
+                command, arg = conn.recv()
+            except (EOFError, OSError):
+                break  # the service is gone
+            if command == "exit":
+                break
+            try:
+                if command == "start":
+                    writer.start()
+                elif command == "stop":
+                    writer.stop()
+                elif command == "set_device":
+                    writer.set_device(arg)
+                conn.send(("ok", state()))
+            except Exception as e:
+                conn.send(("error", str(e)))
+    finally:
+        writer.stop()
+        ring.close()
+
+
+@contextmanager
+def bare_main():
+    """
+    A spawned child re-imports the launching script as __mp_main__; for
+    service.py that means building the app and opening its log again.
+    The child only needs this module, so hide the script while it starts.
+    """
+    main = sys.modules["__main__"]
+    saved = {k: main.__dict__.pop(k) for k in ("__file__", "__spec__") if k in main.__dict__}
+    main.__spec__ = None
+    try:
+        yield
+    finally:
+        del main.__spec__
+        main.__dict__.update(saved)
+
+
+# -------------------------------------------------
+# Service side
+# -------------------------------------------------
+class ProcessRecorder(ChunkRecorder):
+    """
+    ChunkRecorder with the audio stream in a child process, so the
+    PortAudio callback never waits on this process's GIL (gating, the
+    web server, the API client). The child writes into a shared-memory
+    ring of `ring_seconds`; get_next_chunk() builds chunks straight from
+    views into it.
+
+    A child that dies, or stops delivering audio for `stall_seconds`
+    while recording, is replaced and the stream restarted; the ring and
+    read position survive, so only the gap is lost.
+    """
+
+    def __init__(
+        self,
+        chunk_seconds=1,
+        samplerate=48000,
+        dtype="int16",
+        device_index=None,
+        capture_system_audio=True,
+        capture_microphone=True,
+        ring_seconds: float = 30.0,
+        stall_seconds: float = 3.0,
+    ):
+        if np.dtype(dtype) != np.int16:
+            raise ValueError("ProcessRecorder only supports int16 capture")
+
+        self.chunk_seconds = chunk_seconds
+        self.samplerate = samplerate
+        self.dtype = dtype
+        self.capture_system_audio = capture_system_audio
+        self.capture_microphone = capture_microphone
+        self.stall_seconds = stall_seconds
+
+        self.running = False
+        self.restarts = 0
+        self._retry_at = 0.0
+        self.dropped_frames = 0
+        self.device, self.channels = device_index, 0
+
+        self._ctx = mp.get_context("spawn")
+        self.ring = SharedRing.create(int(samplerate * ring_seconds), self._ctx.Lock())
+        self.read_pos = 0
+        # Header as of the last _available(), for the chunk it sized
+        self._header = self.ring.header.copy()
+        self.process: Optional[mp.Process] = None
+        self.conn = None
+        # _command_lock covers one round-trip on the pipe; _restart_lock the
+        # (slow) replacement of the child, so commands never wait on a spawn
+        self._command_lock = threading.Lock()
+        self._restart_lock = threading.Lock()
+        try:
+            self.process, self.conn = self._spawn()
+        except Exception:
+            self.close()
+            raise
+        atexit.register(self.close)
+
+    # -------------------------------------------------
+    # Child management
+    # -------------------------------------------------
+    def _spawn(self):
+        """Start a child and wait until it has opened the device; returns (process, conn)."""
+        parent_conn, child_conn = self._ctx.Pipe()
+        options = {
+            "samplerate": self.samplerate,
+            "dtype": self.dtype,
+            "device_index": self.device,
+        }
+        process = self._ctx.Process(
+            target=capture_main,
+            args=(self.ring.shm.name, self.ring.capacity, self.ring.lock, child_conn, options),
+            name="echomind-capture",
+            daemon=True,
+        )
+        with bare_main():
+            process.start()
+        child_conn.close()
+        try:
+            self._reply(parent_conn)  # device opened (or the error why not)
+        except Exception:
+            process.kill()
+            parent_conn.close()
+            raise
+        return process, parent_conn
+
+    def _reply(self, conn, timeout: float = 10.0) -> dict:
+        if not conn.poll(timeout):
+            raise RuntimeError("Capture process did not respond")
+        status, payload = conn.recv()
+        if status != "ok":
+            raise RuntimeError(f"Capture process: {payload}")
+        self.device, self.channels = payload["device"], payload["channels"]
+        return payload
+
+    def _send(self, command: str, arg=None):
+        with self._command_lock:
+            conn = self.conn
+            try:
+                conn.send((command, arg))
+                return conn, self._reply(conn)
+            except (EOFError, OSError):
+                return conn, None
+
+    def _command(self, command: str, arg=None) -> dict:
+        """Blocking (worker thread): a pipe round-trip, or a child restart if it's gone."""
+        conn, payload = self._send(command, arg)
+        if payload is not None:
+            return payload
+        self._restart("capture process is gone", stale=conn)
+        if command == "stop":
+            return {}
+        conn, payload = self._send(command, arg)
+        if payload is None:
+            raise RuntimeError("Capture process is gone")
+        return payload
+
+    def _restart(self, reason: str, stale=None):
+        """
+        Replace the child. `stale` is the pipe the caller found broken; if
+        another thread has replaced the child since, there's nothing to do.
+        """
+        with self._restart_lock:
+            if stale is not None and stale is not self.conn:
+                return
+            logger.warning(f"Restarting capture process ({reason})")
+            self.restarts += 1
+            old = self.process
+            if old is not None and old.is_alive():
+                old.kill()  # also unblocks a command waiting on its reply
+            if old is not None:
+                old.join(timeout=2)
+            # A child killed mid-write would leave the ring lock held forever
+            self.ring.lock = self._ctx.Lock()
+
+            process, conn = self._spawn()
+            started = self.running
+            if started:
+                conn.send(("start", None))
+                self._reply(conn)
+                self.ring.header[HEARTBEAT] = int(time.monotonic() * 1000)
+            with self._command_lock:
+                self.conn.close()
+                self.process, self.conn = process, conn
+        if started and not self.running:
+            self._command("stop")  # stop() came in while we were restarting
+
+    def _check_child(self):
+        """Called from the reader loop: replace a dead or stalled child."""
+        if time.monotonic() < self._retry_at:
+            return
+        if not self.process.is_alive():
+            reason = f"exit code {self.process.exitcode}"
+        elif self.running and time.monotonic() * 1000 - self.ring.header[HEARTBEAT] > self.stall_seconds * 1000:
+            reason = f"no audio for {self.stall_seconds:g}s"
+        else:
+            return
+        try:
+            self._restart(reason, stale=self.conn)
+        except Exception as e:
+            logger.error(f"Capture process restart failed: {e}")
+        # Give a failing device a moment before the next attempt
+        self._retry_at = time.monotonic() + 2.0
+
+    def close(self):
+        if self.ring is None:
+            return
+        try:
+            if self.process is not None and self.process.is_alive() and self.conn is not None:
+                self.conn.send(("exit", None))
+                self.process.join(timeout=2)
+                if self.process.is_alive():
+                    self.process.kill()
+        except Exception:
+            pass
+        shm = self.ring.shm
+        self.ring.close()
+        shm.unlink()
+        self.ring = None
+
+    # -------------------------------------------------
+    # Recorder interface
+    # -------------------------------------------------
+    @property
+    def levels(self) -> dict:
+        system, mic = self.ring.levels
+        return {"system": float(system), "mic": float(mic)}
+
+    @property
+    def overflows(self) -> int:
+        return int(self.ring.header[OVERFLOWS])
+
+    def buffer_seconds(self) -> float:
+        return (int(self.ring.header[WRITE_POS]) - self.read_pos) / self.samplerate
+
+    def start(self):
+        if self.running:
+            return
+        # Drop stale audio left over from a stop without flush()
+        header = self.ring.snapshot()
+        if header is not None:
+            self.read_pos = int(header[WRITE_POS])
+        self.ring.header[HEARTBEAT] = int(time.monotonic() * 1000)
+        self._command("start")
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._command("stop")
+
+    def set_device(self, device_index):
+        if device_index == self.device:
+            return
+        self._command("set_device", device_index)
+
+    def _available(self) -> int:
+        """Frames waiting to be read, after skipping overwritten or old-layout audio."""
+        header = self.ring.snapshot()
+        if header is None:
+            return 0  # the child is stuck holding the lock; _check_child replaces it
+        self._header = header
+        write_pos = int(header[WRITE_POS])
+        layout_pos = int(header[LAYOUT_POS])
+        if self.read_pos < layout_pos:
+            # Device switched: start over on the new layout
+            self.read_pos = layout_pos
+        behind = write_pos - self.read_pos
+        if behind > self.ring.capacity:
+            skip = behind - self.ring.capacity // 2
+            self.dropped_frames += skip
+            self.read_pos += skip
+            logger.warning(f"Capture ring overrun: dropped {skip / self.samplerate:.1f}s of audio")
+        return write_pos - self.read_pos
+
+    def _frame_time(self, pos: int) -> float:
+        """Capture time of frame `pos`, counted back from the last stamped block."""
+        clock_pos = int(self._header[CLOCK_POS])
+        return self._header[CLOCK_US] / 1e6 - (clock_pos - pos) / self.samplerate
+
+    def _take(self, frames: int):
+        start = self.read_pos
+        view = self.ring.view(start, frames, int(self._header[CHANNELS]))
+        chunk = self._build_chunk([view], self._frame_time(start))
+        # The WAVs are copies; if the writer lapped us meanwhile they may be torn
+        header = self.ring.snapshot()
+        if header is None or int(header[WRITE_POS]) - start > self.ring.capacity:
+            self.dropped_frames += frames
+            chunk = None
+        self.read_pos = start + frames
+        return chunk
+
+    def get_next_chunk(self):
+        """
+        Blocking (worker thread): wait until a full chunk is in the ring and
+        return it like ChunkRecorder.get_next_chunk(). On stop it returns
+        None and leaves the partial chunk for flush().
+        """
+        while self.running:
+            frames_needed = int(self.samplerate * self.chunk_seconds)
+            available = self._available()
+            if available >= frames_needed:
+                return self._take(frames_needed)
+            self._check_child()
+            # Sleep about as long as the rest of the chunk needs
+            time.sleep(min(0.2, max(0.01, (frames_needed - available) / self.samplerate)))
+        return None
+
+    def flush(self):
+        """Non-blocking: everything still in the ring, in chunk_seconds pieces."""
+        frames_needed = int(self.samplerate * self.chunk_seconds)
+        chunks = []
+        while True:
+            available = self._available()
+            if not available:
+                break
+            chunks.append(self._take(min(available, frames_needed)))
+        return [c for c in chunks if c]
@@ -2,40 +2,23 @@
 import os
 import subprocess
 import sys
+import logging
 from pathlib import Path
 
-def kill_other_launchers():
-    """
-    Kill all EchoMindLauncher processes except the current one.
-    """
-    try:
-        current_pid = os.getpid()
+from instance import InstanceLock, launcher_logging
 
-        # Get all PIDs with the name "EchoMindLauncher"
-        result = subprocess.run(
-            ["pgrep", "-f", "EchoMindLauncher"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if result.stdout:
-            pids = [int(pid) for pid in result.stdout.strip().split("\n")]
-
-            for pid in pids:
-                if pid != current_pid:  # Do NOT kill the currently running launcher
-                    try:
-                        os.kill(pid, 9)
-                    except Exception:
-                        pass
-
-    except Exception:
-        pass
+logger = logging.getLogger("EchoMind")
 
 
 def main():
-    # First: Kill all other EchoMindLauncher processes
-    kill_other_launchers()
+    launcher_logging()
+
+    # If EchoMind is already up, leave it alone; it holds the "ui" lock
+    # for as long as it runs (released by the OS however it exits)
+    running = InstanceLock("ui").holder()
+    if running is not None:
+        logger.info("EchoMind already running (pid %s); not starting another", running)
+        os._exit(0)
 
     # Path to *.app/Contents/MacOS/
     macos_dir = Path(sys.argv[0]).resolve().parent
@@ -56,7 +39,7 @@ def main():
         start_new_session=True,
     )
 
-    # Exit launcher immediately
+    # Exit launcher immediately; EchoMind logs its own startup time
     os._exit(0)
 
 
@@ -0,0 +1,215 @@
+import io
+import wave
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger("EchoMind")
+
+# ---------------------------------------------------
+# Gating thresholds (int16 sample units)
+#   Shared by the live transcription loop and file segmentation so both
+#   decide "is someone talking?" the same way.
+# ---------------------------------------------------
+SYSTEM_RMS_THRESHOLD = 600.0
+MIC_RMS_THRESHOLD = 570.0
+SOURCE_MARGIN = 150.0
+SILENCE_RMS_THRESHOLD = 900.0
+SILENCE_PEAK_THRESHOLD = 2500.0
+
+
+# ---------------------------------------------------
+# Audio helpers
+# ---------------------------------------------------
+def wav_to_samples(wav_bytes: bytes) -> np.ndarray:
+    """Convert WAV bytes to float64 numpy array."""
+    bio = io.BytesIO(wav_bytes)
+    with wave.open(bio, "rb") as wf:
+        frames = wf.readframes(wf.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float64)
+
+
+def samples_rms(samples: np.ndarray) -> float:
+    if len(samples) == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(samples ** 2)))
+
+
+def calculate_rms(wav_bytes: bytes) -> float:
+    return samples_rms(wav_to_samples(wav_bytes))
+
+
+def samples_are_silence(
+    samples: np.ndarray,
+    rms_threshold: float = SILENCE_RMS_THRESHOLD,
+    peak_threshold: float = SILENCE_PEAK_THRESHOLD,
+) -> bool:
+    if len(samples) == 0:
+        return True
+
+    rms = samples_rms(samples)
+    peak = float(np.max(np.abs(samples)))
+    return (rms < rms_threshold and peak < peak_threshold)
+
+
+def is_silence(
+    wav_bytes: bytes,
+    rms_threshold: float = SILENCE_RMS_THRESHOLD,
+    peak_threshold: float = SILENCE_PEAK_THRESHOLD,
+) -> bool:
+    """
+    Return True if this chunk is essentially silence/background noise.
+    Thresholds are intentionally conservative to avoid random junk.
+    """
+    try:
+        return samples_are_silence(
+            wav_to_samples(wav_bytes), rms_threshold, peak_threshold
+        )
+    except Exception as e:
+        logger.error(f"Silence detection error: {e}")
+        return True
+
+
+# ---------------------------------------------------
+# Source gating
+# ---------------------------------------------------
+def select_active_sources(
+    sys_bytes: bytes | None,
+    mic_bytes: bytes | None,
+    system_threshold: float = SYSTEM_RMS_THRESHOLD,
+    mic_threshold: float = MIC_RMS_THRESHOLD,
+    margin: float = SOURCE_MARGIN,
+) -> list[tuple[str, bytes]]:
+    """
+    Decide which source(s) of a captured chunk are worth transcribing.
+
+    When both system audio and mic are present, the clearly louder one
+    wins; otherwise system audio is preferred if it is loud enough.
+    Returns a list of (source, wav_bytes), empty if everything is quiet.
+    """
+    sys_rms = calculate_rms(sys_bytes) if sys_bytes else 0.0
+    mic_rms = calculate_rms(mic_bytes) if mic_bytes else 0.0
+
+    if sys_bytes and mic_bytes:
+        if sys_rms >= mic_rms + margin and sys_rms > system_threshold:
+            return [("system", sys_bytes)]
+        if mic_rms >= sys_rms + margin and mic_rms > mic_threshold:
+            return [("mic", mic_bytes)]
+        if sys_rms > system_threshold:
+            return [("system", sys_bytes)]
+        # both too quiet
+        return []
+
+    if sys_bytes:
+        return [("system", sys_bytes)] if sys_rms > system_threshold else []
+
+    if mic_bytes:
+        return [("mic", mic_bytes)] if mic_rms > mic_threshold else []
+
+    return []
+
+
+def samples_are_voiced(
+    samples: np.ndarray,
+    rms_threshold: float = SYSTEM_RMS_THRESHOLD,
+    silence_rms: float = SILENCE_RMS_THRESHOLD,
+    silence_peak: float = SILENCE_PEAK_THRESHOLD,
+) -> bool:
+    """Single-source version of the live gate: loud enough and not silence."""
+    return (
+        samples_rms(samples) > rms_threshold
+        and not samples_are_silence(samples, silence_rms, silence_peak)
+    )
+
+
+# ---------------------------------------------------
+# File segmentation
+# ---------------------------------------------------
+@dataclass
+class Segment:
+    index: int
+    start_frame: int
+    end_frame: int
+    samplerate: int
+
+    @property
+    def start(self) -> float:
+        return self.start_frame / self.samplerate
+
+    @property
+    def end(self) -> float:
+        return self.end_frame / self.samplerate
+
+
+def split_on_silence(
+    wav_path,
+    window_seconds: float = 2.0,
+    max_segment_seconds: float = 30.0,
+    rms_threshold: float = SYSTEM_RMS_THRESHOLD,
+    silence_rms: float = SILENCE_RMS_THRESHOLD,
+    silence_peak: float = SILENCE_PEAK_THRESHOLD,
+) -> list[Segment]:
+    """
+    Scan a 16-bit WAV file window by window (never loading it whole) and
+    return the voiced spans, applying the same gate as the live loop to
+    each window. Consecutive voiced windows are merged into one segment
+    up to max_segment_seconds; a silent window closes the segment.
+    """
+    segments: list[Segment] = []
+
+    with wave.open(str(wav_path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError("Only 16-bit PCM WAV files are supported")
+
+        samplerate = wf.getframerate()
+        window_frames = max(1, int(samplerate * window_seconds))
+        max_frames = max(window_frames, int(samplerate * max_segment_seconds))
+
+        position = 0
+        seg_start = None
+
+        def close(end_frame):
+            segments.append(Segment(len(segments), seg_start, end_frame, samplerate))
+
+        while True:
+            raw = wf.readframes(window_frames)
+            if not raw:
+                break
+
+            samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
+            n_frames = len(raw) // (2 * wf.getnchannels())
+            voiced = samples_are_voiced(samples, rms_threshold, silence_rms, silence_peak)
+
+            if voiced:
+                if seg_start is None:
+                    seg_start = position
+                elif position + n_frames - seg_start > max_frames:
+                    close(position)
+                    seg_start = position
+            elif seg_start is not None:
+                close(position)
+                seg_start = None
+
+            position += n_frames
+
+        if seg_start is not None:
+            close(position)
+
+    return segments
+
+
+def read_wav_span(wav_path, start_frame: int, end_frame: int) -> bytes:
+    """Return frames [start_frame, end_frame) of a WAV file as WAV bytes."""
+    with wave.open(str(wav_path), "rb") as src:
+        src.setpos(start_frame)
+        frames = src.readframes(end_frame - start_frame)
+        params = src.getparams()
+
+    bio = io.BytesIO()
+    with wave.open(bio, "wb") as dst:
+        dst.setnchannels(params.nchannels)
+        dst.setsampwidth(params.sampwidth)
+        dst.setframerate(params.framerate)
+        dst.writeframes(frames)
+    return bio.getvalue()
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TranscriptHistory:
+    """
+    Final transcript lines of one session, in capture order, so clients
+    can drop old lines and page them back in later.
+
+    Each line gets an increasing `seq`. A two-pass revision takes the seq
+    of the first draft it replaces, and the other drafts disappear, so
+    paging always returns what the client would have on screen. Only
+    the newest `max_lines` lines are kept.
+    """
+
+    def __init__(self, max_lines: int = 50000) -> None:
+        self.max_lines = max_lines
+        # segment_id -> {"seq", "segment_id", "text", "source", "timestamp"}
+        self._lines: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def add(self, message: Dict[str, Any]) -> int:
+        with self._lock:
+            self._seq += 1
+            self._lines[message["segment_id"]] = {
+                "seq": self._seq,
+                "segment_id": message["segment_id"],
+                "text": message["text"],
+                "source": message.get("source"),
+                "timestamp": message.get("timestamp"),
+            }
+            while len(self._lines) > self.max_lines:
+                self._lines.popitem(last=False)
+            return self._seq
+
+    def revise(self, message: Dict[str, Any]) -> Optional[int]:
+        """
+        Apply a revision; returns its seq, or None if its drafts are gone.
+        The revision keeps the first surviving draft's line (the service
+        reuses that draft's segment_id for it).
+        """
+        with self._lock:
+            first = None
+            for segment_id in message.get("replaces", []):
+                if first is None:
+                    first = self._lines.get(segment_id)
+                else:
+                    self._lines.pop(segment_id, None)
+            if first is None:
+                return None
+            first["text"] = message["text"]
+            return first["seq"]
+
+    def page(
+        self,
+        before: Optional[int] = None,
+        limit: int = 200,
+        source: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Up to `limit` lines older than seq `before` (newest page if None), oldest first."""
+        with self._lock:
+            lines = []
+            for line in reversed(self._lines.values()):
+                if before is not None and line["seq"] >= before:
+                    continue
+                if source is not None and line["source"] != source:
+                    continue
+                lines.append(dict(line))
+                if len(lines) > limit:
+                    break
+
+        has_more = len(lines) > limit
+        lines = lines[:limit]
+        lines.reverse()
+        return {"lines": lines, "has_more": has_more}
@@ -0,0 +1,129 @@
+import os
+import json
+import time
+import fcntl
+import logging
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("EchoMind")
+
+CONFIG_DIR = Path.home() / ".echomind"
+CONFIG_PATH = CONFIG_DIR / "config.json"
+LOGS_DIR = CONFIG_DIR / "logs"
+
+
+# -------------------------------------------------
+# Single instance
+# -------------------------------------------------
+class InstanceLock:
+    """
+    One running instance per role ("service", "ui"), via an flock'd pid
+    file in ~/.echomind. The OS drops the lock when the holder exits,
+    however it exits, so a stale file never blocks the next start and
+    nothing ever has to be killed.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.path = CONFIG_DIR / f"{name}.lock"
+        self._fd: Optional[int] = None
+
+    def _open(self) -> int:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def acquire(self) -> bool:
+        """Take the lock and record our pid; False if another process holds it."""
+        if self._fd is not None:
+            return True
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def holder(self) -> Optional[int]:
+        """Pid of the process holding the lock, or None if it's free."""
+        if self._fd is not None:
+            return os.getpid()
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return None
+        except OSError:
+            try:
+                return int(os.read(fd, 32).decode().strip() or 0) or -1
+            except ValueError:
+                return -1  # held, but the pid isn't written yet
+        finally:
+            os.close(fd)
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# -------------------------------------------------
+# Readiness
+# -------------------------------------------------
+def control_url() -> str:
+    """Control API base URL from the shared config, without importing the service."""
+    port = 8766
+    try:
+        port = json.loads(CONFIG_PATH.read_text()).get("control_port", port)
+    except (OSError, ValueError):
+        pass
+    return f"http://127.0.0.1:{port}"
+
+
+def control_socket_path(cfg: dict) -> Optional[Path]:
+    """
+    Unix socket the service also listens on (`control_socket` in the
+    config): true for ~/.echomind/echomind.sock, or a path. Off by default.
+    """
+    value = cfg.get("control_socket")
+    if not value:
+        return None
+    if value is True:
+        return CONFIG_DIR / "echomind.sock"
+    return Path(value).expanduser()
+
+
+# Loopback only; never route the handshake through an HTTP proxy
+_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def wait_ready(url: str, timeout: float = 15.0, interval: float = 0.05) -> Optional[float]:
+    """
+    Poll `url`/status until the backend answers. Returns the seconds it
+    took, or None if it didn't come up within `timeout`.
+    """
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        try:
+            with _opener.open(f"{url}/status", timeout=1.0) as response:
+                if response.status == 200:
+                    return time.monotonic() - started
+        except (OSError, ValueError):
+            pass
+        time.sleep(interval)
+    return None
+
+
+def launcher_logging() -> None:
+    """Launchers log to ~/.echomind/logs/launcher.log in the service's format."""
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=str(LOGS_DIR / "launcher.log"),
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
@@ -9,36 +9,53 @@ def run():
     Import everything lazily inside this function so that
     any import errors are also caught and logged.
     """
-    import uvicorn
-    from echomind_app.service import app, config
+    launched = time.monotonic()
+
+    from echomind_app.instance import InstanceLock, wait_ready
+
+    # One app at a time: a second launch just exits, it never kills anything
+    service_lock, ui_lock = InstanceLock("service"), InstanceLock("ui")
+    if not service_lock.acquire():
+        print(f"EchoMind is already running (pid {service_lock.holder()})")
+        return
+    if not ui_lock.acquire():
+        print(f"EchoMind is already running (pid {ui_lock.holder()})")
+        service_lock.release()
+        return
+
+    from echomind_app.service import config, logger, run_server
     from echomind_app.ui import TranscriptionUI
 
     def run_backend():
         """
-        Run the FastAPI/uvicorn backend in a background thread.
+        Run the FastAPI/uvicorn backend in a background thread, on the
+        control port and (if configured) the control socket.
         """
-        port = config.get("control_port", 8766)
-        uvicorn.run(
-            app,
-            host="127.0.0.1",
-            port=port,
-            log_level="info",
-            reload=False,
-        )
+        run_server(config)
 
     # Start backend server in background thread
     backend_thread = threading.Thread(target=run_backend, daemon=True)
     backend_thread.start()
 
-    # Give server a moment to start
-    time.sleep(2)
+    # Open the UI as soon as the backend answers on the control port
+    ready = wait_ready(f"http://127.0.0.1:{config.get('control_port', 8766)}")
+    if ready is None:
+        logger.warning("Backend not ready after %.1fs; opening the UI anyway", time.monotonic() - launched)
+    else:
+        logger.info("Backend ready %.2fs after launch", time.monotonic() - launched)
 
     # Start Tkinter UI in main thread
     ui = TranscriptionUI()
+    logger.info("UI window up %.2fs after launch", time.monotonic() - launched)
     ui.run()
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Frozen builds: lets the capture child (capture_process) start
+    multiprocessing.freeze_support()
+
     # Any crash inside the .app (especially when double-clicked)
     # will be written here:
     error_log = Path.home() / ".echomind" / "launcher_error.log"
@@ -0,0 +1,178 @@
+import io
+import wave
+import logging
+import threading
+from typing import Any, Dict, Optional, Protocol, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------
+# Stages
+#   Each stage takes float32 samples shaped (frames, channels) in int16
+#   units and returns a new array; the chain decodes and encodes the WAV
+#   only once around them.
+# -------------------------------------------------
+class NormalizerStage(Protocol):
+    def __call__(self, samples: np.ndarray, samplerate: int) -> np.ndarray: ...
+
+
+class RemoveDC:
+    """Subtract each channel's mean (DC offset from cheap mics/interfaces)."""
+
+    def __call__(self, samples: np.ndarray, samplerate: int) -> np.ndarray:
+        if not len(samples):
+            return samples
+        return samples - samples.mean(axis=0, keepdims=True)
+
+
+class NormalizeGain:
+    """
+    Scale towards `target_rms`, limited so the peak stays under
+    `max_peak` and the gain never exceeds `max_gain` (so near-silence
+    isn't blown up into loud noise).
+    """
+
+    def __init__(self, target_rms: float = 3000.0, max_peak: float = 30000.0, max_gain: float = 10.0) -> None:
+        self.target_rms = target_rms
+        self.max_peak = max_peak
+        self.max_gain = max_gain
+
+    def __call__(self, samples: np.ndarray, samplerate: int) -> np.ndarray:
+        if not len(samples):
+            return samples
+        rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+        peak = float(np.max(np.abs(samples)))
+        if rms <= 0 or peak <= 0:
+            return samples
+
+        gain = min(self.target_rms / rms, self.max_peak / peak, self.max_gain)
+        return samples * np.float32(gain)
+
+
+class TrimSilence:
+    """
+    Drop leading and trailing frames whose RMS (loudest channel) is under
+    `threshold`, keeping `pad_ms` of context on each side. Frame RMS is
+    computed for the whole clip at once by reshaping into frame_ms blocks.
+    A clip that is silent throughout is returned unchanged; gating
+    decides whether it gets sent at all.
+    """
+
+    def __init__(self, threshold: float = 500.0, frame_ms: float = 20.0, pad_ms: float = 150.0) -> None:
+        self.threshold = threshold
+        self.frame_ms = frame_ms
+        self.pad_ms = pad_ms
+
+    def __call__(self, samples: np.ndarray, samplerate: int) -> np.ndarray:
+        frame_len = max(1, int(samplerate * self.frame_ms / 1000.0))
+        n_frames = len(samples) // frame_len
+        if n_frames == 0:
+            return samples
+
+        blocks = samples[: n_frames * frame_len].reshape(n_frames, frame_len, -1)
+        frame_rms = np.sqrt(np.mean(np.square(blocks, dtype=np.float64), axis=1)).max(axis=1)
+        voiced = np.flatnonzero(frame_rms >= self.threshold)
+        if not len(voiced):
+            return samples
+
+        pad = int(samplerate * self.pad_ms / 1000.0)
+        start = max(0, voiced[0] * frame_len - pad)
+        end = min(len(samples), (voiced[-1] + 1) * frame_len + pad)
+        if voiced[-1] == n_frames - 1:
+            # Keep the partial frame at the end too
+            end = len(samples)
+        return samples[start:end]
+
+
+# -------------------------------------------------
+# Chain
+# -------------------------------------------------
+class NormalizerChain:
+    """
+    An AudioNormalizer (see transcriber.py) built from stages, applied
+    in order. Only 16-bit PCM is processed; anything else passes through
+    untouched. Keeps running totals of audio seconds in and out, so the
+    effect of trimming on billed audio is visible in the service stats.
+    """
+
+    def __init__(self, stages: Sequence[NormalizerStage]) -> None:
+        self.stages = list(stages)
+        self.counters = {
+            "chunks": 0,
+            "seconds_in": 0.0,
+            "seconds_out": 0.0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+        }
+        self._lock = threading.Lock()
+
+    def __call__(self, wav_bytes: bytes) -> bytes:
+        try:
+            with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+                params = wf.getparams()
+                frames = wf.readframes(wf.getnframes())
+        except Exception as exc:
+            logger.debug("Normalizer skipped unreadable WAV: %s", exc)
+            return wav_bytes
+        if params.sampwidth != 2 or not frames:
+            return wav_bytes
+
+        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+        samples = samples[: len(samples) - len(samples) % params.nchannels]
+        samples = samples.reshape(-1, params.nchannels)
+        n_in = len(samples)
+
+        for stage in self.stages:
+            samples = stage(samples, params.framerate)
+
+        out = np.clip(np.rint(samples), -32768, 32767).astype(np.int16)
+        bio = io.BytesIO()
+        with wave.open(bio, "wb") as dst:
+            dst.setnchannels(params.nchannels)
+            dst.setsampwidth(2)
+            dst.setframerate(params.framerate)
+            dst.writeframes(out.tobytes())
+        result = bio.getvalue()
+
+        with self._lock:
+            self.counters["chunks"] += 1
+            self.counters["seconds_in"] += n_in / params.framerate
+            self.counters["seconds_out"] += len(out) / params.framerate
+            self.counters["bytes_in"] += len(wav_bytes)
+            self.counters["bytes_out"] += len(result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        seconds_in = counters["seconds_in"]
+        return {
+            **counters,
+            "seconds_in": round(seconds_in, 2),
+            "seconds_out": round(counters["seconds_out"], 2),
+            "trimmed_ratio": (
+                round(1.0 - counters["seconds_out"] / seconds_in, 3) if seconds_in else None
+            ),
+        }
+
+
+def build_chain(
+    remove_dc: bool = True,
+    target_rms: Optional[float] = 3000.0,
+    max_gain: float = 10.0,
+    trim_threshold: Optional[float] = 500.0,
+    trim_pad_ms: float = 150.0,
+) -> NormalizerChain:
+    """The default chain: DC removal, silence trimming, then gain."""
+    stages: list[NormalizerStage] = []
+    if remove_dc:
+        stages.append(RemoveDC())
+    if trim_threshold:
+        # Trim before gain so the threshold is in capture-level units
+        stages.append(TrimSilence(threshold=trim_threshold, pad_ms=trim_pad_ms))
+    if target_rms:
+        stages.append(NormalizeGain(target_rms=target_rms, max_gain=max_gain))
+    return NormalizerChain(stages)
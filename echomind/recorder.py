@@ -1,6 +1,8 @@
 import sounddevice as sd
 import numpy as np
 import queue
+import threading
+import time
 import wave
 import io
 
@@ -38,61 +40,168 @@ class ChunkRecorder:
         self.q = queue.Queue()
         self.running = False
         self.stream = None
-
+        # Bumped per opened stream; blocks are tagged with it so a chunk
+        # never mixes the old and new device during a switch
+        self._generation = 0
+        self._read_generation = 0
+        # start/stop/set_device may come from different executor threads
+        self._stream_lock = threading.RLock()
+
+        # Health stats, updated from the audio callback
+        self.levels = {"system": 0.0, "mic": 0.0}
+        self._level_at = {"system": 0.0, "mic": 0.0}
+        self.overflows = 0
+        self._block_frames = 0
+
+        self.device, self.channels = self._resolve_device(device_index)
+
+    def _resolve_device(self, device_index):
         # Choose device
-        self.device = device_index
-        if self.device is None:
-            self.device = sd.default.device[0]  # default input
-
-        info = sd.query_devices(self.device)
-        self.channels = info["max_input_channels"]
-        print(f"Using device index {self.device} ({info['name']}) with {self.channels} channels")
-        #messagebox.showinfo("Recorder !!", f"Using device index {self.device} ({info['name']}) with {self.channels} channels")
+        device = device_index
+        if device is None:
+            device = sd.default.device[0]  # default input
+
+        info = sd.query_devices(device)
+        channels = info["max_input_channels"]
+        print(f"Using device index {device} ({info['name']}) with {channels} channels")
+        #messagebox.showinfo("Recorder !!", f"Using device index {device} ({info['name']}) with {channels} channels")
         
 
-        if self.channels < 2 and self.capture_system_audio:
+        if channels < 2 and self.capture_system_audio:
             print("WARNING: Less than 2 input channels; system audio capture may not work as expected.")
             
-        if self.channels < 3 and self.capture_microphone:
+        if channels < 3 and self.capture_microphone:
             print("WARNING: Less than 3 input channels; mic capture may not work as expected.")
-            
+
+        return device, channels
 
     # -------------------------------------------------
     # sounddevice callback
     # -------------------------------------------------
-    def _callback(self, indata, frames, time_info, status):
+    def _callback(self, indata, frames, time_info, status, generation=0):
         if status:
             print("Recorder status:", status)
-        # Push raw frames into queue
-        self.q.put(indata.copy())
+            if status.input_overflow:
+                self.overflows += 1
+        # Push raw frames into queue, with their stream and capture time
+        self.q.put((generation, indata.copy(), self._block_time(time_info, frames)))
+        self._block_frames = frames
+        self._update_levels(indata)
+
+    def _block_time(self, time_info, frames):
+        """
+        Epoch time of the block's first sample. PortAudio stamps the ADC
+        time on the stream clock; its distance from the stream's "now" is
+        how long ago that was. Some host APIs report 0 there, in which case
+        assume the block has just been filled.
+        """
+        now = time.time()
+        try:
+            age = time_info.currentTime - time_info.inputBufferAdcTime
+        except AttributeError:
+            age = 0.0
+        if not 0.0 < age < 1.0:
+            age = frames / self.samplerate
+        return now - age
+
+    def _update_levels(self, block):
+        """Peak-hold (~0.3 s) RMS per source, in int16 units like the gates."""
+        now = time.monotonic()
+        for source, cols in (("system", slice(0, 2)), ("mic", slice(2, 3))):
+            if block.shape[1] <= cols.start:
+                continue
+            samples = block[:, cols].astype(np.float32)
+            rms = float(np.sqrt(np.mean(samples * samples)))
+            if rms >= self.levels[source] or now - self._level_at[source] > 0.3:
+                self.levels[source] = rms
+                self._level_at[source] = now
+
+    def buffer_seconds(self) -> float:
+        """Approximate audio waiting in the queue for get_next_chunk()."""
+        return self.q.qsize() * self._block_frames / self.samplerate
 
     # -------------------------------------------------
     # Start/stop
     # -------------------------------------------------
-    def start(self):
-        if self.running:
-            return
-        self.running = True
-
-        self.stream = sd.InputStream(
+    def _open_stream(self):
+        self._generation += 1
+        generation = self._generation
+        stream = sd.InputStream(
             samplerate=self.samplerate,
             channels=self.channels,
             dtype=self.dtype,
-            callback=self._callback,
+            callback=lambda *args: self._callback(*args, generation),
             device=self.device,
         )
-        self.stream.start()
-        print("Recorder started.")
+        stream.start()
+        return stream
+
+    def start(self):
+        with self._stream_lock:
+            if self.running:
+                return
+            self.running = True
+
+            # Drop stale audio left over from a stop without flush()
+            while not self.q.empty():
+                try:
+                    self.q.get_nowait()
+                except queue.Empty:
+                    break
+
+            self.stream = self._open_stream()
+            print("Recorder started.")
 
     def stop(self):
-        if not self.running:
-            return
-        if self.stream is not None:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
-        self.running = False
-        print("Recorder stopped.")
+        with self._stream_lock:
+            if not self.running:
+                return
+            if self.stream is not None:
+                self.stream.stop()
+                self.stream.close()
+                self.stream = None
+            self.running = False
+            print("Recorder stopped.")
+
+    def close(self):
+        """Release the device for good; ProcessRecorder also ends its child."""
+        self.stop()
+
+    def set_device(self, device_index):
+        """
+        Switch to another input device. While running, the new stream is
+        opened before the old one is closed so capture never pauses; the
+        old stream's blocks are dropped once the new one delivers.
+        Blocking (queries devices, opens a stream): call it off the loop.
+        """
+        with self._stream_lock:
+            device, channels = self._resolve_device(device_index)
+            if (device, channels) == (self.device, self.channels):
+                return
+
+            self.device, self.channels = device, channels
+            if not self.running:
+                return
+
+            old_stream = self.stream
+            self.stream = self._open_stream()
+            if old_stream is not None:
+                old_stream.stop()
+                old_stream.close()
+            print(f"Recorder switched to device {device}.")
+
+    def _accept(self, generation, frames) -> bool:
+        """
+        Whether a queued block belongs in the chunk being built. A block
+        from a newer stream restarts the chunk (in place, via `frames`);
+        one from an older stream is stale and dropped.
+        """
+        if generation < self._read_generation:
+            return False
+        if generation > self._read_generation:
+            self._read_generation = generation
+            frames.clear()
+        return True
 
     # -------------------------------------------------
     # Chunk retrieval (blocking, used in worker thread)
@@ -105,8 +214,10 @@ class ChunkRecorder:
           {
             "system": <wav_bytes>  # if capture_system_audio and available
             "mic":    <wav_bytes>  # if capture_microphone and available
+            "captured_at": <epoch seconds of the chunk's first sample>
           }
 
+        If the recorder is stopped mid-chunk, the partial chunk is returned.
         Returns None if no frames could be collected (e.g. on shutdown).
         """
         if not self.running:
@@ -115,25 +226,68 @@ class ChunkRecorder:
         frames_needed = int(self.samplerate * self.chunk_seconds)
         frames = []
         collected = 0
+        captured_at = None
 
         # We'll keep trying until we collect enough frames or recorder stops
         while collected < frames_needed and self.running:
             try:
                 # Short timeout so thread can notice stop requests
-                data = self.q.get(timeout=0.2)
+                generation, data, block_time = self.q.get(timeout=0.2)
             except queue.Empty:
                 if not self.running:
-                    return None
+                    # Stopped mid-chunk: hand back what we have (if any)
+                    break
                 # No new audio yet; keep waiting until chunk is filled
                 continue
 
+            if not self._accept(generation, frames):
+                continue
+            if not frames:
+                collected = 0
+                captured_at = block_time
             frames.append(data)
             collected += data.shape[0]
 
+        return self._build_chunk(frames, captured_at)
+
+    def flush(self):
+        """
+        Non-blocking: drain whatever audio is still queued (typically
+        after stop()) and return it as a list of chunk dicts, each at most
+        chunk_seconds long. The last one may be partial.
+        """
+        frames_needed = int(self.samplerate * self.chunk_seconds)
+        chunks = []
+        frames = []
+        collected = 0
+        captured_at = None
+
+        while True:
+            try:
+                generation, data, block_time = self.q.get_nowait()
+            except queue.Empty:
+                break
+
+            if not self._accept(generation, frames):
+                continue
+            if not frames:
+                collected = 0
+                captured_at = block_time
+            frames.append(data)
+            collected += data.shape[0]
+            if collected >= frames_needed:
+                chunks.append(self._build_chunk(frames, captured_at))
+                frames, collected = [], 0
+
+        chunks.append(self._build_chunk(frames, captured_at))
+        return [c for c in chunks if c]
+
+    def _build_chunk(self, frames, captured_at=None):
         if not frames:
             return None
 
-        audio = np.concatenate(frames, axis=0)  # shape: (samples, channels)
+        # shape: (samples, channels)
+        audio = frames[0] if len(frames) == 1 else np.concatenate(frames, axis=0)
         chunk_dict = {}
 
         # System audio (BlackHole) = channels 0 & 1
@@ -147,6 +301,7 @@ class ChunkRecorder:
             chunk_dict["mic"] = self.to_wav(mic_audio)
 
         if chunk_dict:
+            chunk_dict["captured_at"] = captured_at
             return chunk_dict
 
         return None
@@ -163,7 +318,8 @@ class ChunkRecorder:
             wf.setnchannels(samples.shape[1])
             wf.setsampwidth(np.dtype(self.dtype).itemsize)
             wf.setframerate(self.samplerate)
-            wf.writeframes(samples.astype(self.dtype).tobytes())
+            # tobytes() makes the one copy needed (column slices aren't contiguous)
+            wf.writeframes(samples.astype(self.dtype, copy=False).tobytes())
         return bio.getvalue()
 
 
@@ -2,21 +2,25 @@ import asyncio
 import json
 from pathlib import Path
 import datetime
-import io
+import shutil
+import time
 import wave
 import logging 
 from logging.handlers import RotatingFileHandler
 import re
+import socket
+import threading
+import uuid
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket
-import uvicorn
+from fastapi import Body, Depends, FastAPI, File, HTTPException, UploadFile, WebSocket
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-import numpy as np
-
-
-from recorder import ChunkRecorder
-from transcriber import Transcriber
-#from transcriber.transcriber import Transcriber
+# numpy-backed gating, uvicorn and the API client are imported where
+# they're first used, so /status answers before any of them load
+from history import TranscriptHistory
+from usage import wav_duration
 
 # ---------------------------------------------------
 # Config & paths  (always use HOME, not cwd)
@@ -24,6 +28,8 @@ from transcriber import Transcriber
 CONFIG_DIR = Path.home() / ".echomind"
 CONFIG_PATH = CONFIG_DIR / "config.json"
 LOGS_DIR = CONFIG_DIR / "logs"
+UPLOADS_DIR = CONFIG_DIR / "uploads"
+CACHE_DIR = CONFIG_DIR / "cache"
 TRANSCRIPT_LOGS_DIR = CONFIG_DIR / ".transcript.json"
 
 
@@ -93,65 +99,314 @@ logger.addHandler(handler)
 logger.info("EchoMind service starting...")
 
 # ---------------------------------------------------
-# FastAPI app & globals
+# Component providers
+#   The recorder and transcriber are built lazily (on first /start, or
+#   in the background once the app is up) so importing this module never
+#   touches audio hardware or the network. Swap the factories with
+#   set_factories() to inject fakes.
 # ---------------------------------------------------
-app = FastAPI()
+def default_recorder_factory(cfg: dict):
+    options = dict(
+        chunk_seconds=cfg.get("chunk_duration", 1),
+        device_index=cfg.get("input_device_index"),
+        capture_system_audio=cfg.get("capture_system_audio", True),
+        capture_microphone=cfg.get("capture_microphone", True),
+    )
 
-recorder = ChunkRecorder(
-    chunk_seconds=config.get("chunk_duration", 1),
-    device_index=config.get("input_device_index"),
-    capture_system_audio=config.get("capture_system_audio", True),
-    capture_microphone=config.get("capture_microphone", True),
-)
+    # Audio callback in its own process, away from this one's GIL.
+    # Read when the recorder is built; changing it needs a service restart.
+    if cfg.get("capture_process", False):
+        from capture_process import ProcessRecorder
 
-transcriber = Transcriber(
-    api_key=config.get("openai_api_key") or None,
-    logs_path=TRANSCRIPT_LOGS_DIR,
-)
+        return ProcessRecorder(
+            **options,
+            ring_seconds=cfg.get("capture_ring_seconds", 30.0),
+            stall_seconds=cfg.get("capture_stall_seconds", 3.0),
+        )
 
-clients = set()
-running = False
-transcription_task: asyncio.Task | None = None
+    from recorder import ChunkRecorder
 
+    return ChunkRecorder(**options)
 
-# ---------------------------------------------------
-# Audio helpers
-# ---------------------------------------------------
-def wav_to_samples(wav_bytes: bytes) -> np.ndarray:
-    """Convert WAV bytes to float64 numpy array."""
-    bio = io.BytesIO(wav_bytes)
-    with wave.open(bio, "rb") as wf:
-        frames = wf.readframes(wf.getnframes())
-    return np.frombuffer(frames, dtype=np.int16).astype(np.float64)
 
+SCHEDULER_KEYS = {
+    "max_chunk_age",
+    "retry_max_attempts",
+    "rate_limit_rpm",
+    "rate_limit_burst",
+    "breaker_failure_threshold",
+    "breaker_reset_seconds",
+}
 
-def calculate_rms(wav_bytes: bytes) -> float:
-    samples = wav_to_samples(wav_bytes)
-    if len(samples) == 0:
-        return 0.0
-    return float(np.sqrt(np.mean(samples ** 2)))
 
+def scheduler_settings(cfg: dict):
+    from transcriber import SchedulerSettings
 
-def is_silence(
-    wav_bytes: bytes,
-    rms_threshold: float = 900,
-    peak_threshold: float = 2500,
-) -> bool:
+    return SchedulerSettings(
+        max_attempts=cfg.get("retry_max_attempts", 4),
+        max_chunk_age=cfg.get("max_chunk_age", 15.0),
+        requests_per_minute=cfg.get("rate_limit_rpm", 50.0),
+        burst=cfg.get("rate_limit_burst", 10),
+        breaker_failure_threshold=cfg.get("breaker_failure_threshold", 5),
+        breaker_reset_timeout=cfg.get("breaker_reset_seconds", 30.0),
+    )
+
+
+CACHE_KEYS = {
+    "cache_enabled",
+    "cache_memory_entries",
+    "cache_disk_mb",
+    "cache_fingerprint",
+    "cache_fingerprint_distance",
+}
+
+
+def build_cache(cfg: dict):
+    if not cfg.get("cache_enabled", True):
+        return None
+
+    from transcript_cache import TranscriptionCache
+
+    return TranscriptionCache(
+        CACHE_DIR,
+        max_memory_entries=cfg.get("cache_memory_entries", 512),
+        max_disk_bytes=int(cfg.get("cache_disk_mb", 50) * 1024 * 1024),
+        fingerprint=cfg.get("cache_fingerprint", False),
+        max_distance=cfg.get("cache_fingerprint_distance", 6),
+    )
+
+
+BATCH_KEYS = {
+    "batch_requests",
+    "batch_max_chunks",
+    "batch_max_wait_ms",
+    "batch_gap_ms",
+    "batch_model",
+    # The default wait is derived from it
+    "chunk_duration",
+}
+
+
+def inflight_limit(cfg: dict) -> int:
+    """Chunks a session may have in transcription; with batching, enough to fill a batch per source."""
+    default = 4
+    if cfg.get("batch_requests", False):
+        default = max(default, 2 * cfg.get("batch_max_chunks", 4))
+    return max(1, cfg.get("max_inflight_chunks", default))
+
+
+def batch_settings(cfg: dict):
     """
-    Return True if this chunk is essentially silence/background noise.
-    Thresholds are intentionally conservative to avoid random junk.
+    Request batching trades up to batch_max_wait_ms of latency for fewer
+    calls. A session produces one chunk per source every chunk_duration,
+    so the wait has to span several chunk periods for a batch to fill;
+    by default it is just long enough for batch_max_chunks of them.
     """
-    try:
-        samples = wav_to_samples(wav_bytes)
-        if len(samples) == 0:
-            return True
+    if not cfg.get("batch_requests", False):
+        return None
+
+    from transcriber import BatchSettings
+
+    max_chunks = max(1, cfg.get("batch_max_chunks", 4))
+    chunk_seconds = cfg.get("chunk_duration", 1)
+    default_wait_ms = ((max_chunks - 1) * chunk_seconds + 0.5) * 1000
+    max_wait = cfg.get("batch_max_wait_ms", default_wait_ms) / 1000.0
+    if max_chunks > 1 and max_wait <= chunk_seconds:
+        logger.warning(
+            f"batch_max_wait_ms ({max_wait * 1000:.0f}) is shorter than chunk_duration "
+            f"({chunk_seconds}s): consecutive chunks will never share a batch"
+        )
+    if inflight_limit(cfg) < max_chunks * 2:
+        logger.warning(
+            "max_inflight_chunks is below 2 x batch_max_chunks (one batch per source); "
+            "batches will go out before they fill"
+        )
+
+    return BatchSettings(
+        max_chunks=max_chunks,
+        max_wait=max_wait,
+        gap_seconds=cfg.get("batch_gap_ms", 500) / 1000.0,
+        model=cfg.get("batch_model", "whisper-1"),
+    )
+
+
+HEDGE_KEYS = {
+    "hedge_requests",
+    "hedge_percentile",
+    "hedge_min_delay_ms",
+    "hedge_max_rate",
+}
+
+
+def hedge_settings(cfg: dict):
+    """Backup requests for calls slower than the rolling hedge_percentile."""
+    if not cfg.get("hedge_requests", False):
+        return None
+
+    from transcriber import HedgeSettings
+
+    return HedgeSettings(
+        percentile=cfg.get("hedge_percentile", 0.95),
+        min_delay=cfg.get("hedge_min_delay_ms", 500) / 1000.0,
+        max_rate=cfg.get("hedge_max_rate", 0.1),
+    )
+
+
+NORMALIZER_KEYS = {
+    "normalize_audio",
+    "normalize_remove_dc",
+    "normalize_target_rms",
+    "normalize_max_gain",
+    "trim_silence_threshold",
+    "trim_silence_pad_ms",
+}
+
+
+def build_normalizer(cfg: dict):
+    """
+    DC removal, edge-silence trimming and gain, applied before upload.
+    Opt-in (normalize_audio): it changes the audio users already send.
+    """
+    if not cfg.get("normalize_audio", False):
+        return None
+
+    from normalizer import build_chain
+
+    return build_chain(
+        remove_dc=cfg.get("normalize_remove_dc", True),
+        target_rms=cfg.get("normalize_target_rms", 3000.0),
+        max_gain=cfg.get("normalize_max_gain", 10.0),
+        trim_threshold=cfg.get("trim_silence_threshold", 500.0),
+        trim_pad_ms=cfg.get("trim_silence_pad_ms", 150.0),
+    )
+
+
+BUDGET_KEYS = {
+    "budget_per_hour",
+    "budget_economy_ratio",
+    "budget_economy_model",
+    "budget_gate_factor",
+}
+
+
+def budget_settings(cfg: dict):
+    """Spend guard: cheaper model, then stricter gating, past budget_per_hour (USD)."""
+    if not cfg.get("budget_per_hour"):
+        return None
+
+    from usage import BudgetSettings
+
+    return BudgetSettings(
+        hourly_budget=float(cfg["budget_per_hour"]),
+        economy_ratio=cfg.get("budget_economy_ratio", 0.8),
+        economy_model=cfg.get("budget_economy_model", "gpt-4o-mini-transcribe"),
+        strict_gate_factor=cfg.get("budget_gate_factor", 1.5),
+    )
+
+
+def build_usage_meter(cfg: dict):
+    from usage import UsageMeter
+
+    # model_prices: {"model": USD per audio minute}, overriding the defaults
+    return UsageMeter(prices=cfg.get("model_prices"))
+
+
+# Keys that select or shape the transcription backend; changing them
+# swaps the backend in place.
+BACKEND_KEYS = {
+    "transcription_backend",
+    "http_max_connections",
+    "http_keepalive_connections",
+    "http_keepalive_expiry",
+    "request_timeout",
+    "local_model",
+    "local_compute_type",
+    "local_cpu_threads",
+    "local_batch_size",
+    "local_batch_window_ms",
+}
+
+
+def build_backend(cfg: dict):
+    from backends import create_backend
+
+    return create_backend(cfg.get("transcription_backend", "openai"), cfg)
+
+
+def default_transcriber_factory(cfg: dict):
+    from transcriber import RequestScheduler, Transcriber
+    #from transcriber.transcriber import Transcriber
+
+    return Transcriber(
+        backend=build_backend(cfg),
+        normalizer=build_normalizer(cfg),
+        logs_path=TRANSCRIPT_LOGS_DIR,
+        scheduler=RequestScheduler(scheduler_settings(cfg)),
+        cache=build_cache(cfg),
+        batching=batch_settings(cfg),
+        hedging=hedge_settings(cfg),
+        usage=build_usage_meter(cfg),
+        budget=budget_settings(cfg),
+    )
+
+
+recorder_factory = default_recorder_factory
+transcriber_factory = default_transcriber_factory
+
+# Shared by every capture session, so all sessions reuse one API client
+# (and its HTTP connection pool).
+transcriber = None
+transcriber_error: str | None = None
+transcriber_lock = threading.Lock()
+
+
+def set_factories(make_recorder=None, make_transcriber=None):
+    """Replace the recorder/transcriber factories (e.g. with fakes)."""
+    global recorder_factory, transcriber_factory
+
+    if make_recorder is not None:
+        recorder_factory = make_recorder
+    if make_transcriber is not None:
+        transcriber_factory = make_transcriber
+        reset_transcriber()
+
+
+def reset_transcriber():
+    global transcriber, transcriber_error
+    with transcriber_lock:
+        transcriber = None
+        transcriber_error = None
 
-        rms = float(np.sqrt(np.mean(samples ** 2)))
-        peak = float(np.max(np.abs(samples)))
-        return (rms < rms_threshold and peak < peak_threshold)
+
+def get_transcriber():
+    """
+    Return the shared Transcriber, building it on first use. Blocking
+    (imports the SDK, builds the client), so call it from a worker
+    thread when on the event loop.
+    """
+    global transcriber, transcriber_error
+
+    if transcriber is not None:
+        return transcriber
+
+    with transcriber_lock:
+        if transcriber is None:
+            try:
+                transcriber = transcriber_factory(config)
+                transcriber_error = None
+            except Exception as e:
+                transcriber_error = str(e)
+                logger.error(f"Transcriber unavailable: {e}")
+                raise
+    return transcriber
+
+
+def require_transcriber():
+    """FastAPI dependency: the shared Transcriber, or 503 if it can't be built."""
+    try:
+        return get_transcriber()
     except Exception as e:
-        logger.error(f"Silence detection error: {e}")
-        return True
+        raise HTTPException(status_code=503, detail=f"Transcriber unavailable: {e}")
 
 
 # ---------------------------------------------------
@@ -182,31 +437,359 @@ def looks_like_noise(text: str) -> bool:
     return False
 
 
+# ---------------------------------------------------
+# Gate settings (hot-reloadable, read per chunk)
+# ---------------------------------------------------
+#   `factor` scales the thresholds up when the usage budget is exceeded.
+def gate_settings(cfg: dict, factor: float = 1.0) -> dict:
+    from gating import MIC_RMS_THRESHOLD, SOURCE_MARGIN, SYSTEM_RMS_THRESHOLD
+
+    return {
+        "system_threshold": cfg.get("system_rms_threshold", SYSTEM_RMS_THRESHOLD) * factor,
+        "mic_threshold": cfg.get("mic_rms_threshold", MIC_RMS_THRESHOLD) * factor,
+        "margin": cfg.get("source_margin", SOURCE_MARGIN),
+    }
+
+
+def silence_settings(cfg: dict, factor: float = 1.0) -> dict:
+    from gating import SILENCE_PEAK_THRESHOLD, SILENCE_RMS_THRESHOLD
+
+    return {
+        "rms_threshold": cfg.get("silence_rms_threshold", SILENCE_RMS_THRESHOLD) * factor,
+        "peak_threshold": cfg.get("silence_peak_threshold", SILENCE_PEAK_THRESHOLD) * factor,
+    }
+
+
+# ---------------------------------------------------
+# Capture sessions
+#   Each session owns a recorder, a transcription loop and its own set of
+#   WebSocket clients. The "default" session backs the legacy
+#   /start, /stop, /restart and /ws endpoints.
+# ---------------------------------------------------
+DEFAULT_SESSION_ID = "default"
+
+# Config keys a session may override on top of the global config.
+SESSION_OVERRIDE_KEYS = {
+    "chunk_duration",
+    "input_device_index",
+    "capture_system_audio",
+    "capture_microphone",
+    "system_rms_threshold",
+    "mic_rms_threshold",
+    "source_margin",
+    "silence_rms_threshold",
+    "silence_peak_threshold",
+}
+
+
+class RevisionWindow:
+    """Consecutive voiced drafts of one source, re-transcribed together."""
+
+    def __init__(self):
+        self.segment_ids: list[str] = []
+        self.chunks: list[bytes] = []
+        self.seconds = 0.0
+        self.last_task: asyncio.Task | None = None
+
+    def add(self, segment_id: str, wav_bytes: bytes, task: asyncio.Task):
+        self.segment_ids.append(segment_id)
+        self.chunks.append(wav_bytes)
+        self.seconds += wav_duration(wav_bytes)
+        self.last_task = task
+
+
+class CaptureSession:
+    """
+    A single capture pipeline (one input device, one audience).
+
+    Sessions share the module-level Transcriber but each has its own
+    ChunkRecorder, transcription task, config overrides and WebSocket
+    clients, so several devices can be transcribed at once. The recorder
+    is only created when the session first starts.
+    """
+
+    def __init__(self, session_id: str, overrides: dict | None = None):
+        self.id = session_id
+        self.overrides = dict(overrides or {})
+        self.clients = set()
+        self.running = False
+        self.draining = False
+        self.task: asyncio.Task | None = None
+        self.created_at = datetime.datetime.utcnow().isoformat() + "Z"
+        self.recorder = None
+        self.recorder_error: str | None = None
+        # Chunks being transcribed; broadcast strictly in capture order
+        self.inflight: set[asyncio.Task] = set()
+        self.last_dispatched: asyncio.Task | None = None
+        # Two-pass mode: drafts per source awaiting a long-window revision
+        self.revisions: dict[str, RevisionWindow] = {}
+        self.revision_tasks: set[asyncio.Task] = set()
+        # Health overlay: stats-channel clients and chunk counters
+        self.stats_clients = set()
+        # dropped: chunks this session lost to the scheduler or an API error
+        self.counters = {"chunks": 0, "gated_out": 0, "dropped": 0}
+        # Final lines, for clients paging back through trimmed scrollback
+        self.history = TranscriptHistory(self.config.get("history_max_lines", 50000))
+
+    @property
+    def config(self) -> dict:
+        """Global config with this session's overrides applied."""
+        return {**config, **self.overrides}
+
+    def ensure_recorder(self):
+        """Build the recorder on first use (blocking: queries audio devices)."""
+        if self.recorder is None:
+            try:
+                self.recorder = recorder_factory(self.config)
+                self.recorder_error = None
+            except Exception as e:
+                self.recorder_error = str(e)
+                raise
+        return self.recorder
+
+    def apply_config(self, old_config: dict):
+        """
+        Push changed settings into the live recorder. Chunk length and
+        capture toggles are read on every chunk, so they apply in place;
+        only a device change touches the audio stream.
+        """
+        if self.recorder is None:
+            return
+
+        old = {**old_config, **self.overrides}
+        new = self.config
+
+        self.recorder.chunk_seconds = new.get("chunk_duration", 1)
+        self.recorder.capture_system_audio = new.get("capture_system_audio", True)
+        self.recorder.capture_microphone = new.get("capture_microphone", True)
+
+        if old.get("input_device_index") != new.get("input_device_index"):
+            # Queries devices and opens a stream; keep it off the loop
+            asyncio.get_running_loop().run_in_executor(
+                None, self.switch_device, new.get("input_device_index")
+            )
+
+    def switch_device(self, device_index):
+        try:
+            self.recorder.set_device(device_index)
+        except Exception as e:
+            logger.error(f"Session '{self.id}' failed to switch device: {e}")
+
+    async def start(self) -> dict:
+        if self.running:
+            return {"status": "already_running"}
+        if self.draining:
+            return {"status": "draining"}
+
+        loop = asyncio.get_event_loop()
+        try:
+            shared = await loop.run_in_executor(None, get_transcriber)
+            await loop.run_in_executor(None, self.ensure_recorder)
+        except Exception as e:
+            logger.error(f"Session '{self.id}' failed to start: {e}")
+            return {"status": "error", "detail": str(e)}
+
+        if self.config.get("transcriber_warmup", True):
+            # Runs while the first chunk is being captured
+            asyncio.create_task(shared.warm_up())
+
+        self.running = True
+        self.task = asyncio.create_task(transcription_loop(self))
+        logger.info(f"Session '{self.id}' started")
+        return {"status": "started"}
+
+    async def stop(self, drain: bool | None = None, timeout: float | None = None) -> dict:
+        """
+        Stop capturing. With drain (the default, see drain_on_stop), the
+        loop keeps going until the chunk in flight and any audio still
+        buffered in the recorder have been transcribed and broadcast, or
+        until `timeout` seconds (drain_timeout) pass; then it's cancelled.
+        """
+        if not self.running:
+            return {"status": "already_stopped"}
+
+        cfg = self.config
+        if drain is None:
+            drain = cfg.get("drain_on_stop", True)
+        if timeout is None:
+            timeout = cfg.get("drain_timeout", 10.0)
+
+        self.running = False
+        self.draining = bool(drain) and self.task is not None
+        if self.recorder is not None:
+            # A capture process round-trip (or restart); keep it off the loop
+            await asyncio.get_event_loop().run_in_executor(None, self.recorder.stop)
+
+        task, self.task = self.task, None
+        status = "stopped"
+        if task and self.draining:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+                status = "drained"
+            except asyncio.TimeoutError:
+                logger.warning(f"Session '{self.id}' drain timed out after {timeout}s")
+                task.cancel()
+        elif task:
+            task.cancel()
+        self.draining = False
+
+        logger.info(f"Session '{self.id}' stopped ({status})")
+        return {"status": "stopped", "drained": status == "drained"}
+
+    async def dispatch(self, source: str, wav_bytes: bytes, marks: dict | None = None):
+        """
+        Start transcribing a chunk without waiting for the result, so the
+        loop can keep reading audio (and a batching Transcriber has
+        several chunks to group). At most max_inflight_chunks run at once.
+        `marks` are the chunk's stage times so far (see LATENCY_STAGES).
+        """
+        limit = inflight_limit(self.config)
+        while len(self.inflight) >= limit:
+            await asyncio.wait(self.inflight, return_when=asyncio.FIRST_COMPLETED)
+
+        marks = {} if marks is None else marks
+        marks["dispatched"] = time.time()
+        segment_id = uuid.uuid4().hex[:12]
+        task = asyncio.create_task(
+            transcribe_and_broadcast(self, source, wav_bytes, segment_id, self.last_dispatched, marks)
+        )
+        self.inflight.add(task)
+        task.add_done_callback(self.inflight.discard)
+        self.last_dispatched = task
+
+        if self.config.get("two_pass", False):
+            self.add_draft(source, segment_id, wav_bytes, task)
+
+    # ---- two-pass revisions ----
+    def add_draft(self, source: str, segment_id: str, wav_bytes: bytes, task: asyncio.Task):
+        window = self.revisions.setdefault(source, RevisionWindow())
+        window.add(segment_id, wav_bytes, task)
+        if window.seconds >= self.config.get("revision_window_seconds", 8.0):
+            self.close_revision(source)
+
+    def close_revision(self, source: str):
+        """
+        End the source's current window (full, or the speaker paused) and
+        re-transcribe it in the background. A single draft has nothing to
+        gain from a second pass.
+        """
+        window = self.revisions.pop(source, None)
+        if window is None or len(window.segment_ids) < 2:
+            return
+        task = asyncio.create_task(revise_and_broadcast(self, source, window))
+        self.revision_tasks.add(task)
+        task.add_done_callback(self.revision_tasks.discard)
+
+    def close_revisions(self):
+        for source in list(self.revisions):
+            self.close_revision(source)
+
+    async def wait_inflight(self):
+        if self.inflight:
+            await asyncio.gather(*self.inflight, return_exceptions=True)
+        self.close_revisions()
+        if self.revision_tasks:
+            await asyncio.gather(*self.revision_tasks, return_exceptions=True)
+
+    def cancel_inflight(self):
+        for task in list(self.inflight) + list(self.revision_tasks):
+            task.cancel()
+        self.last_dispatched = None
+        self.revisions.clear()
+
+    async def broadcast(self, payload: dict):
+        disconnected = []
+        for ws in list(self.clients):
+            try:
+                await ws.send_json(payload)
+            except Exception:
+                disconnected.append(ws)
+
+        for ws in disconnected:
+            self.clients.discard(ws)
+
+    def health(self) -> dict:
+        """
+        Compact pipeline snapshot for the stats channel: where is time
+        going - capture, the queue, or the API?
+        """
+        recorder = self.recorder
+        capturing = recorder is not None and recorder.running
+        snapshot = {
+            "running": self.running,
+            "level": {
+                source: round(recorder.levels[source]) if capturing else 0
+                for source in ("system", "mic")
+            },
+            "buffer_s": round(recorder.buffer_seconds(), 2) if capturing else 0.0,
+            "overflows": recorder.overflows if recorder is not None else 0,
+            "capture_restarts": getattr(recorder, "restarts", 0),
+            "inflight": len(self.inflight),
+            **self.counters,
+            "api": None,
+        }
+        if transcriber is not None:
+            snapshot["api"] = transcriber.usage.latency(30.0)
+            snapshot["breaker"] = transcriber.scheduler.breaker.state
+        return snapshot
+
+    def describe(self) -> dict:
+        return {
+            "id": self.id,
+            "running": self.running,
+            "draining": self.draining,
+            "clients": len(self.clients),
+            "stats_clients": len(self.stats_clients),
+            "inflight_chunks": len(self.inflight),
+            "device": (
+                self.recorder.device if self.recorder is not None
+                else self.config.get("input_device_index")
+            ),
+            "recorder_error": self.recorder_error,
+            "overrides": self.overrides,
+            "created_at": self.created_at,
+        }
+
+
+sessions: dict[str, CaptureSession] = {
+    DEFAULT_SESSION_ID: CaptureSession(DEFAULT_SESSION_ID),
+}
+
+
+def get_session(session_id: str) -> CaptureSession:
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Unknown session '{session_id}'")
+    return session
+
+
 # ---------------------------------------------------
 # Main transcription loop
 #   NOTE: all blocking audio work happens in a thread via run_in_executor,
 #   so FastAPI's event loop stays responsive even when there's silence.
+#   Transcription awaits the async client directly.
+#   One loop runs per active session.
 # ---------------------------------------------------
 
-async def transcription_loop():
-    global running
-
+async def transcription_loop(session: CaptureSession):
     loop = asyncio.get_event_loop()
+    recorder = session.recorder
 
-    # Ensure recorder is fresh
+    # Ensure recorder is fresh. start/stop may wait on the capture
+    # process, so they run in a thread like get_next_chunk.
     if recorder.running:
-        recorder.stop()
+        await loop.run_in_executor(None, recorder.stop)
         await asyncio.sleep(0.2)
 
-    recorder.start()
-    logger.info("Transcription loop started")
+    await loop.run_in_executor(None, recorder.start)
+    logger.info(f"Transcription loop started (session={session.id})")
 
     try:
-        while running:
+        while session.running:
             # This call blocks in a thread, NOT the event loop
             chunk = await loop.run_in_executor(None, recorder.get_next_chunk)
 
-            if not running:
+            if not session.running and not session.draining:
                 break
 
             if not chunk:
@@ -215,160 +798,817 @@ async def transcription_loop():
                 await asyncio.sleep(0.01)
                 continue
 
-            sys_bytes = chunk.get("system")
-            mic_bytes = chunk.get("mic")
-
-            sys_rms = calculate_rms(sys_bytes) if sys_bytes else 0.0
-            mic_rms = calculate_rms(mic_bytes) if mic_bytes else 0.0
-
-            active_sources = []
-
-            if sys_bytes and mic_bytes:
-                margin = 150.0
-
-                if sys_rms >= mic_rms + margin and sys_rms > 600:
-                    active_sources = [("system", sys_bytes)]
-                elif mic_rms >= sys_rms + margin and mic_rms > 570:
-                    active_sources = [("mic", mic_bytes)]
-                else:
-                    if sys_rms > 600:
-                        active_sources = [("system", sys_bytes)]
-                    else:
-                        # both too quiet
-                        continue
-
-            elif sys_bytes:
-                if sys_rms > 600:
-                    active_sources = [("system", sys_bytes)]
-                else:
-                    continue
-
-            elif mic_bytes:
-                if mic_rms > 570:
-                    active_sources = [("mic", mic_bytes)]
-                else:
-                    continue
-            else:
-                continue
+            await process_chunk(session, chunk)
 
-            for source, wav_bytes in active_sources:
-                if is_silence(wav_bytes):
-                    continue
+        if session.draining:
+            # Audio captured before stop() but not yet picked up
+            for chunk in await loop.run_in_executor(None, recorder.flush):
+                await process_chunk(session, chunk)
+            await session.wait_inflight()
+            logger.info(f"Transcription loop drained (session={session.id})")
 
-                # Run Whisper-style transcription in a thread
-                text = await loop.run_in_executor(
-                    None, transcriber.transcribe_bytes, wav_bytes
-                )
+    except asyncio.CancelledError:
+        logger.info(f"Transcription loop cancelled (session={session.id})")
+    except Exception as e:
+        logger.error(f"Error in transcription loop (session={session.id}): {e}")
+    finally:
+        session.cancel_inflight()
+        await loop.run_in_executor(None, recorder.stop)
+        logger.info(f"Transcription loop stopped (session={session.id})")
 
-                if not text or looks_like_noise(text):
-                    continue
 
-                payload = {
-                    "text": text,
-                    "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                    "source": source,  # "mic" or "system"
-                }
+async def process_chunk(session: CaptureSession, chunk: dict):
+    """Gate a captured chunk and hand its voiced source(s) to transcription."""
+    from gating import is_silence, select_active_sources
 
-                logger.info(f"[{source.upper()}] {text}")
+    cfg = session.config
+    factor = transcriber.gate_factor() if transcriber is not None else 1.0
+    active_sources = select_active_sources(
+        chunk.get("system"), chunk.get("mic"), **gate_settings(cfg, factor)
+    )
 
-                # Broadcast to websocket clients
-                disconnected = []
-                for ws in list(clients):
-                    try:
-                        await ws.send_json(payload)
-                    except Exception:
-                        disconnected.append(ws)
+    voiced = set()
+    for source, wav_bytes in active_sources:
+        if is_silence(wav_bytes, **silence_settings(cfg, factor)):
+            continue
+        voiced.add(source)
+        marks = {"captured": chunk.get("captured_at"), "ready": time.time()}
+        await session.dispatch(source, wav_bytes, marks)
 
-                for ws in disconnected:
-                    clients.discard(ws)
+    session.counters["chunks"] += 1
+    if not voiced:
+        session.counters["gated_out"] += 1
 
-    except asyncio.CancelledError:
-        logger.info("Transcription loop cancelled")
+    # A pause ends the source's two-pass window
+    for source in set(session.revisions) - voiced:
+        session.close_revision(source)
+
+
+# ---------------------------------------------------
+# End-to-end latency
+#   Each chunk carries epoch timestamps of the stages it passes: captured
+#   (first sample, from the stream clock), ready (chunk assembled),
+#   dispatched (past the in-flight limit), normalized / sent / received
+#   (filled in by the Transcriber) and ordered (earlier chunks done).
+#   Finals report the gaps between them; the UI adds the last hop.
+# ---------------------------------------------------
+LATENCY_STAGES = (
+    ("buffer", "captured", "ready"),
+    ("dispatch", "ready", "dispatched"),
+    ("normalize", "dispatched", "normalized"),
+    ("wait", "normalized", "sent"),
+    ("api", "sent", "received"),
+    ("order", "received", "ordered"),
+)
+
+
+def stage_latency(marks: dict, now: float) -> dict:
+    """Seconds spent in each stage the chunk went through, plus the total so far."""
+    latency = {}
+    for stage, start, end in LATENCY_STAGES:
+        if marks.get(start) is not None and marks.get(end) is not None:
+            latency[stage] = round(max(0.0, marks[end] - marks[start]), 4)
+    if marks.get("captured") is not None:
+        latency["total"] = round(now - marks["captured"], 4)
+    return latency
+
+
+async def transcribe_and_broadcast(
+    session: CaptureSession,
+    source: str,
+    wav_bytes: bytes,
+    segment_id: str,
+    previous: asyncio.Task | None,
+    marks: dict | None = None,
+):
+    """
+    Transcribe one chunk and broadcast it as {"type": "final", ...}.
+
+    With stream_partials, text deltas are forwarded as they arrive as
+    {"type": "partial", ...} messages (at most one per
+    stream_partial_interval_ms) sharing the chunk's segment_id; clients
+    replace the partial with the final text in place, or drop it on a
+    {"type": "retract"} when the final text turns out to be noise.
+
+    Partials and finals carry "captured_at" (epoch seconds of the chunk's
+    first sample); finals add "latency", the per-stage breakdown.
+    """
+    cfg = session.config
+    partials_sent = False
+    last_partial = 0.0
+    min_interval = cfg.get("stream_partial_interval_ms", 100) / 1000.0
+    marks = {} if marks is None else marks
+
+    def message(kind: str, text: str) -> dict:
+        return {
+            "type": kind,
+            "segment_id": segment_id,
+            "text": text,
+            "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+            "captured_at": marks.get("captured"),
+            "source": source,  # "mic" or "system"
+            "session": session.id,
+        }
+
+    async def on_partial(text: str):
+        nonlocal partials_sent, last_partial
+        now = time.monotonic()
+        if now - last_partial < min_interval or not text.strip():
+            return
+        last_partial = now
+        partials_sent = True
+        await session.broadcast(message("partial", text.strip()))
+
+    # Async client with pooled keep-alive connections; no worker thread
+    shared = get_transcriber()
+    if cfg.get("stream_partials", False):
+        text = await shared.transcribe_stream_async(wav_bytes, on_partial, source=source, timings=marks)
+    else:
+        text = await shared.transcribe_bytes_async(wav_bytes, source=source, timings=marks)
+    if "received" not in marks:
+        # No answer (dropped, failed); the Transcriber returned "" for it
+        session.counters["dropped"] += 1
+
+    if previous is not None:
+        # Keep capture order even when a later chunk finishes first
+        await asyncio.wait([previous])
+    marks["ordered"] = time.time()
+
+    if not text or looks_like_noise(text):
+        if partials_sent:
+            await session.broadcast(message("retract", ""))
+        return
+
+    logger.info(f"[{session.id}][{source.upper()}] {text}")
+
+    final = message("final", text)
+    final["latency"] = stage_latency(marks, time.time())
+    final["seq"] = session.history.add(final)
+
+    # Broadcast to this session's websocket clients
+    await session.broadcast(final)
+
+
+async def revise_and_broadcast(session: CaptureSession, source: str, window: RevisionWindow):
+    """
+    Two-pass mode: re-transcribe a window of drafts as one long span and
+    broadcast {"type": "revision", "replaces": [segment_id, ...]} so
+    clients swap the drafts for the (more accurate) long-window text.
+    """
+    from transcriber import join_wavs
+
+    try:
+        merged, _ = join_wavs(window.chunks, gap_seconds=0.0)
     except Exception as e:
-        logger.error(f"Error in transcription loop: {e}")
-    finally:
-        recorder.stop()
-        logger.info("Transcription loop stopped")
+        logger.error(f"Could not merge drafts for revision: {e}")
+        return
+
+    text = await get_transcriber().transcribe_bytes_async(merged, source=source)
+
+    # Never overtake the drafts being replaced
+    await asyncio.wait([window.last_task])
+
+    if not text or looks_like_noise(text):
+        return
+
+    logger.info(f"[{session.id}][{source.upper()}][revision] {text}")
+    revision = {
+        "type": "revision",
+        "segment_id": window.segment_ids[0],
+        "replaces": window.segment_ids,
+        "text": text,
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "source": source,
+        "session": session.id,
+    }
+    revision["seq"] = session.history.revise(revision)
+    await session.broadcast(revision)
 
 
 # ---------------------------------------------------
-# HTTP API
+# Hot config reload
+#   config.json is polled for changes and applied in place: thresholds,
+#   chunk length and capture toggles take effect on the next chunk, a
+#   device change swaps only that session's stream, and a key/model
+#   change only touches the Transcriber. Ports need a process restart.
 # ---------------------------------------------------
-@app.post("/start")
-async def start_service():
-    global running, transcription_task
+RESTART_REQUIRED_KEYS = {"control_port", "websocket_port"}
 
-    if running:
-        return {"status": "already_running"}
+config_mtime: int | None = None
+config_watch_task: asyncio.Task | None = None
 
-    running = True
-    transcription_task = asyncio.create_task(transcription_loop())
-    logger.info("Service started via API")
-    return {"status": "started"}
-    
 
+def apply_config(new_config: dict) -> set:
+    old_config = dict(config)
+    changed = {
+        key for key in set(old_config) | set(new_config)
+        if old_config.get(key) != new_config.get(key)
+    }
+    if not changed:
+        return changed
+
+    config.clear()
+    config.update(new_config)
+    logger.info(f"Config changed: {sorted(changed)}")
+
+    if "log_level" in changed:
+        logger.setLevel(
+            getattr(logging, str(config.get("log_level", "info")).upper(), logging.INFO)
+        )
+
+    if transcriber is None:
+        if changed & ({"openai_api_key", "transcription_model"} | BACKEND_KEYS):
+            # Not built yet (or failed, e.g. missing key): retry lazily.
+            reset_transcriber()
+    elif changed & BACKEND_KEYS:
+        try:
+            old_backend = transcriber.set_backend(build_backend(config))
+            # Closed once the calls still running on it are done
+            asyncio.get_running_loop().create_task(transcriber.retire_backend(old_backend))
+        except Exception as e:
+            logger.error(f"Failed to switch transcription backend: {e}")
+    elif changed & {"openai_api_key", "transcription_model"}:
+        try:
+            transcriber.reconfigure(
+                api_key=config.get("openai_api_key") or None,
+                model=config.get("transcription_model"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to reconfigure transcriber: {e}")
+
+    if changed & SCHEDULER_KEYS and transcriber is not None:
+        transcriber.scheduler.configure(scheduler_settings(config))
+
+    if changed & CACHE_KEYS and transcriber is not None:
+        transcriber.cache = build_cache(config)
+
+    if changed & BATCH_KEYS and transcriber is not None:
+        transcriber.set_batching(batch_settings(config))
+
+    if changed & BUDGET_KEYS and transcriber is not None:
+        transcriber.set_budget(budget_settings(config))
+
+    if "model_prices" in changed and transcriber is not None:
+        transcriber.usage.prices = build_usage_meter(config).prices
+
+    if changed & NORMALIZER_KEYS and transcriber is not None:
+        transcriber.normalizer = build_normalizer(config)
+
+    if changed & HEDGE_KEYS and transcriber is not None:
+        transcriber.set_hedging(hedge_settings(config))
+
+    for session in sessions.values():
+        session.apply_config(old_config)
+
+    if changed & RESTART_REQUIRED_KEYS:
+        logger.warning(
+            f"{sorted(changed & RESTART_REQUIRED_KEYS)} changed; restart the app to apply"
+        )
+
+    return changed
+
+
+def reload_config() -> set:
+    """Re-read config.json and apply any differences. Returns changed keys."""
+    global config_mtime
 
-@app.post("/stop")
-async def stop_service():
-    global running, transcription_task
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+        new_config = json.loads(CONFIG_PATH.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        # Possibly caught mid-write; the next poll will retry.
+        logger.warning(f"Could not reload config: {e}")
+        return set()
+
+    config_mtime = mtime
+    return apply_config(new_config)
+
+
+async def watch_config():
+    global config_mtime
+
+    try:
+        config_mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        config_mtime = None
+
+    while True:
+        await asyncio.sleep(config.get("config_poll_seconds", 1.0))
+        try:
+            mtime = CONFIG_PATH.stat().st_mtime_ns
+        except OSError:
+            continue
+        if mtime != config_mtime:
+            reload_config()
+
+
+# ---------------------------------------------------
+# FastAPI app & lifespan
+# ---------------------------------------------------
+def warm_transcriber():
+    try:
+        get_transcriber()
+    except Exception:
+        pass  # already logged; /start will retry and report it
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global config_watch_task
+
+    config_watch_task = asyncio.create_task(watch_config())
+    # Build the API client in the background; /status doesn't wait for it.
+    asyncio.get_event_loop().run_in_executor(None, warm_transcriber)
+
+    yield
 
-    if not running:
-        return {"status": "already_stopped"}
+    config_watch_task.cancel()
+    for session in sessions.values():
+        await session.stop()
+    if transcriber is not None:
+        await transcriber.aclose()
 
-    running = False
-    recorder.stop()
-    if transcription_task:
-        transcription_task.cancel()
-        transcription_task = None
 
-    logger.info("Service stopped via API")
-    return {"status": "stopped"}
+app = FastAPI(lifespan=lifespan)
+
+
+# ---------------------------------------------------
+# HTTP API
+# ---------------------------------------------------
+@app.post("/start")
+async def start_service():
+    result = await sessions[DEFAULT_SESSION_ID].start()
+    if result["status"] == "started":
+        logger.info("Service started via API")
+    return result
+
+
+@app.post("/stop")
+async def stop_service(drain: bool | None = None, timeout: float | None = None):
+    result = await sessions[DEFAULT_SESSION_ID].stop(drain=drain, timeout=timeout)
+    if result["status"] == "stopped":
+        logger.info("Service stopped via API")
+    return result
 
 
 @app.post("/restart")
-async def restart_service():
-    await stop_service()
+async def restart_service(drain: bool | None = None, timeout: float | None = None):
+    await stop_service(drain=drain, timeout=timeout)
+    reload_config()
     return await start_service()
 
 
 @app.get("/status")
 def status():
+    default = sessions[DEFAULT_SESSION_ID]
     return {
-        "running": running,
-        "clients": len(clients),
+        "running": default.running,
+        "clients": len(default.clients),
+        "sessions": len(sessions),
+        "transcriber_ready": transcriber is not None,
+        "transcriber_error": transcriber_error,
+        "transcriber_stats": transcriber.stats() if transcriber is not None else None,
+        "recorder_error": default.recorder_error,
         "control_port": config.get("control_port", 8766),
         "websocket_port": config.get("websocket_port", 8765),
     }
 
 
+@app.get("/usage")
+def usage():
+    """Audio seconds, bytes, latency and cost per window, model and source."""
+    if transcriber is None:
+        return {"usage": None, "budget": None}
+    return {
+        "usage": transcriber.usage.snapshot(),
+        "budget": transcriber.budget.describe() if transcriber.budget else None,
+    }
+
+
+@app.post("/config/reload")
+async def config_reload():
+    changed = reload_config()
+    return {"status": "reloaded", "changed": sorted(changed)}
+
+
 # ---------------------------------------------------
-# WebSocket endpoint
+# Session API
 # ---------------------------------------------------
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+@app.get("/sessions")
+def list_sessions():
+    return {"sessions": [s.describe() for s in sessions.values()]}
+
+
+@app.post("/sessions")
+async def create_session(body: dict = Body(default={})):
+    """
+    Create a capture session. Body:
+      {
+        "id":     "<optional session id>",
+        "config": {"input_device_index": 3, "chunk_duration": 2, ...},
+        "start":  true   # optional, start capturing immediately
+      }
+    """
+    session_id = str(body.get("id") or uuid.uuid4().hex[:8])
+    overrides = body.get("config") or {}
+
+    if session_id in sessions:
+        raise HTTPException(status_code=409, detail=f"Session '{session_id}' already exists")
+
+    unknown = set(overrides) - SESSION_OVERRIDE_KEYS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported session config keys: {sorted(unknown)}",
+        )
+
+    session = CaptureSession(session_id, overrides)
+    sessions[session_id] = session
+    logger.info(f"Session '{session_id}' created with overrides {overrides}")
+
+    result = session.describe()
+    if body.get("start"):
+        result["start"] = await session.start()
+
+    return result
+
+
+@app.get("/sessions/{session_id}")
+def session_status(session_id: str):
+    return get_session(session_id).describe()
+
+
+@app.get("/sessions/{session_id}/history")
+def session_history(
+    session_id: str,
+    before: int | None = None,
+    limit: int = 200,
+    source: str | None = None,
+):
+    """
+    Final transcript lines older than seq `before` (the newest ones if
+    omitted), oldest first; `has_more` tells whether to keep paging.
+    """
+    return get_session(session_id).history.page(
+        before=before, limit=max(1, min(limit, 1000)), source=source
+    )
+
+
+@app.post("/sessions/{session_id}/start")
+async def start_session(session_id: str):
+    return await get_session(session_id).start()
+
+
+@app.post("/sessions/{session_id}/stop")
+async def stop_session(session_id: str, drain: bool | None = None, timeout: float | None = None):
+    return await get_session(session_id).stop(drain=drain, timeout=timeout)
+
+
+@app.delete("/sessions/{session_id}")
+async def delete_session(session_id: str):
+    if session_id == DEFAULT_SESSION_ID:
+        raise HTTPException(status_code=400, detail="The default session cannot be deleted")
+
+    session = get_session(session_id)
+    await session.stop()
+    for ws in list(session.clients):
+        try:
+            await ws.close()
+        except Exception:
+            pass
+    del sessions[session_id]
+    if session.recorder is not None:
+        # Ends the capture process and frees its ring, if there is one
+        await asyncio.get_event_loop().run_in_executor(None, session.recorder.close)
+    logger.info(f"Session '{session_id}' deleted")
+    return {"status": "deleted"}
+
+
+# ---------------------------------------------------
+# File transcription
+#   Uploaded recordings are split on silence with the live gate and the
+#   voiced segments are transcribed concurrently; results stream back as
+#   NDJSON lines in completion order.
+# ---------------------------------------------------
+UPLOAD_READ_SIZE = 1024 * 1024
+
+
+async def save_upload(file: UploadFile, dest: Path):
+    """Stream the upload to disk without holding it in memory, or the loop."""
+    loop = asyncio.get_event_loop()
+    out = await loop.run_in_executor(None, dest.open, "wb")
+    try:
+        while True:
+            data = await file.read(UPLOAD_READ_SIZE)
+            if not data:
+                break
+            await loop.run_in_executor(None, out.write, data)
+    finally:
+        await loop.run_in_executor(None, out.close)
+
+
+def wav_file_duration(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
+def remove_files(paths: list):
+    for p in paths:
+        p.unlink(missing_ok=True)
+
+
+async def ensure_wav(path: Path) -> Path:
+    """Return a 16-bit PCM WAV version of `path`, converting with ffmpeg if needed."""
+    try:
+        with wave.open(str(path), "rb") as wf:
+            if wf.getsampwidth() == 2:
+                return path
+    except (wave.Error, EOFError):
+        pass
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Only 16-bit WAV is supported unless ffmpeg is installed",
+        )
+
+    wav_path = path.with_name(path.stem + ".pcm.wav")
+    proc = await asyncio.create_subprocess_exec(
+        ffmpeg, "-y", "-loglevel", "error", "-i", str(path),
+        "-acodec", "pcm_s16le", str(wav_path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Could not decode audio: {stderr.decode(errors='replace').strip()}",
+        )
+    return wav_path
+
+
+@app.post("/transcribe/file")
+async def transcribe_file(
+    file: UploadFile = File(...),
+    concurrency: int | None = None,
+    transcriber=Depends(require_transcriber),
+):
+    """
+    Transcribe an uploaded recording. Response is NDJSON:
+      {"type": "segments", "count": N, "duration": seconds}
+      {"type": "segment", "index": i, "start": s, "end": e, "text": "..."}   (as each completes)
+      {"type": "done", "elapsed": seconds, "failed": n}
+    A segment that couldn't be transcribed (failed, or past
+    upload_max_segment_age) has "text": "" and an "error" field.
+    """
+    from gating import read_wav_span, split_on_silence
+
+    UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+    upload_path = UPLOADS_DIR / f"{uuid.uuid4().hex}{Path(file.filename or '').suffix}"
+    await save_upload(file, upload_path)
+
+    loop = asyncio.get_event_loop()
+    cleanup = [upload_path]
+
+    try:
+        wav_path = await ensure_wav(upload_path)
+        cleanup.append(wav_path)
+        duration = await loop.run_in_executor(None, wav_file_duration, wav_path)
+
+        segments = await loop.run_in_executor(
+            None,
+            lambda: split_on_silence(
+                wav_path,
+                window_seconds=config.get("chunk_duration", 2),
+                max_segment_seconds=config.get("upload_max_segment_seconds", 30),
+                rms_threshold=gate_settings(config)["system_threshold"],
+                silence_rms=silence_settings(config)["rms_threshold"],
+                silence_peak=silence_settings(config)["peak_threshold"],
+            ),
+        )
+    except HTTPException:
+        remove_files(cleanup)
+        raise
+    except Exception as e:
+        remove_files(cleanup)
+        logger.error(f"Failed to read upload {file.filename}: {e}")
+        raise HTTPException(status_code=400, detail=f"Could not read audio: {e}")
+
+    limit = max(1, concurrency or config.get("upload_concurrency", 8))
+    semaphore = asyncio.Semaphore(limit)
+    logger.info(
+        f"Transcribing upload {file.filename}: {len(segments)} segments, concurrency={limit}"
+    )
+
+    # Not the live max_chunk_age: a long segment queued behind the rate
+    # limit is still worth transcribing
+    max_age = config.get("upload_max_segment_age", 300.0)
+
+    async def transcribe_segment(segment):
+        marks = {}
+        try:
+            async with semaphore:
+                wav_bytes = await loop.run_in_executor(
+                    None, read_wav_span, wav_path, segment.start_frame, segment.end_frame
+                )
+                text = await transcriber.transcribe_bytes_async(
+                    wav_bytes, source="file", timings=marks, max_age=max_age
+                )
+        except Exception as e:
+            logger.error(f"Upload segment {segment.index} failed: {e}")
+            return segment, "", str(e)
+        if "received" not in marks:
+            # The Transcriber returns "" for requests it dropped or that failed
+            return segment, "", "not transcribed (failed or past its deadline)"
+        if looks_like_noise(text or ""):
+            text = ""
+        return segment, text, None
+
+    async def results():
+        started = time.monotonic()
+        tasks = [asyncio.create_task(transcribe_segment(seg)) for seg in segments]
+        try:
+            yield json.dumps({
+                "type": "segments",
+                "count": len(segments),
+                "duration": round(duration, 3),
+            }) + "\n"
+
+            failed = 0
+            for next_done in asyncio.as_completed(tasks):
+                segment, text, error = await next_done
+                item = {
+                    "type": "segment",
+                    "index": segment.index,
+                    "start": round(segment.start, 3),
+                    "end": round(segment.end, 3),
+                    "text": text,
+                }
+                if error:
+                    item["error"] = error
+                    failed += 1
+                yield json.dumps(item) + "\n"
+
+            yield json.dumps({
+                "type": "done",
+                "elapsed": round(time.monotonic() - started, 3),
+                "failed": failed,
+            }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # Runs after the response even if the client left before the body started
+    return StreamingResponse(
+        results(), media_type="application/x-ndjson", background=BackgroundTask(remove_files, cleanup)
+    )
+
+
+# ---------------------------------------------------
+# WebSocket endpoints
+# ---------------------------------------------------
+async def serve_websocket(websocket: WebSocket, session: CaptureSession):
     await websocket.accept()
-    clients.add(websocket)
-    logger.info(f"WebSocket client connected. Total clients: {len(clients)}")
+    session.clients.add(websocket)
+    logger.info(
+        f"WebSocket client connected (session={session.id}). "
+        f"Total clients: {len(session.clients)}"
+    )
 
     try:
         while True:
             # Keep connection alive; we don't need incoming messages.
             await websocket.receive_text()
     except Exception:
-        clients.discard(websocket)
-        logger.info(f"WebSocket client disconnected. Total clients: {len(clients)}")
+        session.clients.discard(websocket)
+        logger.info(
+            f"WebSocket client disconnected (session={session.id}). "
+            f"Total clients: {len(session.clients)}"
+        )
+
+
+async def serve_stats(websocket: WebSocket, session: CaptureSession):
+    """
+    Health overlay channel: pushes session.health() every
+    stats_interval_ms, on its own socket so the transcript stream stays
+    untouched. Snapshots that haven't changed are skipped.
+    """
+    await websocket.accept()
+    session.stats_clients.add(websocket)
+    interval = session.config.get("stats_interval_ms", 250) / 1000.0
+    # One pending receive, kept across ticks so nothing is lost to a
+    # cancel; it doubles as the tick and wakes early if the client leaves
+    receiver = asyncio.ensure_future(websocket.receive())
+    last = None
+    try:
+        while True:
+            snapshot = session.health()
+            if snapshot != last:
+                await websocket.send_json(snapshot)
+                last = snapshot
+            done, _ = await asyncio.wait({receiver}, timeout=interval)
+            if not done:
+                continue
+            if receiver.result()["type"] == "websocket.disconnect":
+                break
+            receiver = asyncio.ensure_future(websocket.receive())
+    except Exception:
+        pass
+    finally:
+        receiver.cancel()
+        session.stats_clients.discard(websocket)
+
+
+@app.websocket("/stats/ws")
+async def stats_websocket_endpoint(websocket: WebSocket):
+    await serve_stats(websocket, sessions[DEFAULT_SESSION_ID])
+
+
+@app.websocket("/sessions/{session_id}/stats/ws")
+async def session_stats_websocket_endpoint(websocket: WebSocket, session_id: str):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.close(code=4404)
+        return
+    await serve_stats(websocket, session)
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    await serve_websocket(websocket, sessions[DEFAULT_SESSION_ID])
+
+
+@app.websocket("/sessions/{session_id}/ws")
+async def session_websocket_endpoint(websocket: WebSocket, session_id: str):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.close(code=4404)
+        return
+    await serve_websocket(websocket, session)
+
+
+# ---------------------------------------------------
+# Listeners
+#   TCP on control_host:control_port (loopback unless configured
+#   otherwise, for remote clients), plus the Unix socket from
+#   `control_socket` when set. One server serves both, so the control
+#   API, /ws and the lifespan are shared.
+# ---------------------------------------------------
+def bind_unix_socket(path: Path) -> socket.socket:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Only one service runs at a time (see instance.py), so a file
+    # already at `path` is left over from one that crashed
+    path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    path.chmod(0o600)
+    return sock
+
+
+def run_server(cfg: dict, log_level: str = "info"):
+    import uvicorn
+    from instance import control_socket_path
+
+    host = cfg.get("control_host", "127.0.0.1")
+    port = cfg.get("control_port", 8766)
+    sockets = [uvicorn.Config(app, host=host, port=port).bind_socket()]
+    logger.info(f"Control API listening on {host}:{port}")
+
+    socket_path = control_socket_path(cfg)
+    if socket_path is not None:
+        sockets.append(bind_unix_socket(socket_path))
+        logger.info(f"Control API listening on unix:{socket_path}")
+
+    # The app object, not "service:app": that string makes uvicorn import
+    # this whole module a second time before it can serve
+    server = uvicorn.Server(uvicorn.Config(app, log_level=log_level))
+    try:
+        server.run(sockets=sockets)
+    finally:
+        for sock in sockets:
+            sock.close()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
 
 
 # ---------------------------------------------------
 # Entrypoint
 # ---------------------------------------------------
 if __name__ == "__main__":
-    uvicorn.run(
-        "service:app",
-        host="0.0.0.0",
-        port=config.get("control_port", 8766),
-        reload=False,
-    )
+    import multiprocessing
+    from instance import InstanceLock
+
+    # Frozen builds: lets the capture child (capture_process) start
+    multiprocessing.freeze_support()
+
+    service_lock = InstanceLock("service")
+    if not service_lock.acquire():
+        logger.info("Service already running (pid %s); exiting", service_lock.holder())
+        raise SystemExit(0)
+
+    run_server(config)
 
 
 
@@ -2,39 +2,28 @@
 import os
 import subprocess
 import sys
+import time
+import logging
 from pathlib import Path
 
-def kill_other_launchers():
-    """
-    Kill all EchoMindLauncher processes except the current one.
-    """
-    try:
-        current_pid = os.getpid()
-
-        # Get all PIDs with the name "EchoMindService"
-        result = subprocess.run(
-            ["pgrep", "-f", "EchoMindService"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if result.stdout:
-            pids = [int(pid) for pid in result.stdout.strip().split("\n")]
-
-            for pid in pids:
-                if pid != current_pid:  # Do NOT kill the currently running Service
-                    try:
-                        os.kill(pid, 9)
-                    except Exception:
-                        pass
-
-    except Exception:
-        pass
+from instance import InstanceLock, control_url, launcher_logging, wait_ready
+
+logger = logging.getLogger("EchoMind")
+
+
+def launch(path: Path, cwd: Path):
+    # Launch LIKE a normal double-click (detached)
+    subprocess.Popen(
+        [str(path)],
+        cwd=cwd,
+        start_new_session=True,
+    )
+
 
 def main():
-    # First: Kill all other EchoMindService processes
-    kill_other_launchers()
+    launcher_logging()
+    launched = time.monotonic()
+
     # Path to *.app/Contents/MacOS/
     macos_dir = Path(sys.argv[0]).resolve().parent
 
@@ -51,19 +40,27 @@ def main():
     echomind_path.chmod(0o755)
     echomind_path_ui.chmod(0o755)
 
-    # Launch EchoMind LIKE a normal double-click (detached)
-    subprocess.Popen(
-        [str(echomind_path)],
-        cwd=macos_dir,
-        start_new_session=True,
-    )
-    subprocess.Popen(
-        [str(echomind_path_ui)],
-        cwd=macos_dir,
-        start_new_session=True,
-    )
+    # Each part holds its own lock while it runs; only start what's missing
+    service_pid = InstanceLock("service").holder()
+    if service_pid is None:
+        launch(echomind_path, macos_dir)
+    else:
+        logger.info("EchoMind service already running (pid %s)", service_pid)
+
+    # Open the UI as soon as the service answers on the control port
+    ready = wait_ready(control_url())
+    if ready is None:
+        logger.warning("Service not ready after %.1fs; starting the UI anyway", time.monotonic() - launched)
+    else:
+        logger.info("Service ready %.2fs after launch", time.monotonic() - launched)
+
+    ui_pid = InstanceLock("ui").holder()
+    if ui_pid is None:
+        launch(echomind_path_ui, macos_dir)
+    else:
+        logger.info("EchoMind UI already running (pid %s)", ui_pid)
 
-    # Immediately exit the launcher
+    # Exit the launcher
     os._exit(0)
 
 
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: cold-starts the service and the UI in fresh
+interpreters and measures
+
+  - time to /status:  launch -> GET /status answers
+  - time to window:   launch -> the Tk window is built and drawn
+
+each as the median of --runs. Results are compared to a recorded
+baseline and the run fails (exit 1) if any metric is more than
+--tolerance slower, or could not be measured at all (unless
+--allow-skip, e.g. for time-to-window with no display); --update
+records the current run as the baseline.
+An import-cost report (python -X importtime) lists the heaviest
+top-level imports of each module, to show where a regression came from.
+
+    python startup_bench.py [--runs 5] [--tolerance 0.2] [--update] [--allow-skip]
+
+Children run with a throwaway HOME, so they never touch the real
+~/.echomind config, locks or logs.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+
+from instance import wait_ready
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_BASELINE = Path.home() / ".echomind" / "startup_baseline.json"
+
+WINDOW_SCRIPT = """
+import ui
+app = ui.TranscriptionUI()
+app.root.update()
+print("window", flush=True)
+app.on_closing()
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def child_env(home: Path, port: int) -> dict:
+    config_dir = home / ".echomind"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "config.json").write_text(json.dumps({"control_port": port, "websocket_port": port}))
+    return {**os.environ, "HOME": str(home), "PYTHONDONTWRITEBYTECODE": "1"}
+
+
+# -------------------------------------------------
+# Measurements
+# -------------------------------------------------
+def time_to_status(home: Path, timeout: float) -> float:
+    port = free_port()
+    env = child_env(home, port)
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "service.py"],
+        cwd=HERE,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        if wait_ready(f"http://127.0.0.1:{port}", timeout=timeout, interval=0.01) is None:
+            raise RuntimeError(f"service did not answer /status within {timeout}s")
+        return time.monotonic() - started
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def time_to_window(home: Path, timeout: float) -> float:
+    env = child_env(home, free_port())
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", WINDOW_SCRIPT],
+        cwd=HERE,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        line = proc.stdout.readline()
+        elapsed = time.monotonic() - started
+        if line.strip() != "window":
+            proc.wait(timeout=timeout)
+            errors = proc.stderr.read().strip().splitlines()
+            raise RuntimeError(errors[-1] if errors else "UI exited")
+        return elapsed
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def import_report(module: str, home: Path, top: int = 8) -> list[tuple[str, float]]:
+    """Heaviest direct imports of `module`, as (name, cumulative seconds)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE,
+        env=child_env(home, free_port()),
+        capture_output=True,
+        text=True,
+    )
+    costs = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Direct imports are indented two spaces past the module itself
+        name = name[1:]
+        if name.startswith("   ") or not name.startswith("  "):
+            continue
+        try:
+            costs.append((name.strip(), int(cumulative) / 1e6))
+        except ValueError:
+            continue
+    return sorted(costs, key=lambda c: c[1], reverse=True)[:top]
+
+
+# -------------------------------------------------
+# Main
+# -------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EchoMind startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="record this run as the new baseline")
+    parser.add_argument("--allow-skip", action="store_true", help="don't fail when a metric can't be measured")
+    args = parser.parse_args()
+
+    metrics = {"time_to_status": time_to_status, "time_to_window": time_to_window}
+    results = {}
+    skipped = []
+    with tempfile.TemporaryDirectory(prefix="echomind-bench-") as tmp:
+        home = Path(tmp)
+        for name, measure in metrics.items():
+            samples = []
+            try:
+                for _ in range(args.runs):
+                    samples.append(measure(home, args.timeout))
+            except Exception as e:
+                print(f"{name}: skipped ({e})")
+                skipped.append(name)
+                continue
+            results[name] = round(statistics.median(samples), 3)
+            print(f"{name}: {results[name]:.3f}s (median of {len(samples)}, min {min(samples):.3f}s)")
+
+        for module in ("service", "ui"):
+            print(f"\nimport cost, {module}:")
+            for name, seconds in import_report(module, home):
+                print(f"  {seconds * 1000:8.1f} ms  {name}")
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    # A startup that breaks outright is the worst regression of all
+    if skipped and not args.allow_skip:
+        print(f"\nFailed to measure {', '.join(skipped)} (pass --allow-skip to ignore)")
+        return 1
+
+    failed = False
+    if baseline and not args.update:
+        print()
+        for name, value in results.items():
+            if name not in baseline:
+                continue
+            limit = baseline[name] * (1 + args.tolerance)
+            verdict = "ok" if value <= limit else "REGRESSION"
+            failed |= value > limit
+            print(f"{name}: {value:.3f}s vs baseline {baseline[name]:.3f}s (limit {limit:.3f}s) {verdict}")
+
+    if args.update or not baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2))
+        print(f"\nBaseline written to {args.baseline}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,32 @@
 import io
 import os
 import time
+import wave
 import random
+import asyncio
 import logging
-from typing import Optional, Dict, Any, Protocol
+import threading
+import email.utils
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Protocol, Callable, Awaitable, Union
 from dataclasses import dataclass, field
-from openai import OpenAI
+
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    RateLimitError,
+)
+
+from backends import (
+    OpenAIBackend,
+    PoolSettings,
+    TranscriptionBackend,
+    assign_segments_to_spans,
+)
+from transcript_cache import TranscriptionCache
+from usage import BudgetPolicy, BudgetSettings, UsageMeter, wav_duration
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +43,23 @@ class TranscriptionRequest:
     temperature: float = 0.0
     timestamp_ms: int = field(default_factory=lambda: round(time.time() * 1000))
     request_id: str = field(default_factory=lambda: f"req-{random.randint(10**6, 10**7-1)}")
+    # "mic" / "system" / "file", for usage accounting
+    source: str = ""
+    # Per-request model override (budget economy mode); None = backend's
+    model: Optional[str] = None
+    # Epoch time of each stage the request reaches ("normalized", "sent",
+    # "received"); callers pass their own dict to read them back
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Epoch time to give up by; None = captured_at + the scheduler's max_chunk_age
+    deadline: Optional[float] = None
+
+    def mark(self, stage: str) -> None:
+        self.timings[stage] = time.time()
+
+    @property
+    def captured_at(self) -> float:
+        """Epoch time the audio was captured; when the request was built, if unknown."""
+        return self.timings.get("captured") or self.timestamp_ms / 1000.0
 
     def as_file(self) -> io.BytesIO:
         stream = io.BytesIO(self.payload)
@@ -29,6 +67,632 @@ class TranscriptionRequest:
         return stream
 
 
+# -------------------------------------------------
+# Request scheduling: rate limit, retries, circuit breaker
+# -------------------------------------------------
+class SchedulerError(Exception):
+    """A request was abandoned by the scheduler (deadline, breaker, ...)."""
+
+
+class TokenBucket:
+    """Classic token bucket; `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token, returning how long the caller must wait before
+        using it (0 if it was available right away).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            if self.tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def refund(self) -> None:
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects
+    requests for `reset_timeout` seconds, then lets one probe through
+    (half-open); a success closes it again. A probe that ends without a
+    verdict (cancelled, dropped) must be handed back with release().
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+    PROBE = "probe"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> Union[bool, str]:
+        """False to reject; PROBE (truthy) if the caller is the half-open probe."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                return self.PROBE
+            if self.state == self.HALF_OPEN:
+                # One probe at a time
+                return False
+            return True
+
+    def release(self) -> None:
+        """The probe got no verdict: back to open, and the next caller probes."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Circuit breaker opened after %d failures", self.failures)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+@dataclass
+class SchedulerSettings:
+    max_attempts: int = 4
+    base_backoff: float = 0.25
+    max_backoff: float = 4.0
+    # Give up on a chunk once its audio is this old (seconds)
+    max_chunk_age: float = 15.0
+    # Account limits: sustained requests/minute and burst size
+    requests_per_minute: float = 50.0
+    burst: int = 10
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
+
+class RequestScheduler:
+    """
+    Runs one API call per TranscriptionRequest with:
+      - a deadline tied to the chunk's capture time (max_chunk_age), which
+        also caps each attempt's HTTP timeout;
+      - exponential backoff with full jitter on retryable errors
+        (429, 408/409, 5xx, timeouts, connection errors), honouring
+        Retry-After / retry-after-ms when the server sends one;
+      - a token bucket sized to the account's request limit;
+      - a circuit breaker that fails fast while the API is down.
+    """
+
+    RETRYABLE_STATUS = {408, 409, 429}
+
+    def __init__(self, settings: Optional[SchedulerSettings] = None) -> None:
+        settings = settings or SchedulerSettings()
+        self.bucket = TokenBucket(settings.requests_per_minute / 60.0, settings.burst)
+        self.breaker = CircuitBreaker(
+            settings.breaker_failure_threshold, settings.breaker_reset_timeout
+        )
+        self.configure(settings)
+        self.counters = {
+            "requests": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "timeouts": 0,
+            "deadline_exceeded": 0,
+            "breaker_rejected": 0,
+        }
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def configure(self, settings: SchedulerSettings) -> None:
+        """Apply settings in place; the bucket and breaker keep their state."""
+        self.settings = settings
+        with self.bucket._lock:
+            self.bucket.rate = settings.requests_per_minute / 60.0
+            self.bucket.capacity = settings.burst
+            self.bucket.tokens = min(self.bucket.tokens, settings.burst)
+        self.breaker.failure_threshold = settings.breaker_failure_threshold
+        self.breaker.reset_timeout = settings.breaker_reset_timeout
+
+    # ---- bookkeeping ----
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            **counters,
+            "breaker": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "tokens": round(max(self.bucket.tokens, 0.0), 2),
+            "last_error": self.last_error,
+        }
+
+    # ---- policy ----
+    def deadline_for(self, request: TranscriptionRequest) -> float:
+        """Absolute time.time() after which the chunk isn't worth sending."""
+        if request.deadline is not None:
+            return request.deadline
+        return request.captured_at + self.settings.max_chunk_age
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, (APITimeoutError, APIConnectionError)):
+            return True
+        if isinstance(exc, APIStatusError):
+            return exc.status_code in self.RETRYABLE_STATUS or exc.status_code >= 500
+        return False
+
+    @staticmethod
+    def _retry_after(exc: Exception) -> Optional[float]:
+        response = getattr(exc, "response", None)
+        if response is None:
+            return None
+        headers = response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return float(headers["retry-after-ms"]) / 1000.0
+            if "retry-after" in headers:
+                value = headers["retry-after"]
+                try:
+                    return float(value)
+                except ValueError:
+                    retry_at = email.utils.parsedate_to_datetime(value)
+                    return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+        return None
+
+    def _backoff(self, attempt: int, exc: Exception) -> float:
+        ceiling = min(self.settings.max_backoff, self.settings.base_backoff * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        retry_after = self._retry_after(exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _before_attempt(self, request: TranscriptionRequest, deadline: float) -> tuple[float, bool]:
+        """
+        Check rate limit + breaker; return (seconds to wait before sending,
+        whether this attempt is the breaker's probe). The breaker is asked
+        last, so a probe is only taken by an attempt that will be sent.
+        """
+        wait = self.bucket.reserve()
+        if time.time() + wait >= deadline:
+            self.bucket.refund()
+            self._count("deadline_exceeded")
+            raise SchedulerError(f"{request.request_id} would miss its deadline waiting for rate limit")
+
+        allowed = self.breaker.allow()
+        if not allowed:
+            self.bucket.refund()
+            self._count("breaker_rejected")
+            raise SchedulerError(f"circuit open, dropping {request.request_id}")
+        return wait, allowed == CircuitBreaker.PROBE
+
+    def _after_failure(
+        self, exc: Exception, attempt: int, request: TranscriptionRequest, deadline: float
+    ) -> float:
+        """Record a failed attempt; return the retry delay or re-raise."""
+        self.last_error = f"{type(exc).__name__}: {exc}"
+        if isinstance(exc, RateLimitError):
+            self._count("rate_limited")
+        if isinstance(exc, APITimeoutError):
+            self._count("timeouts")
+
+        if not self._is_retryable(exc):
+            # The API answered (e.g. 400/401), so it isn't down
+            self.breaker.record_success()
+            self._count("failed")
+            raise exc
+
+        self.breaker.record_failure()
+        if attempt + 1 >= self.settings.max_attempts or self.breaker.state == CircuitBreaker.OPEN:
+            self._count("failed")
+            raise exc
+
+        delay = self._backoff(attempt, exc)
+        if time.time() + delay >= deadline:
+            self._count("deadline_exceeded")
+            raise SchedulerError(f"{request.request_id} out of time after {attempt + 1} attempts") from exc
+
+        self._count("retries")
+        logger.warning(
+            "Retrying %s in %.2fs (attempt %d): %s",
+            request.request_id, delay, attempt + 1, self.last_error,
+        )
+        return delay
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            self._count("deadline_exceeded")
+            raise SchedulerError("deadline exceeded")
+        return remaining
+
+    # ---- runners ----
+    def run(self, call: Callable[[float], Any], request: TranscriptionRequest) -> Any:
+        """Blocking: `call(timeout)` performs one attempt."""
+        self._count("requests")
+        deadline = self.deadline_for(request)
+
+        for attempt in range(self.settings.max_attempts):
+            wait, probe = self._before_attempt(request, deadline)
+            try:
+                if wait:
+                    time.sleep(wait)
+                timeout = self._attempt_timeout(deadline)
+                try:
+                    result = call(timeout)
+                except Exception as exc:
+                    # _after_failure records the verdict before anything else
+                    probe = False
+                    delay = self._after_failure(exc, attempt, request, deadline)
+                else:
+                    probe = False
+                    self.breaker.record_success()
+                    self._count("succeeded")
+                    return result
+            finally:
+                if probe:
+                    self.breaker.release()
+            time.sleep(delay)
+
+        raise SchedulerError(f"{request.request_id} exhausted retries")
+
+    async def run_async(
+        self, call: Callable[[float], Awaitable[Any]], request: TranscriptionRequest
+    ) -> Any:
+        """Async twin of run(); `call(timeout)` returns an awaitable."""
+        self._count("requests")
+        deadline = self.deadline_for(request)
+
+        for attempt in range(self.settings.max_attempts):
+            wait, probe = self._before_attempt(request, deadline)
+            try:
+                if wait:
+                    await asyncio.sleep(wait)
+                timeout = self._attempt_timeout(deadline)
+                try:
+                    result = await call(timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    probe = False
+                    delay = self._after_failure(exc, attempt, request, deadline)
+                else:
+                    probe = False
+                    self.breaker.record_success()
+                    self._count("succeeded")
+                    return result
+            finally:
+                # Cancelled or out of time before an answer: no verdict
+                if probe:
+                    self.breaker.release()
+            await asyncio.sleep(delay)
+
+        raise SchedulerError(f"{request.request_id} exhausted retries")
+
+
+# -------------------------------------------------
+# Hedged requests: a backup call for the slow tail
+# -------------------------------------------------
+@dataclass
+class HedgeSettings:
+    # Fire the backup once the first call is slower than this percentile
+    percentile: float = 0.95
+    # ...but never sooner than this (seconds)
+    min_delay: float = 0.5
+    # At most this fraction of recent calls may be hedged
+    max_rate: float = 0.1
+    # Rolling window (calls) for the latency percentile and the hedge rate
+    window: int = 200
+    # Latency samples needed before hedging starts
+    min_samples: int = 20
+
+
+class RequestHedger:
+    """
+    Runs an API call and, if it hasn't answered within the rolling
+    latency percentile, fires a duplicate; whichever succeeds first wins
+    and the other is cancelled. Hedges also take a token from the
+    scheduler's bucket, so they never push us past the account's rate
+    limit, and are capped at `max_rate` of recent calls to bound cost.
+    """
+
+    def __init__(self, settings: HedgeSettings, scheduler: Optional[RequestScheduler] = None) -> None:
+        self.settings = settings
+        self.scheduler = scheduler
+        self.latencies: deque = deque(maxlen=settings.window)
+        self.recent_hedges: deque = deque(maxlen=settings.window)
+        self.counters = {
+            "calls": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "skipped_rate_cap": 0,
+        }
+
+    def configure(self, settings: HedgeSettings) -> None:
+        self.settings = settings
+        self.latencies = deque(self.latencies, maxlen=settings.window)
+        self.recent_hedges = deque(self.recent_hedges, maxlen=settings.window)
+
+    def hedge_delay(self) -> Optional[float]:
+        if len(self.latencies) < self.settings.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.settings.percentile))
+        return max(self.settings.min_delay, ordered[index])
+
+    def _may_hedge(self) -> bool:
+        recent = self.recent_hedges
+        if recent and sum(recent) / len(recent) >= self.settings.max_rate:
+            self.counters["skipped_rate_cap"] += 1
+            return False
+        bucket = self.scheduler.bucket if self.scheduler is not None else None
+        if bucket is not None and bucket.reserve() > 0:
+            bucket.refund()
+            self.counters["skipped_rate_cap"] += 1
+            return False
+        return True
+
+    async def _timed(
+        self, call: Callable[[Optional[float]], Awaitable[Any]], timeout: Optional[float]
+    ) -> tuple[Any, float]:
+        started = time.monotonic()
+        result = await call(timeout)
+        return result, time.monotonic() - started
+
+    async def run(
+        self, call: Callable[[Optional[float]], Awaitable[Any]], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        `call(timeout)` performs one API call. The hedge starts later, so
+        it gets only what is left of `timeout` and can't outlive the
+        request's deadline.
+        """
+        self.counters["calls"] += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._timed(call, timeout))
+        delay = self.hedge_delay()
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait([primary], timeout=delay)
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if not done and (remaining is None or remaining > 0) and self._may_hedge():
+                    hedge = asyncio.ensure_future(self._timed(call, remaining))
+                    return await self._race(primary, hedge)
+
+            self.recent_hedges.append(False)
+            result, elapsed = await primary
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        self.latencies.append(elapsed)
+        return result
+
+    async def _race(self, primary: asyncio.Future, hedge: asyncio.Future) -> Any:
+        self.counters["hedged"] += 1
+        self.recent_hedges.append(True)
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        if not pending:
+                            raise task.exception()
+                        continue
+                    result, elapsed = task.result()
+                    self.latencies.append(elapsed)
+                    self.counters["hedge_wins" if task is hedge else "primary_wins"] += 1
+                    return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.counters["calls"]
+        hedged = self.counters["hedged"]
+        delay = self.hedge_delay()
+        return {
+            **self.counters,
+            "hedge_rate": round(hedged / calls, 3) if calls else None,
+            "hedge_win_rate": round(self.counters["hedge_wins"] / hedged, 3) if hedged else None,
+            "hedge_delay": round(delay, 3) if delay is not None else None,
+        }
+
+
+# -------------------------------------------------
+# Request batching: several short chunks, one API call
+# -------------------------------------------------
+@dataclass
+class BatchSettings:
+    max_chunks: int = 4
+    # Longest a chunk waits for others to join its batch (seconds)
+    max_wait: float = 1.5
+    # Silence laid between chunks so segments don't straddle two of them
+    gap_seconds: float = 0.5
+    # Must support segment timestamps (verbose_json)
+    model: str = "whisper-1"
+
+
+def join_wavs(chunks: list[bytes], gap_seconds: float) -> tuple[bytes, list[tuple[float, float]]]:
+    """
+    Concatenate WAV chunks with the same format, separated by silence.
+    Returns the joined WAV and each chunk's (start, end) in seconds.
+    """
+    params = None
+    pieces, spans, offset = [], [], 0.0
+    for wav_bytes in chunks:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+            if params is None:
+                params = wf.getparams()
+                gap = b"\x00" * (
+                    int(params.framerate * gap_seconds) * params.nchannels * params.sampwidth
+                )
+            frames = wf.readframes(wf.getnframes())
+
+        duration = len(frames) / (params.framerate * params.nchannels * params.sampwidth)
+        spans.append((offset, offset + duration))
+        pieces.extend([frames, gap])
+        offset += duration + gap_seconds
+
+    bio = io.BytesIO()
+    with wave.open(bio, "wb") as dst:
+        dst.setnchannels(params.nchannels)
+        dst.setsampwidth(params.sampwidth)
+        dst.setframerate(params.framerate)
+        dst.writeframes(b"".join(pieces[:-1]))
+    return bio.getvalue(), spans
+
+
+def wav_format(wav_bytes: bytes) -> tuple[int, int, int]:
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        return wf.getnchannels(), wf.getsampwidth(), wf.getframerate()
+
+
+class ChunkBatcher:
+    """
+    Collects requests from concurrent transcribe_bytes_async callers and
+    sends them as one request: chunks are joined with silence, segment
+    timestamps are requested, and each segment's text is handed back to
+    the chunk it falls in. A batch goes out once it has `max_chunks`
+    chunks or its oldest chunk has waited `max_wait` seconds, so batching
+    adds at most max_wait of latency. Chunks with different WAV formats
+    (e.g. stereo system audio vs mono mic) are batched separately.
+    """
+
+    def __init__(self, transcriber: "Transcriber", settings: BatchSettings) -> None:
+        self.transcriber = transcriber
+        self.settings = settings
+        # format -> [(request, future), ...]
+        self._pending: Dict[tuple, list] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.counters = {"batches": 0, "batched_chunks": 0}
+
+    async def submit(self, request: TranscriptionRequest) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            key = wav_format(request.payload)
+        except Exception:
+            key = ()
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((request, future))
+        if len(pending) >= self.settings.max_chunks:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.settings.max_wait, self._flush, key)
+        return await future
+
+    def _flush(self, key: tuple) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: tuple, batch: list) -> None:
+        try:
+            if len(batch) == 1 or not key:
+                # Nothing to join with (or unreadable WAV): send as-is
+                texts = await asyncio.gather(
+                    *(self.transcriber._transcribe_one_async(r) for r, _ in batch)
+                )
+            else:
+                texts = await self._send_joined([r for r, _ in batch])
+        except Exception as exc:
+            logger.exception("Batched transcription failed: %s", exc)
+            texts = [""] * len(batch)
+
+        for (_, future), text in zip(batch, texts):
+            if not future.done():
+                future.set_result(text)
+
+    async def _send_joined(self, requests: list[TranscriptionRequest]) -> list[str]:
+        payload, spans = join_wavs([r.payload for r in requests], self.settings.gap_seconds)
+        sources = {r.source for r in requests}
+        # The most urgent member sets the scheduler's deadline
+        combined = TranscriptionRequest(
+            payload=payload,
+            timestamp_ms=min(r.timestamp_ms for r in requests),
+            source=sources.pop() if len(sources) == 1 else "mixed",
+            timings={"captured": min(r.captured_at for r in requests)},
+            deadline=min(self.transcriber.scheduler.deadline_for(r) for r in requests),
+        )
+        backend = self.transcriber.backend
+        model = self.settings.model
+        for r in requests:
+            # Transcribed by the batch model (this keys the cache entry)
+            r.model = model
+
+        send = self.transcriber._metered(
+            combined, model, lambda timeout: backend.transcribe_segments_async(combined, timeout, model)
+        )
+
+        def call(timeout: Optional[float]):
+            for r in requests:
+                r.mark("sent")
+            return self.transcriber._hedged(send, timeout)
+
+        try:
+            with self.transcriber.using(backend):
+                segments = await self.transcriber.scheduler.run_async(call, combined)
+        except SchedulerError as exc:
+            logger.warning("Batch %s dropped: %s", combined.request_id, exc)
+            return [""] * len(requests)
+
+        for r in requests:
+            r.mark("received")
+
+        self.counters["batches"] += 1
+        self.counters["batched_chunks"] += len(requests)
+        logger.info(
+            "Batched transcription complete | request=%s | chunks=%d | segments=%d",
+            combined.request_id, len(requests), len(segments),
+        )
+        return assign_segments_to_spans(segments, spans)
+
+    def stats(self) -> Dict[str, Any]:
+        batches = self.counters["batches"]
+        return {
+            **self.counters,
+            "pending": sum(len(p) for p in self._pending.values()),
+            "avg_batch_size": round(self.counters["batched_chunks"] / batches, 2) if batches else None,
+        }
+
+
 class Transcriber:
     def __init__(
         self,
@@ -37,36 +701,190 @@ class Transcriber:
         normalizer: Optional[AudioNormalizer] = None,
         metadata: Optional[Dict[str, Any]] = None,
         logs_path: Optional[os.PathLike[str] | str] = None,
+        pool: Optional[PoolSettings] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        cache: Optional[TranscriptionCache] = None,
+        backend: Optional[TranscriptionBackend] = None,
+        batching: Optional[BatchSettings] = None,
+        hedging: Optional[HedgeSettings] = None,
+        usage: Optional[UsageMeter] = None,
+        budget: Optional[BudgetSettings] = None,
     ) -> None:
         """
-        Verbose wrapper around OpenAI's transcription API with hooks for
+        Verbose wrapper around a transcription backend with hooks for
         instrumentation, normalization, and request metadata decoration.
-        """
-        computed_key = api_key or os.environ.get("OPENAI_API_KEY")
-        if not computed_key:
-            raise ValueError(
-                "No OpenAI API key provided. "
-                "Set OPENAI_API_KEY env var or add 'openai_api_key' in config.json."
-            )
 
-        self.model = model
+        The backend defaults to OpenAI (built from api_key/model/pool);
+        see backends.py for the registry and the local CPU engine.
+        Remote backends run under the RequestScheduler (retries, rate
+        limiting, deadlines). An optional TranscriptionCache
+        short-circuits repeated audio. With `batching`, concurrent async
+        requests are grouped into one API call (see ChunkBatcher); with
+        `hedging`, slow async calls get a backup (see RequestHedger).
+        Every API request is metered into `usage`; a `budget` switches to
+        a cheaper model (and tells callers to gate harder) when spend
+        runs high (see usage.py).
+        """
+        self.backend = backend or OpenAIBackend(api_key=api_key, model=model, pool=pool)
         self.normalizer = normalizer
         self.metadata = metadata or {}
-        self.client = OpenAI(api_key=computed_key)
+        self.scheduler = scheduler or RequestScheduler()
+        self.cache = cache
         self.logs_path = logs_path  
+        self.batcher: Optional[ChunkBatcher] = None
+        self.set_batching(batching)
+        self.hedger: Optional[RequestHedger] = None
+        self.set_hedging(hedging)
+        self.usage = usage or UsageMeter()
+        self.budget: Optional[BudgetPolicy] = None
+        self.set_budget(budget)
+        # backend -> calls running on it, so a replaced one is closed only
+        # once they finish (see retire_backend)
+        self._backend_calls: Counter = Counter()
+        self._backend_lock = threading.Lock()
 
         logger.info(
-            "Transcriber initialized with model=%s, metadata_keys=%s",
+            "Transcriber initialized with backend=%s, model=%s, metadata_keys=%s",
+            self.backend.name,
             self.model,
             list(self.metadata),
         )
 
-    def _build_request(self, wav_bytes: bytes) -> TranscriptionRequest:
+    @property
+    def model(self) -> str:
+        return self.backend.model
+
+    def reconfigure(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
+        """Apply new settings in place (see the backend's reconfigure)."""
+        self.backend.reconfigure(api_key=api_key, model=model)
+
+    def set_backend(self, backend: TranscriptionBackend) -> TranscriptionBackend:
+        """
+        Swap the backend and return the old one; in-flight calls finish on
+        it, so the caller should hand it to retire_backend() afterwards.
+        """
+        old, self.backend = self.backend, backend
+        logger.info("Transcriber backend changed: %s -> %s", old.name, backend.name)
+        return old
+
+    @contextmanager
+    def using(self, backend: TranscriptionBackend):
+        """Count a call running on `backend` for as long as the block runs."""
+        with self._backend_lock:
+            self._backend_calls[backend] += 1
+        try:
+            yield backend
+        finally:
+            with self._backend_lock:
+                self._backend_calls[backend] -= 1
+                if not self._backend_calls[backend]:
+                    del self._backend_calls[backend]
+
+    async def retire_backend(self, backend: TranscriptionBackend, grace: Optional[float] = None) -> None:
+        """
+        aclose() a replaced backend once the calls still running on it are
+        done. Those give up by their deadline anyway, so `grace` defaults
+        to max_chunk_age; after it the backend is closed regardless.
+        """
+        if grace is None:
+            grace = self.scheduler.settings.max_chunk_age
+        deadline = time.monotonic() + grace
+        while self._backend_calls[backend] and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        await backend.aclose()
+
+    def set_batching(self, settings: Optional[BatchSettings]) -> None:
+        """Enable (or, with None, disable) request batching."""
+        if settings is None:
+            self.batcher = None
+        elif self.batcher is None:
+            self.batcher = ChunkBatcher(self, settings)
+        else:
+            self.batcher.settings = settings
+
+    def set_hedging(self, settings: Optional[HedgeSettings]) -> None:
+        """Enable (or, with None, disable) hedged requests."""
+        if settings is None:
+            self.hedger = None
+        elif self.hedger is None:
+            self.hedger = RequestHedger(settings, self.scheduler)
+        else:
+            self.hedger.configure(settings)
+
+    def set_budget(self, settings: Optional[BudgetSettings]) -> None:
+        """Enable (or, with None, disable) budget-based throttling."""
+        self.budget = BudgetPolicy(settings, self.usage) if settings is not None else None
+
+    def gate_factor(self) -> float:
+        """Multiplier for the callers' gating thresholds (>1 when over budget)."""
+        return self.budget.gate_factor() if self.budget is not None else 1.0
+
+    def _meter(self, request: TranscriptionRequest, model: str, started: float, ok: bool = True) -> None:
+        self.usage.record(
+            model=model,
+            source=request.source,
+            seconds=wav_duration(request.payload),
+            nbytes=len(request.payload),
+            latency=time.monotonic() - started,
+            ok=ok,
+        )
+
+    def _metered(
+        self,
+        request: TranscriptionRequest,
+        model: str,
+        call: Callable[[Optional[float]], Awaitable[Any]],
+    ) -> Callable[[Optional[float]], Awaitable[Any]]:
+        """
+        Wrap one API call so every time it is sent gets metered: each
+        retry, each hedge duplicate, and failed, timed-out or cancelled
+        attempts too, since those are billed (or at least sent) as well.
+        """
+
+        async def attempt(timeout: Optional[float]) -> Any:
+            started = time.monotonic()
+            ok = False
+            try:
+                result = await call(timeout)
+                ok = True
+                return result
+            finally:
+                self._meter(request, model, started, ok)
+
+        return attempt
+
+    def _hedged(
+        self, call: Callable[[Optional[float]], Awaitable[Any]], timeout: Optional[float]
+    ) -> Awaitable[Any]:
+        if self.hedger is None:
+            return call(timeout)
+        return self.hedger.run(call, timeout)
+
+    async def warm_up(self) -> None:
+        await self.backend.warm_up()
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+
+    def _build_request(
+        self,
+        wav_bytes: bytes,
+        source: str = "",
+        timings: Optional[Dict[str, float]] = None,
+        max_age: Optional[float] = None,
+    ) -> TranscriptionRequest:
         if self.normalizer:
             logger.debug("Applying audio normalizer to payload")
             wav_bytes = self.normalizer(wav_bytes)
 
-        request = TranscriptionRequest(payload=wav_bytes)
+        request = TranscriptionRequest(payload=wav_bytes, source=source)
+        if timings is not None:
+            request.timings = timings
+        request.mark("normalized")
+        if max_age is not None:
+            request.deadline = request.captured_at + max_age
+        if self.budget is not None:
+            request.model = self.budget.model_override(self.model)
         logger.debug("Constructed request %s (%d bytes)", request.request_id, len(wav_bytes))
         return request
 
@@ -78,23 +896,210 @@ class Transcriber:
             request.language,
         )
 
-    def transcribe_bytes(self, wav_bytes: bytes) -> str:
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "model": self.model,
+            "scheduler": self.scheduler.snapshot(),
+            "cache": self.cache.stats() if self.cache else None,
+            "batching": self.batcher.stats() if self.batcher else None,
+            "hedging": self.hedger.stats() if self.hedger else None,
+            "budget": self.budget.describe() if self.budget else None,
+            "normalizer": (
+                self.normalizer.stats() if hasattr(self.normalizer, "stats") else None
+            ),
+        }
+
+    def _batched(self) -> bool:
+        return self.batcher is not None and self.backend.supports_segments
+
+    def _cache_lookup(self, request: TranscriptionRequest) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
-        Converts raw WAV bytes into text via OpenAI's API while emitting
-        detailed diagnostics.
+        Return (cache entry, cached text); entry is reused to store the
+        result. Entries are keyed by the model that wrote them, so look
+        under the one this request will most likely go to.
         """
-        request = self._build_request(wav_bytes)
+        if self.cache is None:
+            return None, None
+        namespace = self.batcher.settings.model if self._batched() else (request.model or self.model)
+        try:
+            entry = self.cache.describe(request.payload, namespace=namespace)
+        except Exception as exc:
+            logger.debug("Cache key error for %s: %s", request.request_id, exc)
+            return None, None
+
+        text = self.cache.lookup(entry)
+        if text is not None:
+            logger.info("Transcription cache hit | request=%s", request.request_id)
+            request.mark("received")
+        return entry, text
+
+    def _cache_store(self, request: TranscriptionRequest, entry: Optional[Dict[str, Any]], text: str) -> None:
+        if self.cache is None or entry is None or not text:
+            return
+        # Store under the model that actually answered (a batch of one
+        # goes out on the regular model, a joined batch on the batch model)
+        namespace = request.model or self.model
+        if entry.get("namespace") != namespace:
+            entry = self.cache.describe(request.payload, namespace=namespace)
+        self.cache.store(entry, text)
+
+    # Hashing and the disk tier are blocking; the async paths run them in
+    # the default executor, and don't wait for stores at all
+    async def _cache_lookup_async(
+        self, request: TranscriptionRequest
+    ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if self.cache is None:
+            return None, None
+        return await asyncio.get_running_loop().run_in_executor(None, self._cache_lookup, request)
+
+    async def _build_request_async(
+        self,
+        wav_bytes: bytes,
+        source: str = "",
+        timings: Optional[Dict[str, float]] = None,
+        max_age: Optional[float] = None,
+    ) -> TranscriptionRequest:
+        # The normalizer decodes and rewrites the WAV in numpy; keep it off the loop
+        if not self.normalizer:
+            return self._build_request(wav_bytes, source, timings, max_age)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._build_request, wav_bytes, source, timings, max_age
+        )
+
+    def _cache_store_async(self, request: TranscriptionRequest, entry: Optional[Dict[str, Any]], text: str) -> None:
+        if self.cache is not None and entry is not None and text:
+            asyncio.get_running_loop().run_in_executor(None, self._cache_store, request, entry, text)
+
+    def transcribe_bytes(
+        self, wav_bytes: bytes, source: str = "", timings: Optional[Dict[str, float]] = None
+    ) -> str:
+        """
+        Converts raw WAV bytes into text via the configured backend while
+        emitting detailed diagnostics. `timings`, if given, is filled with
+        the epoch time of each stage (see TranscriptionRequest.timings).
+        """
+        request = self._build_request(wav_bytes, source, timings)
+        cache_entry, cached = self._cache_lookup(request)
+        if cached is not None:
+            return cached
+
+        backend = self.backend
+        model = request.model or backend.model
+
+        def call(timeout: Optional[float] = None):
+            request.mark("sent")
+            started = time.monotonic()
+            ok = False
+            try:
+                text = backend.transcribe(request, timeout)
+                ok = True
+                return text
+            finally:
+                self._meter(request, model, started, ok)
 
         try:
-            result = self.client.audio.transcriptions.create(
-                model=self.model,
-                file=request.as_file(),
-                language=request.language,
-                temperature=request.temperature,
+            with self.using(backend):
+                if backend.remote:
+                    text = self.scheduler.run(call, request)
+                else:
+                    text = call()
+            request.mark("received")
+            self._log_response(text, request)
+            self._cache_store(request, cache_entry, text)
+            return text
+        except SchedulerError as exc:
+            logger.warning("Transcription dropped for %s: %s", request.request_id, exc)
+            return ""
+        except Exception as exc:
+            logger.exception("Transcription error for %s: %s", request.request_id, exc)
+            return ""
+
+    async def transcribe_bytes_async(
+        self,
+        wav_bytes: bytes,
+        source: str = "",
+        timings: Optional[Dict[str, float]] = None,
+        max_age: Optional[float] = None,
+    ) -> str:
+        """
+        Async twin of transcribe_bytes; for OpenAI this is the pooled
+        AsyncOpenAI client, awaitable straight from the event loop.
+        `max_age` replaces the scheduler's max_chunk_age for this request
+        (counted from timings["captured"], else from now), e.g. for
+        uploaded files, which have no live audio to keep up with.
+        """
+        request = await self._build_request_async(wav_bytes, source, timings, max_age)
+        cache_entry, cached = await self._cache_lookup_async(request)
+        if cached is not None:
+            return cached
+
+        if self._batched():
+            text = await self.batcher.submit(request)
+        else:
+            text = await self._transcribe_one_async(request)
+        self._cache_store_async(request, cache_entry, text)
+        return text
+
+    async def transcribe_stream_async(
+        self,
+        wav_bytes: bytes,
+        on_partial: Callable[[str], Awaitable[None]],
+        source: str = "",
+        timings: Optional[Dict[str, float]] = None,
+    ) -> str:
+        """
+        Streaming variant of transcribe_bytes_async: awaits
+        on_partial(text_so_far) as the backend's text deltas arrive and
+        returns the final text. Falls back to the regular path (including
+        batching) when the backend or model can't stream; a retry restarts
+        the partial text from scratch.
+        """
+        if not self.backend.supports_streaming:
+            return await self.transcribe_bytes_async(wav_bytes, source, timings)
+
+        request = await self._build_request_async(wav_bytes, source, timings)
+        cache_entry, cached = await self._cache_lookup_async(request)
+        if cached is not None:
+            return cached
+
+        text = await self._transcribe_one_async(request, on_partial)
+        self._cache_store_async(request, cache_entry, text)
+        return text
+
+    async def _transcribe_one_async(
+        self,
+        request: TranscriptionRequest,
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        backend = self.backend
+        model = request.model or backend.model
+        if on_partial is not None:
+            send = self._metered(
+                request, model, lambda t: backend.transcribe_stream_async(request, on_partial, t)
             )
-            text = (result.text or "").strip()
+        else:
+            send = self._metered(request, model, lambda t: backend.transcribe_async(request, t))
+
+        def call(timeout: Optional[float]):
+            request.mark("sent")
+            if on_partial is not None or not backend.remote:
+                # Two streams would interleave their partials; don't hedge
+                return send(timeout)
+            return self._hedged(send, timeout)
+
+        try:
+            with self.using(backend):
+                if backend.remote:
+                    text = await self.scheduler.run_async(call, request)
+                else:
+                    text = await call(None)
+            request.mark("received")
             self._log_response(text, request)
             return text
+        except SchedulerError as exc:
+            logger.warning("Transcription dropped for %s: %s", request.request_id, exc)
+            return ""
         except Exception as exc:
             logger.exception("Transcription error for %s: %s", request.request_id, exc)
-            return ""
\ No newline at end of file
+            return ""
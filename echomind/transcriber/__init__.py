@@ -1 +0,0 @@
-from .transcriber import Transcriber
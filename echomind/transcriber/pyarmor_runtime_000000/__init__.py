@@ -1,2 +0,0 @@
-# Pyarmor 9.2.1 (trial), 000000, 2025-11-28T16:47:03.227867
-from .pyarmor_runtime import __pyarmor__
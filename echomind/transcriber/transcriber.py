@@ -1,3 +0,0 @@
-# Pyarmor 9.2.1 (trial), 000000, non-profits, 2025-11-28T16:47:03.489461
-from pyarmor_runtime_000000 import __pyarmor__
-__pyarmor__(__name__, __file__, b'PY000000\x00\x03\x0b\x00\xa7\r\r\n\x80\x00\x01\x00\x08\x00\x00\x00\x04\x00\x00\x00@\x00\x00\x00F\x1f\x00\x00\x12\t\x04\x00\xaa\x19\xb0N\x9c1\x1a\xf5\xa1\x07\xce\xe4\xdaNN\xc0\x00\x00\x00\x00\x00\x00\x00\x00c]^\xdem\xc1\xf0y\xd7\xc0\xb3\xf3&;\xd1a7\xcc\xb6\xf2D\x06\xfd\xf2\xb6\xfe\x10b\x9f4\x8d\xfe\xb6L\xec\x9c\xcd\x8d_h\xef\xd0\xc4\xa1\xbf\xa3a\x99\xf3"}^\xcfjkF7d\xb8d\xda\xaaO\xb7eW?4\x130\xea.\xbd\x95:\x00i?\xc5\x9e\x89\r\xbax\x88\x00\xdf\xcbU\xa5!\xad|:\x07\x13\xf5`\x02V\xa1\x8e/\xd0\x99\xce"\xf6\xcb\xe9[\xbc>\x06V\xce6\xd3\x82\xbeF\x88\x1eI\xe7+\x14*\xda\xff7\x98#\x8fs\xa1\xee\x0c\x97\xc6m\xb8\x91\xf4\xf5\xcc\xa0\xd2rC\x85\xf6\xd3G\xa3\rdJ\xa7\xa4\xe27\t\x97\xb5\xd4\x9e/k^\x9b\x00)(8\x11\xd0\xff\xe5]e \xc1\x01o(mQOJ\xccs\xfb?LU\xa6\xcb\xf2`\xa1\xc6\x8d\x9c<8ZAly\x9d\'B\xf9\x86%\x07]\x80b\xfc\xa5\xd1\xb2\xc1L\nL$\x86\xdc\x98jc} \xbd\xa5Z\xd7fS\xf6\xef\xb4\xdc\xe52\x17\x80\\#\xe4\xef\xcf\xdf\x07n>\x9c\x9e\x930-7}\x9d\xf5\xfd\xa1a\xa34\xba\xd04\xcd\x83\xb9bq\xd4z\x18\xfb\xde1\xfd\xec\x1b\x93\xc3\xaaS\x07\xa4\xb1u\xc8Ot\xe5\x06o\xc6\xfe\x8fG\xd4\x1a\n\x9e6\xfe@\xf8e\xfdf\xe9\xfbVnQ\x06\xf6\xb2\x86V|\x1ei\x88\xd3p\xb1h\xc1\xdd\x8b(\xfbT\xad\x17\x9a\x8a\xf9\xc6m\x97\x19f\x1b\xff\xc8\xc3\x81}=NP\xa0\xc8nh\xe7r6%\xad}_\xca#\xf1;\x0f\x8f\xafl\xb1h\x10&\xbbF1s\xce\xe6_\x1bY\xc9\xd2\x06\xe7=\x04\xe1\xf7a>\xc5\xbc\x845(\x9f\x9e\x84q\xe0\x84\x80\xde\xc8\x95\xe1\xbayc7\xb72\xc2\x0b\x85\x87\xfa\xdc#%\x8eI\x11;\x1c"\x9aJ\xb0\xf2\xef)\xda8J\xb0\x83\xa6:\xe6a\xc5(\xf3\x87\\=\xd8\xe0\xbb\xef>\x01kG\xef\x16\xcd\xd2\xc5.\x06\xe7I`\xed\xa8\x04\nP(\r\x91\xba\x864\xce\x1b\x1e6\x1eg\x95|\x99,\x96\r\x99\x1d\r]9z\xd1\xb4U\x8b\x1c\x9e\xe9\x1f\x96\x13R\xd1\xcfr\x99\x93\x9e\xf0z\xae\xcd\xf6\r\x82\x94\x86j;\x11\xf2\xe1\xc1\x91\xb8M\x7f\xb2D\xdfh\xedB-\x1b\x97G\xbb\xb0j\x84\x0c\xdb\x03g\x108\x17\xbcf\xfe\x1c\xa9t\x10\x19kv\x87\xb1=\xe0\xde\xc6W\x995G\xb4)\x03T\xa0\xfb\xa8\xaaT\xc1\x7fph\xa3\x0e3AQ\xf6\x1c\x99\xce\xbaQM;\xa1\xc3\x04}\x0c4\x03\xaf}\x11\xb5\xf0}A(\xc4\x8a\x82\x13\x8e\xbb\xfd\x8c,\xe7\xe3\x03\x8d2a\x0c\x9a\x8eE\xf4\xb8\x0f\xc4\x12\xe7#rh%$:\xea\xfb\xa0\xedT\x7f\r\xb3D\xe5\x0e#\xf7=\xa9/\xbc:\xe5p4V]\x10\xab\xb3\xfe \x9dw\xc8\xcd\xbaF\x0e\x90\xdf\xeb0\xdc\xaf\x7f\xbc\xb5+\xf6\x8b\xe9t\x8cx\xa6V\xe5"\x0coG\x8c\xf4\x9f\x1b|\xd4&\xfe/\x91\xe83U\x1f\xfd\xa5f>\xd5:\xbaj\x85>\xcb\x87\xd3tPhz\xbf\xf2\xe2&\xaeW\xe9\x12\xc6en\x8e\xb5\x90m6R\xcf\xb4&\x1f\xc2\x89\x03%#g{\x81\n\xbbC&\x8b\xfad\xe6\xa0k.\xd9\xce-\x9a5N\x94i\xa3~\xf0\xb2\x80\xb2\xa6F\x11\xc8\xd2Pl\xb9\x04\xce\xb5{\xcaw\x12\x1a\x8aEC(\xef\xd6\x9b\xcd\xce\xed\xc5\xdd\x98WP\xeb\x15\xc1\xe8@-\x14\xd6\x04\xd0{\xec8\xdcHa\x0f\x99EY\xf1E\x89\xb9c\xa0\x07\xd8\xef\xc0\x18\xe51H\x9e\xf6%~\x81D\xcb\xcd"\x1e\'1\x1b=\xf046\xd9\xe9\xde\x01\x04-\x95N\xd2\x94aT\x7fX\xc3\x13B\xbdf2\xb0\xef\x0b\x80;4\x1ce\xe6\x83(w9\x9d]\xa1\xec|\xf4\xa5\xaayF\xc9\xebg\xb8\xdf\x10J\xd9|\xc3\xb8l\x96\xe7\x1c\xed\xf4\xf5\x0f\xef\xef\xcc\x1dmv\x92\x87\xd9\xea\xff\xa0<\xa25\xab\x1b\xc5\xdf\xaaL\xbe6\xc1\xd5\xb7\xb0\xe0\xcd\xa5\xc2\x1a\xe4{\xbd\xa7\xa7\xe9!\xe2\x8f\xad\t\x1dXt\x12^e\x8bldg\x98\xb2\x05\xc2\xa7\x02\xa0\xef\xb3XA\xea<\xd00P\x98\x19\xc7Jkb\x93\xf9\x15\xa8\xca/\xec~\xfd\x83=\xac\xe5%>\xc8\xdc\xdf\x00a\x1f\xf1\xc7\xccj\xef\x97q\x0f\xc5:\xba>\x99\xf7O\x16`\xc5\xf1R\x0e\xd55\x1cd\x8a\xdb\xc7T\xe0\xad"o\xc9\xc0;\xde\xaeqD^\x14onh\x80%\xda\xa3)\x95O\xc7\xcd\xe5\xb4\x1d\x16Y\xb4\xa3\xa5\xfb\x9b[\xdc\xdc\x1a\xf5\xc71E\x98\x1e\xb9\x84\xc7\xc1o\xf0\x17\x0e\noG+p\xbe\x00\xd7\x82\xb3\xa3\xf3\x13\x17\x87U\x1e\x9c%1\xe5\n$0\xa1@v\xcaV\x12\xe8\xce`\xcc\xe7U\xa5\xdc\xb0WC\x1d](\xdcx\xaf\xab.\x9e\xc6D\xda\xb7zfo\xa6\x97gi\xef\xc3\x10$\xa9=\r\xf4\x14?l]\xcb\xc6\xb4\xb8\xb2\xbd\x8c\xae\x80PB\xeb\xba\xa7\xf8\x81"1r\x16w\x9f\x9d\xf6\'\xa4\xef\xc4\xe8\xc1\x82\xf3\xfcXF}\xe85\x9d\xd5\xa36?\xe7\x96+\x9d\xe5`i\x97E\xc9\xec\tUR<\xe1\n\xb7%\xabm\x05\x15\xcb\xd5R\x05\xde\xc4\xd1\xb8\x0e\xfcw\xbf/I\xa5\xc4d\xdc\'u\x17\xda\xf4\x1d\x00m\x88^"!\xee\xf9|\xe0\x99\x02\x1c\xce\x1d\xdf\xf2V\x9a@<\x0b\x7f\xcfL\xd18\xf5<"\xe0f\xc9\xabE${\xc3^_\xe9v\x98I\xb6J:z\xa2\xa1\xaa\x80//\x8f\x15\xc4]\x17\x8a\xab.\xb1k\xe1\xf3V\xcb\x16\x9b3%\x1d?:\xd3O\xe2\xd9[\xe3s\xacFIy\x81\xbc\x1d4\x1b\xbe\xd5(&r\x0c\x90\xef\xa2\x18l\xa2\xea>Q~\xbe\xa3\xff\xee\x85\x9a\xb8\xe8\xc6u\xcb]\xfa\x9cU\\1\xc76\xae\x91\x1c\xd0\xc0p\tE\x89\x86\x1f]\xed\xc5i\xae\xe8\x06\x0f\x11&\xa3\xea\xda&\xdcd\x0b\x04\x9b\x9c\xbbj|Wg\xc5\xd2\xdc\xca%3\x0b$x\x1d4\xbb\xc7\x13\x01\xcb\xc1\xe1\x1b\x0e\xd4\xcd}\xd6\x81|\xd0h\x15\x0b\x9a\x99\xebZe\xbb\xeaC\x08u\xbc\xb8@$\x82\x85\xc4\x9e|\xe7z\xd4\x93l%\xf68|\xd7\xaa\x9e!\xb6W\xab\xafc\xf0\'#D\x90f\x13\x02\x12\xf9a%B\xecb\xbf\xe7\xbf\xa3@\x86\x0e\xd4\xcc\x15P"\x1d\x8e\xf2\xb6*\x12\xca\x06\x0f\xef+N\x9e~\xc1\xdfzk jl\xba\xbd/\xf9\xbfwV\xd6\xbd\xfc\x02\xe6Q\x89\xbd\xe8Y\xe9\xd6\xa5\x0e\x89G\xbd\xe2\xd1\x923aL\'\xbe&\x0c\'B\xceB\x0f\x01\x8a\x99\xb8\xfe\x9e\xf8\rb\xcf\xce\xae1\x15\xc3bKPAoo\x15U\x94\x14\xfb8\xf69\xff\xa6\xcd\xec\x87\xf6\xc4\xa1o\xaev(B\x95Fo\xce\xc3\xa0!{\xdfS\x1d\x90r\xc88\x87\x16\xc7\xcf\xd1\xc8\xeeI\x0f}z\xb6x4J\xb6\xe7\x10\xdd\x12\xc6\x05\xb0\xac\xf7\x87\x15Q\xa9\x02~\x9b\xc75\x93D\xef\xd2\x8dqz\x81}\x0e4\xfa?\x9e\xc1\xcc>\xedz\x1b\xaa\\\x9c\x1d&Th^0\xd4w\xcf\xe2\xd3RB\x8e\xbd\x0el\xc5\xa1G\xd3\xe0o\x9b)4\x9e\x84x0En\\ \xff-\xb3\xd24l\xc0\xa5\xf0\xb5^F\xac\xa8]q\xa7\xd4\xb6|\xff\xc6\xa7\xe3X\xd3\x86\x16\x99S\x0c\xe8W]+9\xe4*\xd3<!\xc2\xf7TO\xc4\x0cP\xc0\x8d\xb1KT\x0c\x0f\x15,k\xf5\xfa\x8a%\xc21\xc3\xe2\x070\xf5\x8aT\xf4\x80\xf1*\xe1\xb2\t\x80\xac\x0e\xe6\xf5\xa5\xb7qk~\x0c\x81\rb\xa9.\x92\x11\x8c\x1f\xa5\x8d]\xab\xa3J\x19^\x12\x0f(\xcbp\x860\xb6\x92Q\xa8J\x01\xd2\xcaT\xbdh\xb1T\x90n2\xd7\xbfO\x93\xb4h\xac+\x0e\xca\xff\xa0\xf0\xe3.S\xc2\xdf<]\x9a\x01\xfa\xc9\x0e\xdb\x83].\xb7\x1d\x95(^`\xc2b\xa8q\xe1\x95\x94\xff\xe0)2\xdb<\n\xde\xf7r\x03\xab\xf3_,\x9d9\xfe\xd1|B\x99\xb5\x94]t\xfe\x033\x1c\x96l\xf1\x838\x18&\x9d\x0b\x87Hze\xe8\xc6@\xfd\x8f;H\xe0\xc4\x91\x10\xe8\x9e\x10\xc5\x822\xf5\x94\x01n\x81\xb1k\xe8\x02mD\x18\x14\xbev\x83\xd5;\x1a\xa3*\xc180\xf7]\xef\x19N\x82Fa\x11\xf1\x11\xfcy\xe9=\xe0 \xff\xe7\xcf\x18\xa1$P\xe4\xfe\xb6\xde\x99\x17}|\x8a-<\xd7\x95\xad\x8d\xe6\x1e\xdc\xebc?x\xc9g\xbf\xe5\xec\xaf\x1b\x94\xe4\xa1@~\x9b\xa8\xf4\xc5S\xf9\xd0\xf2\xec$\xb6f\xa7f\xb7\x12\xab\xf3\xce\xee\xcb_\x8d\x97E\xdd\xe0\xe6\xdb\xc8\x91-\x0f\x1d\xfb\x9e\xb5\x15\xa4w\ri\xc8W\xd9\xc6\xa2\x12IC\x00\x12*\x80\xd1#\x03R)\xde\xd9\x80\xea\xf9\x92\xabt\x8e\xa3\xbd:\x97\x0fe\x03\xe7d\x01\xfb\x808k\x16\x9a\\cf6\xf50\x0b\xd7]\xc4\x01Y\x90_n@\x08h|\xc6\xbd,\xd0\xc7\x0f\xafY\xc7\xc3\xd7\xdar\xae\x01\xaf~\xca\x16\xae\xc1\xdb\xdeQ\x13\xa3\xe4a\x9369\xdc\x9e\xb0@LNk\xf6\xbd\xab\xf2\tr\xe6\xf9r$\xbd\xde\x1d\x10\x89\x0eM=\x0czk\xbb\xff\xec-r\x07\xea\x01\x0ba;\x18\xbf\xda2/\xbb\xf4g_\x1f]:\xa4\x92\xa3\x90\x0b\xdb\xc0c|\xb2\x95m\xc6\x17\xa9n\x1d\xeeg\x08k\xca\xca\xa0\tb\x89w\x8b;\xda\xee0\xd0\xf9\xd3R\x0c\xa0w\xf4#v`\xbb4\x82A$~\xbfgu\xcay\x12\x98\x84\xc5\x10\xeb*4m\xb6O\x1aN-!.\xbfl\xb5\x98\xa1\xf9\x90@dc\xe1t\x0eAn\xff(\xc3\x84+y\x82\xd9\x93\xa7\x92\x15\xde(k#\xed\xc2\x91^\xe6\x97\xa6}U\xea\xe8\x88\x06C+P\x9fh\xf6\xe8\x9cZ[\x9dGD\x9bL\x02/`\xa2\xafz\xb1\xf2`\xd2\xd2\x9e\xb8\x8cd\xb7\xb4\xb1;\xaaIH\xef\xc0\xb1\x15\xf8R\x079\xea\x0e\xf1Z\xf1\xda\xc0\x02\n\xd9\x99\x9f\xa5\x81\x98\xc4\x8cS\x16\xcf\xc2\xe4\xc2\xa0\x8bi\xf8\xeaQ\xdb-I\t\x00+\xc5\xfd\xe9\xc0\x03\xeb#\xec\xe5\xffJn:\x1e\xa3\xfe:\xc9\xd5C\x92\x18V\xa8W\xd1"Q\x9c\xd5\xeb l\x80\x98\xb9HC\xa9L4\xe7\x1a_j5Q;\x9f\xc7\xad\x9b\xd7\n\xa8\x18\xd9\x99k\xe9q\xbc\xeb\x0eK\xaf\x0e\xb8\x9d\x04~\xfb\xb4i)\xec\xfe\x18\x0b\x8b]\xa5\xd4\x80vZ\\\xa6`\xe8m\x97-b \xfb\xcb\x90\x10(\x9a\x8d\x97\xb5\xd1\x84\xf5\x11\xc4d\x94m\xba\x98\xbc\\\x93>\x91\xd1\x8b\xd7\x03 \x0c\x97\x01\x00D\x1e\xd9\xa2g%\xa8\x99\x83;P(2\x97\x07t\xa5\xcai4\x0f\xfc\x1aS-|@\x9c\'\xf4\xe4\x00\xfb\xc7m\x00\xca\x033\x9d\xff\xda\x02\xf6\x89\x9c\xbc\x8f\x86#\x88hF\xe0\x13\x9fj\xdc40N\xd1\x8c\x07\xd4\x13\x0c\xdc\xcb\x8b\x1fa\xa2\xd6\xc7J\xb6>^X\x82x\x83\xd8\xfad\x91\xa2\xad\x10\xdb\xee\x13\x8f\x10\xe4iG5YC\xda\xb3=\xca\xc5\xb5\xc1zu\xe9_\xfdG\xd2\xf6ILa\xa1O\xab\x9cI\xcf\x8b\xa9<T\x94\x19r\xbe\xcd\xfc\x1d\xec\x1c\x96kY\xd4\xdc\xde\xd6\xccN\x9d\x16/mWw\x80\x0c\xa8_\xd8\xe1\x06\xdd,\xb3\xa4tF\xd8\xa4P5GN\xbb\x0f\xa4VV\xb0\xfe?Bf\x9f\x89=\x07\xa1\xcc7`\xfe\xed|B\xcfBG\xfc\xb1)\xb2\x96\x88\xdc\xc9\xd0\xfes\xb6\x100\xe6kD\xc6\x83\xfb\\\xf1c+\x01;\xac\x02\xb1|\xfa\xc4\x03e\x1bi\xb8`\xcabU\xd2N.t\x1f\x03\xc3\xfc\xd4\xcb\xf7T\xfa~,\xefU\x1e\xbe\xaf\xb8p\xdevnc\xb6)\x18OlxD\xc5\xa1\xbb\xf8K81\xe9r\xe4\xc5\x05\x8d\xd1\xc2\xa4*\xe9\r6\xfc7\xe9h\x92\xc7\xd9\x0b\xd9an\xf7\xcd2\xea\xbb:J\t\x13_\xbc\xe6\x9a\xbf\xc5\x8b\xe19>\xb7\xec\xf2\xd6>\xb8L\xd5\x97L\x0fv\x0c\x0b\xb5~\xd00\x8f\xd5\xee\x99,\xba\x97\x92\xff3N\xc3\xd2\xcb\x16z\xe8\x13\x9b/\xac\x9d\xf2l\xe3\xadE\x08^\xae\xb1W\xa2&\x8f\x1fj\xe9\xc8\x93QeG\xd0\xc6\xca\xb8@u}\xf6e\x8aol>)\xf4\xa9\xff\x18\x10F\x05\x0b\x1a?\x91\xeei\x15\x88R\x0f\xfe[\x9fh\xb0\x13\x11<\xab\x83\x1fh_\n\x02\xde^\x84u.e\xdf\x8c)zs\x7f\xb9\xa0\xa8v \xced\x1b\x83\xd8\xc3\xfc_\xcf\xf6\x14\x94[M\x960|\xe35\x88\xc3\x1d\xa0\xd18L\x11\xf99\xbf\xff)\x86&H|\x0bBjovD&\x03\x85\xaa\xdc\\`\xd5EK\x02\x94\xd0$cb\x8f\xa4*4\x0eW\xf2)R\x80\x87\x92\x7fsC\xfe\xba\xfc8bFy[\xdf\t5\x0f\x94U\xac`\x01$\xeb\xa0"||\xec\xedr\n\xc9i\xe8\xab.a[\xf2\'^ \xe1\x1aM\xec\x90\xee\xc1\x81\xc4\x82W\x9c\x00R\x8b\xbd\xba\xebt\xf3\xadi\xbe\xfd~B6\xc1\xab\t\x80V\x8a<\x94\xda\xe3\xe3|\xad\xec\x9e\xcbp\x88\xd4\x12x\xabGu\xb2\xd3}\xa7\xd5w\xd9\xae\xe61\xf5\x106h\xebfx/\x9b\xc6\x02\xbf\xaf-6R2d\x04^\x02\xbe\xd4\xce\xe8f\x17(|9\x8bJ\x07vO\xe3\x1f\xc2\x05\xbc\\tl@\x0c\x1d$\xf5\xc0\xabH\xba\x00A\xe29\xed\x99\x8f\x05\xd5\x89\xfe\xe0P\xaf]\xd3\xe6\x1e\xea\x94\xdf\x08\xd3\xaa\x01\xa2\x137\x92\x92u~i\x94\x17\xefO\xaf3d\x9e\xac\xb8o\xa8\x15\xa0\xdfl\xf0\xdaX\xc2\xa08Y\xb7G\x07\xbd\x93\xb4\x88#\x8c\x0eWk@\xd4@dF)\x0fWf\x0f\x1c\x1a\xf0\xf8BHR)\xa9K\xb1\xe8+1\xd8?\xf7\xef\xf29@\xfc\x068M\xae\xc70E\x88\x9d1]\x8f\xef\x9a\x1f#\xce@\xa6)?\x8dif\x0c\xcdg\x1e\xd6Qc\xf2[\x85U\xed\x08\xfd\x81\xe9\x94\xd7\x97\x81\xee+\xdbbj\x18\x11\xad\x16\x8d\xdc\x11\x05\xe1p\xc3t\x82\xa7i\xc7x\xc1\x0e\xb1\xb5\xc4R\x8b\xa8\xab\x1e((\x1e\xbbNmT\x1a-\xb5\x04\xf4\xd2l\x9e\x0e\x81\x0bk.\xf7@\xbaC\x07\xacU@\'8\xed\xa5$\x80\x85\xf4\xf6\x9bg$\xeaL\xe0U\xccN\x17\xb5j\xaa\x9e\xcf\t\xf4$\xe9\xcf\t\xa6}$$\xcc\xde\x82\x89;\x04\xe9\x89\xfc\x8b=\xa90\x9412\xb0O\x9br\x00\xdcH\xc6\xb7u[Wu\x16\xec\xad\xb0\xb1pl(6\x84\x18\x8d\\&"\xa2T\xe07\x9d\xe5\xd8\x01\x95\xf9 \xb6\xcf\xac\x89Gx-\x94\x81tkql\xe3E\xd5\xa4s\xc1\xb7\x83^\xa7t\xa7S\xbc\x8d\xce\xf9\xbc]T7\\\xe6U\xecPz\xd3$\xddZ\xe4\xb1\xa3\xce\xfd\xb6\x92\x068\xf5\xac\xb3\xc0y\xdd9\xeb\xa4\xb1?\xc3NK\x10[g,\xee\xc6:s\xd8|\xaa\xd5N@\x90\x06\xd4\x10\xab1\xe5\xc4\xb1\xae\xea\x0c\x1e\r\xd5\xcf\xe9\xf3\x0cP\xa0\x10\xe9\x13\x8d\x1c\x80\x03^6C\xf0\xd6J \xcf\xb6\x17Ag\x93\x1eC\x86\x14\xe0\xb1$v\xd5\x1f\x06\xf6xU\xf3\xe2\xf3\x0c\x8a\x06GHU\x90R\xdc\xa3\x8bER\x15r\xaf\xf5\x9e\x11\xd46\xc6\x85\x8d\xd6)\x9c\xc9.ek\x83\xf8x\xd9\xd2\xd4\x05\xd4P\x1d\xbf\xf6\xfcA\x9do\x0c\x06\xeb\x0e \x99]\xc0\xb0\xf4\xf6\x17?m\x10\x12\xbfid\x9bU \xb1\xe2\x95\xcb\xe9\x15L\xb5\xd7r\xe0~~\x1a\xa8X\xddDt[q\xba\x8c\xa7\x13\x99\xcal\xf0\xbb\x88\xe6\x84F\xc6\x0bx\x94W}\xfdao\x9e\xc4\xf3\xdb\x8d,_\xfb57rj:\xca\xa5\xfd\xfcM\x9eVC\x83\x10\xc9\xff\xa5\xb6\xf4KB\x07\xb6\x95\xad\xbe]\xde\xa6\xa3\x88~\x83\xc5$\xdb\xfb\xcdS\xb1&,U\xb0C\xea\xb8\x9f\x1b\xa2b\xed\x90\xc8\x94\x08\xa4m\xb4b\xb8\x06\xa0\x10J\xe5\xb4\xf3s#\tt\xf1\xe8\x03\xa8t\xbbn\xd4^\xaf\xdb\x8e\xfa\x1c\xc0L&\xabx7\x08w\xa9\x9c\x87\xe6\xb8\x12c\xf3c\x91\xe7\x80\\\xc7\xd93\x8d\xe8\x8cwI!^a|\x1f<\xf7\x96/\xd1\xd8\x11 \x8b\xf1\xc8\xb6\\3\xe6\xbc\x0f\x19t\\#o\x87h\x9e\xf3O\x8dz\xd1\x93\xc5\x99\xe8\x01~\xd3\xbd\xfd\xd4\xca\xc4\x01\xb5/\xf2j\x19\xc2\xec\x06>\xd4<\r\xb4m\x8f\xad\xa5\x83\x18B\xcdUZ\xedi\x9a\xd8!\x05I\xec\xfc\xe3\x8e\xaa9{\x16W\xda\xb1\xdf\x1c\xcd\xc0+\xa6\xc6;y\xae1\xd6}\xdb1\xf3\xab\x17\x9b}\x19\x13\xc2\xd6\xabm&DHY\x82L+#\xc0\xe1\xe6\x02\x99\xf4\xb1\xb8P@p%N\xaf\x99Z\xca\xe9j\xd7q\xdd\x87\x16\x04y@"\x90?k\xe1\xf3U3\xd8\xf6c\x9b\xef\x97\x8d\xc1w\xcb\xba\x84\xcf\x89\xf1\xa7\xbar\x1c\xdfO%\xb6\x11\xca\x14\xe6\xe2r\xa8\xa0d\xb8\xd4\xf7\'`\xe0>\x17c\x075\xb5\xaa@&\x97t\xd6\x9dT\xd0\x04\xfc\x93\x1c\x15=\xee\xbav}\x0e+k:\x08\xa8\xf2\xd7\xb2}g\x9ak\xe7\x94\x0b\x9aI\xf4\xf7\x9b\xb5\x8cZ\xb5\xb6UN\x83\xd6\xb7\x1d\x9b\x864\xc2\x8e\xc2\x17\xdb\xa8\x85(\x93`\x8d\xa7pI\\\xa9\xbd;8\x1c}\xe2\xff\x88\x9f\xa8$!\xcb\xc0\xd8\xbf\x87H9\xd7\xed\xd3\x12\x96P\xebT\n\xd1S\'!\xed\xed\xc2\xaa\xb3\x02L{\x8e\xa6\x92\xe7y^\x89\'a,\xbd\xdf\x82\xde`\x03\\@O\xea2\xb8\xb0\xb3;\x89\xa7AWS\x04j\xd3\x9eP\xebn\xf2r\x11(z\xfedR\x85\xea\xa9}\x93\x06Fn\x89:\x11\xd4\x0f\x86KW\xf3:&\xfc\xa7sc.\xf0\xbd\xd3\x95N\xac\xd6\x18\x03\xb8=\x07t\xfd\x97\xcd\x15?E\x97\x87V\xf3Fx\t:K@TG\xf4q\xab\x0e\x85"5\xee\xcb\xda\xe3\x83%\x9d\x19\xc6\xc1\nx\xad\xbc\x1f Q)\xf2\x87\xde\x92E\x18R\xe1X\x84\x1c\xd4G\xc2\xbbLT&\xc1!\xdeE+G\x1c\x8c\x18>\x17\xf6\x1df\x0c\xb9\x96\xbe>\xf7\xde\x9f\x8dO)\xa5\x88@:e?S\x17Y@u\xcf\xe8j\x11\xf6\xa6`\xc5\x17\xd25d@#\xd7\x0e\xf1#7\xf7|\xa5\xa1\xa9f\t\xa4J\xf9YZ\xd2F\x1dJ\x7f\x15\x14\xc2\x805qX\x84oi\x94\xb0,\x1eL^X\xbf\x81-oGJL\x1d\xc9C\r\xe5\x88I-\xfd\xb7\xce$\xc4\n=\xe6\x84T#-h\xf9\xa6\xdae\xf9\xf7.\x10\x89\xa2a{\xec\x00\x1c\xd0\'\x1a\xdf\xd8\xd0\xb1\xff,\x03\x1a\xf3\xb8\xbf\x9e\xce"\x9d"=B>K6\xad\xf0\x1b\xee\xc7\xd1\x86O\x80\xe9\xdd\x12\xe6\xcf\xcfCbN=FE\xb5%\xb12\x05}=\xdfK\xac\x155\xb3?X\x1b\xff\x03\xc0\xf2\x8aQ\xf7\x96\xda\x04\x99|\xc2\x85*\x8e4\x9f\xd9\xf5\xf2\xa8\xdfO\xe0;\xaeo\xfe\xb3Yel\x8bQ\x82\xb5\x9f\x9cg\xfcg\xb9\xbd\xec5]N\xe6]Snx\xaa\xb0v\xa2\x0bg/_:;\x16>\x1e\xef\xb3$C\xc0@\x80\xf3\x05\xe9\xad6,X\x0e\x08\r\x19\x0b\xb6(Vw3\xf5\x1f\x0c\x1a\xed\xc1~\xad\xec\xc0\x82UJ\xcct\xdb\xb8\x14\xec\xd4\xb0\xf0\xeb\x8b#\xd3~\xb6/\xd8I\x15\xc2\xe0\x17?\xf34\x90=\xe8\xe8z\x81\x86^;\x9b\x9d\x07j\'\x17\x85X4\x00\x8c\xa3\xf9\x1fb\xca\x1c\xab@\x7fZ\x1d\x0f\x96\x02\x10\xd4N}\xa2c\x1c\xc8\x1c\x16\x0f\xd8|.\x88KX\x87&\x9d\n\x9f\xed\xf1,f\x80F=\xeeJ\xc4\x17\x8e_\x95\xc6\xe4\xb3\xb1\xcb1\xacsY\x12\xf1\xa9p\xfaK\x82\xcd\x0b??u\x06\xd0\x17z\xc1\x15\x9c\x86\xc9X\x1a\x9e\xea\r.\x9b\x00\xe7\xae\xe4\xb4\xa3\xbb\x98\xac7K\x13\xe4\x0e\x16\xb64\xea\x10\xe6\x90%\x84\xa3\xe7\xa0\x0c\xd0\xb9\xff\xdf\xbd\xab6n\x83?H\x05\x9a\xb7\xdfq/\n\\F\xdd\x83\xff\xf6y\xf1\xd9\xbc\x9f7\x15*\x1cv)\x99\x8a\xc6\xa5\xfc\xaf\x86\x0f\x08xL\xa5k\x98\xddl\x05\x96\x7f\xa5\xf8\xe8\xf6\xb9Vx\xdd\xf0\xbf\xdd\xa3\x93\x03\xb4\xc5X p\x19?\xcc\xa7\xdetM\'m\t\xa8\x81\xe2M\xe2-\xf8\x8c\xf9\x1a\x1e/W\x0b\xd6\xbe#X\xd3\x1a\x98\x1dF\xf3\x9a(\x10\xc9[\xd8\xdd{\xae\xbf\x1c\xb6\x81\xfam\xfd\x1e\xaf0T\xa2\x7f?N\xc8u\xf0=\xaf\x087\xbb\xa3\xf8\x83\x0f\xb8?\xad,\xf8a\x7f\x1a\x8f\xd08\x91\x99\xa2m\xb1\x176\x1f\xb7\xac\x8e\xb9\x15\xc1F\xc8\x83\x8c\xf6\xbb >=\x04[#\x1b\x8d\xed\xe3%\xcd\x05\x05\x07\x87O\x05}?\x8ep\xc9\x89\x02\xabC-\x12\xd8\x01\xef\xc3=\xb2\xb2\x1c\x18\x1b\x90\xdah\xb8\xee\xe2A\xc1*\xdd\xc0\xa2\xe9\x84\x90\xc8\xf2\xa6 \x02\x9e\xac\xc3\xe7\xceN\xc0\x15\x90\xa6\xd0\xd12\xc95\x9b\xcb\xf2K\xf9zs\x00$=\xe2\x8bkX\xae\x8aI.\xdb\x8b\xc4\xcd\x1eB\xd22f\xbad\x95\xe5\xad\xc1\xcb\x9a\x8c\x99\x17!\xe2\x83\x97\xea\xe1\xd3\xf3#y\xdfa|\x066"\x93,x\xd7\xd9\x0b)\\\xe1\xc5\x13JT$\xd5=\xf9\xf6\xc3(\x8aHv\x07\xd3\x95\xd2\x92Z\xfaqe\xaaX{wG\xb4\x8d\xad\x06\xab\xda\x18\xc7\x9b\x8c\x10\x9d\x96\xf9\xd3\x05\x8fd\xce\x0eJC\x95\x9ei\xaf~+=]\xd1\xfd#^\x14\xca\xffg\xb7g2\xa0\xd0\x97\x84\x03}\x1f4\xa1\xab\n\xfd\x88\xbc\xa5\xee\xba\x18\xefY\xef]\x19\x18\x18\xa1e\xc3m^N\xa3\x85\xe8i5_\x83:tn\x9ag7A\xde\x0c\xa8\x117\x114\xcaO\x9b\xacB\xb3\x97JWldC-(\xbe\xe5\x01<\xcebPJY\x0f\x85\x88M\xd5\x01\xd6\x08E\x13\x8f\xa3U=)\xe6\xd5a\xc1\xdb\x8b\xdd\t\x9b\xe4\xf6\x11!\x9b\xd3 \xfdy8\x88\x95{v\xe2\xf3\x97h3\x93\x16i|+\xfd&A~5\x06=f\t\xcc\x14\xd7\xf5\x9c;\x98\xfdK\x1f\xf6X\x1d\xa2n9\x9duY\xc5\xe1 \xd0\x8b\xc5L\x85\xef\x12\x11K\x00\xd1=\xe2\xfbv\xa4p\x01\xd5\x01\x03\x1d\xc1$U\x8cQ\xaa\x90\x0c\x97\xbe\xfa\x94q-\xdbe\x9b\x06\xa2\x7f\t\xba0\xb4\xd4s7r\xdf\x13\x93\xf7\xa3RQ\x17\x99\x0c\x91u-f|\xd3\xc3\xfb\xcc+\x16\xc1\xa1\x8f\xbcn\\\x07\x0f\x8c\x0f\xa7a\xb2\x10M\xc9\xe3#\x9b\xe0\xb4\xb8\xa1=0\xca\xc7\'a\xa0v\x06\x1a:\xc5\xa3\xbc\xb1\xa0\xe6D\xae1Uz7|\xbd\x88\x0c\xbed\x05\xa9r\x13PH\'\\u\xcc\xc8#\x81\xc5\x83\x04\xaa\xf1\x02\xd3>\xaes\xc2&\x18\x90\x91#\x1b\xf1dS\x7f\xf8\xfb\xc5\x1dE\x05\x89Lp\xd2\xa0K)\xfa`\x0b\x16\xc2\x94\xc3\xf4-D\x93\x83#\x88&\x93\xc1\x86\xdd\x9f\n\x13\xfcPoWwa\xbe<\x00\xf8\x10\xb8*\x8a\x9d\x92a\xf3KdZbt\xb8\xefl\xe3\x93=\t}ZRB\xf8\xaf{b\x0e\xb72OQn\x07\xe3\xa9:;#B\x16\x9a\xfa\xfaw\x92\xb6m\xab\x0e\x96\xf1Q+\xd9\x99\x95\x86\x8f\x8b\xce\x90\xea\xa8\xbf,\xaa\x83ZBao\xac\xb3e(\x05l6v;X\xcaY\x92H\xa2\xb0\xb0D\xb0w\xa1\xf4\x9c\xc7\x17\t\xa7\xcc\xcd\x9dq\xdf-k&\'\xcc\xc2\x02\xe6n\xde("`\x8c\xac7\x19z*\x0c\x99\xe2\xb4\x96\xab\xf8?\xe2\xe4\xaf\x87\xe5F\xb5\xac\'\xa5\xbeLX\x13\r\xa3\xd6<\xba,\xfb\xb1\xdc4\x0c\xf2\xe2\xfaAbB[+\xa53\xc6\xb0a(\x13\x19\xf2.9\xef7\xb8\xee\x88@a}\x9f>Sj_\xf7\xad\xd23%\xf4\x1a\x8c\xe6\xb7\xc1\xd6\xd1u\xfc^L\xde1nb\xa6\xbd\x9f\xe6c7\xdf\x05\x8c\x18\x83\xdc\x907]\xff%E\x18K\xabJa\x08\xc6\xd4\x18\x08\xbc\xe1w\x1b:\xf5\xde\x96\xfe\xc1@\xcd\xf2b\x9bc\xd2rI\xba\x12%\xbbj\xc2\xee\x1c6\xc0\xee\xdd\x18\xd2z\x89\xbdCwK$\xc7\xcc\xaf@B\x18\xd4D\xd7\x97\x1a\x9b\xd1\r0K\x18\x8b\xa1\xa6\xe2\x1b]%\xf5\xb0\xfc\x06\xb4k\xa8\x80\n~O\x8d\x87\xa7\xc8)\x08j|&\xd5;\xaf2\xe9F\x1d\xe3\\\xf0\xefCW\xbec\x85\xc85+\x82\xf9h\x07\x1eI\xbaJ\xa0v\xc3\x99\xf4#\xe5\xdaY\xa6,\x81l}\xff\nA\xe2\x008\xbd\x7f\xfc\x9b\xa6y=~\xf7zW\xe0U1\x80=\xb3\x9c\x08\xb1\xc9q\xbc\t\xefJ:\xf3gc\xeb\xbd\'M\xad!\xa1\x14\x9c^\xe4\xb56\x87\xf40\x9c8<\x83\x0f\xd1A\xe6vjK\xe2}\x05y\xf3\xcf\x16\x12\xd0)\x87*>\x8bN2#\xd8\x1c\x1b\xc8j\xeb\x98\xfe\x9f\x0ek\xbb^\xf1\x0f~\xb2ln]=\x81;\xe5(\x1b\xd4f*\xd3\x8f\xb5\xd8\xcb\xa1\x8a\x1d\xe4\x15n\x0fX3\n3\x11\x9e\x85h\xb5\xab\xd9$\xf5\x14\x0f\xa4\xa5\xa4\xad\xecw\xfaPB`g\xea-\x1d\x04\xeb1=3\xca\xa4\x1e\x16\xa83i\xc8i\xa5M\xe0$C\x1f\x8c\xb6>\x0f\xfe\xd0O\xa8\xfc7\x99\xdeROb\xb6Jg\xc3\xcb\x84\xa3\x97t\x08\'\xb0\xc9~\x12\xe0\xec\x0b\xbf\xe9\xbc\xafJ\x1b9\x07\x1b\r\x7fQI\xf4U\xd5\t8\xc4"2\xc7\x8e\x8c\x00Ep\xac\x1b3\xc0.\xe1h\xc99\x8a\xbf\xd3t<\x8dp\xe9A\xce\xf2;\xc6\xe5\xaf/\\\x1a\x82\xbb\x9e\xf1=\x97\x80\xff\x825\xff0\x83\x02\xbdv\xc1n\x1c \xcd\x8c\xaf\xa2\xb8\xf2\xf6\xed\xe3\xec3\xfcF\xd1\xf9\x8fTY\x9c\x965\xf1\x8b4\xd2\x8c\xe4Z\x08\xa4H\xc7uW\xf6!\xff\xb8\xf1\x9f\x91\x9e\\@\xc2u\xe2\xa8\xe5\x91\xedz\x8d\xe0\x99\xe2n\xf3\n\xd6 7\x9b<\xfe}\xcd\xd39\x89\x9f`~\x13\x1dt\x82\x8a\x05\x9b\xdb,\x84\xb6gB\xba\x1e\xbf\xf1G\xd7N\xe50\xec\xd5\x16\x0f\'\xff\xd3\xbcmCN\xae\xe5\x8ci\xff+\'\xc1\xe4\x8es\xec\xc7CW\xa4o\xaeSN\xb9\x15\x1aE:\nn\xd6\xe4\xc2\xc3\x88\xe1\xa9\x9b\xb9=(\x1dd\x95\xa4\xaa(\xfd\x1a\xfa\xba\x11\xf21\x0c\xe9\xaf\xd1\x83\xf0\x97\xec\x8b\xb1\x86\xd8\xe9\t\xd3\x99\xdb\xd7\xf3)\x9d\x9dB6m(\x138\xbcI[\xb0\xc0\x0c\x96\xa5\xe4\xa8\xff\xcep>0\x90\xda\x10\xeb"N\xeez\xbe.\xcf\x9b\x99\xe8\xfb\xde\x11\x14\x031y\xb6x!\xca\xb7u\x12\x88\xf3Nv\xd6\xb8E\x1c\xf8\xc4\x14\xe0wfHl,\xa0\xbc,\x82\xa0T\xd4\xa8\x15+\x88u\xf4\x02\t\x88H(%ay\xa2\xc0z\xc0\xa8\x86\xe6p\xcb\x0c\xb8 \x1a\xc4=:\x006\xf5\xb1\xc0\x1f"\x98E\xd1\x85\x95\xbff\x93Y\x91r\xaeL\xe8\xc5\xf8\x94\xb4\xe7M\x7f\xf9\xb1\xf9m?f\xe3\x9dl\xf6d\x89\x14\xe9\x8a\x15\x14\x96t\xd6\x88\xbc!\x96\xe6\xc2\xd1\x06\xca\x07\x0eB\\\xc1E\xca\x82@\x16\x9d^\xb6J\t\xfa\xce^\xf6M\xd7:i\x96\xfa9Ay\xf6e8%\xd3CHJ\x8a\x1b8\x05\x01\x90\xa8I\x84\x9bZpi\xdb\x03\x9b\x04\xca\x02Z\x15\xa4H\xba\x02\xebj\xac\x93n]Z\xc8\xd7\x19\x16U\xb2I|Tk\x0c\xd2\x96E\xb1\x84\xae\xdb\xa1\xf3h\x99v/\xed\xce2(\x7fd\xd9\xacW\x0c\xecS"_$\x8a\x08\x85\x9d`\x1a\xbd\xf8d\xfa\xcf\xddw\x8aD\x82A\xd7\x83\xc8/\xd0l\x9b\x14\x02\xf6>r\x8ej\xc6:5\xe2b\x16\xab\xef\x9d-\xd5N\xd8\x12\xc6&\xde\xe6(l\xcc\xae\xd4\xc4\xb9\xd1\x0bSS\x1fh3W})\xfb\xec\xaaT[\x15\xa7\x18\xaa\xb1ft.#}\x84lE\x88eS\xed\xb2\xbd\xa0\x9f\xfbB\x9dVG\xb5\xf9Y\xdc\xe76-N\xc6b\xc1\x04\x13X\xb6\xa6\rFB_\x11\t\x11\xd8TAd^\xb4\xcf\n\x9a\xe9\xe7J\xd5A\x94\xf4\x8f+-9\xdfU\xc22RU\xc9\xc9\xbe\xc4\x80\x01\xa3\x126m\xf9\x0c\x8c\x07\xf6Z\x1e6\xeb\xec\xbd\xd4\x16\x0c\xe4H\xe4\xf6\xe5\x93L\xeb\xc7\x86\xfa\x10\xe9\xa4K\xf6\xec\x1fk\xeb\x08\xd2\t\x87\xf7\xf7,2x\xaf\xf3\xb87bT\xfc\xb6\xf2\xa5\x8cM\x8b\xe5uar~\x06\tK\x81\xe9\xe2\x87\x0eE\xc7\x9drY\xdd\x86\xdaZ&\xefW\x08\xf9\xce\x1ep\x8b\xe4\x14\x7f\xddeZw\xb4\xed\x04\xc8_\x9c\x82\xb2^d\x19NQ\x95\x9d\n-l\xe3\xd6\xb7IP\tvi\xc5|*\x82+\x0c\xbf\x9e\xce\x91\xf0]\xfa\xd6\x03\xba?\x1aj\x8c\xfb\x05\x80\x9a\x10\xc8\x13\x1d\xbb\xb2\xec\xf5\x88_0D:\xc4\xf0\x9e\x9b\x0c\xe5\x0b4w\xbe\xe2}gd\x8b\xfd\xeft\x1a\x1b\xa2F\xdc\xf5\x8d\x9b\xaf\n\x84\xd0\xfby\xb4\xf1\x89zQ\xbbR\xb5\xecV\xe2%#\x1b\x8dw\xe3\x8as\xf5,<U2\x08\xba\x81\x87\x11\x05\xfe\xf2\xc6r\xc9[\x89u\x0b\x95\x82@D/LuY\xedC2X<:6\xa3UL??\'\xe4\x86f\xf4y\x1f3\xcf\xbf\xde\x0fj\xff\x90c\xbb&\x9c\xe02\xd4q\xf5\x1b\n\xbb\xd9\xb9d\xc4\xbb\xd9\x02\xe2Y\xede\x94(\x9bp\xa9\'t\xfe"Jps\xb8WN\x0e%\x0f\xdfn5\xd9\xfa\xd3\n\x92W\xd1\xbb\xab\x9ew?\x1cU[\x0e\xd5\xfe\xb6q\xaf\xb0S\xd7\xfc?\xfe(\x9d\xa5\xb4-Fm|iw\x19w\x1c&\xfd\x1e+\xc6\x93\'2qzW\x90\xf5f\xaa\x87\xcc\xb2\x9e\x02|T\x9f\xe0\x18{\x19\xcdgy`q\xa6\xfb\xe0\x0b|\x90\xc8\xb28\xf6t\xf8\xa7\x07\x01\xcc\xb6\xd2\xea\xff\xe4?U\xb4\x82^K\xa2\xc5\xf9\xe2\xdf:J5\xc8\xf7yf\x9e4G\x88\xbb\xd8\xfa\x15\xf8]\xa4\xa1V\xf5g^\xb9\x9b\xe1\x80\x03E7\x1aa\xe2H\xcb\xc7\xb6\x18x\x8a>\x85k\xd9\xc8uG\xe4\xe4\\\x9db\xdc\x00L\x8b7\x87\xbd\xeb\xd2x\xc9\xb3u\xa7\x1d\x7fm\xeb\x97.&=\xd6\x9dy\x89\xf8<uA\x8c\xc4\xfc\x97XA\xc3W\xdd\x13\xd1\x13\x18K\xed?\x8f\xed\xed{"\xb6\x07=\xe0\xa7\xa1a\t\xf8\x0b\xba\xb0F\x1b\x93\x1c\xefg\x1d\xd6\x1fw!F\xdf\xa4\xc4\x80\x17\x84\xe3I\xd88\x0e\r\xa1\x8b\xb0\x98\xff*p\x95 \t+i\x00\xe8\xfd\x95\xe3\xd2\xbe\xb4O\x00\x06h\xfe\xa9\x149~\xe1~\x06\xd6\xbe)r\x1e\xa4\xfe\x80S\x10\xe5<)=\xd4n\x95\x96UZ\xd6A\xe3Yq\x889f\x7f?\xc18pJ\x8dTMu\x9f&\xae\xdc\xf7g\xa0Y\xd1\x93%v\xe5\x10\xca\xbf\x0e!\x13q\xc2b\xdf\xe8\xcf\xda\x07\xbe\xb4av\xac\xdev0\x00\xc9\xb6\xa7KF\x96\x8f+\xcd\xf7\x97\x83,H\xa7\xd5\xa5\xe8"\t\xf7A\x15?\xe3\xf8\x90\xad\x17%2\n\xc1\x06\xf0\xf4(_-h\xa6\xb6\x18w\xa19)jk\xd1\xf9\xb4\x80\xc9\xf4G\xf0\xc4\xc8\x02\x02o\x1a\x1f\xb7\xe4,\xa7\x90\x9c\x94\x95\x04\x0c\xd8V5\xa8S\x15!\x86K?\x8cy\xf9\x85z9\xfa\x01E\xe3+\xae\xfdS\xfc+\xd3,\xdd\xae\xdeX\x87\xfb\x9f\xb6\x19\xee\xda\x8a\x91p\xf0w\x9e\xaf\xcf\x9d\x816cV\xdf\xa7\xb5$q\x10\xb4\x04\xe4\xcc\xfc\xb3c\x8co\xb0\xaeF4\xd3B\xa4>jk\xaf\xea\\C\xd5\xf5\xe5\xbb^7~\xc1p\xd3\xc3<\xe9\xff\x10\xc5R\xbb\xee\xdc!\x98\xb7\x94\x84X\x82j\xabrZ\xe0>\xb2t0I\xef8\x1b\xce\x06\xc7\x81\x010\x13\xb4n\xc9\x9bJ24\xc3\xc7Hd\xc1oj\xb7U\x94\x9f\x8d\xe50\x01\x08dk\xf9\xfd7\x96\xac\xcb\xb7\x95L\xb10W\xa6\xc7\xa2\x806\x90\xe8\xa4R\xf1\x90t(\xf4\xce l\x13\xbar\xaf3T\xf9\xd8\xe5\xa8\xbf\x96=\x9a\xef\xc07lL\x02\xe5\xcd\x8a\xe3\x91\x07\xb5\xe9>V\xe4\x1b\xe6\xf3\x19c\x8f[\xe1UrZ\'\xbb?\xacd"\xbdh\xe9\xd5\x9e\xf2\xf2(\x87W \x7f\xe7u\x05\x84\x0f\xba\xc9\xb9bo:wY&\xe7\x01e\x1b{\x96\xfb\xbd\xcb\xff\xd9\x86y*\t\x1c1\x02\x0e/\xe1f\xbe\x83h\x82\xa4\xdb\x11\xdb)\xfc\xd1\x10\xaa\xb4`NGu\xea\x87\xfdR\x94\xf5{ \xc7\x9cJ}\xc5\xd6\xac\xb0\xfc\x8c\x05\xb9n\xed\x89h\xfc\x08\x07\xd4!~\xb9[Hr\x89\xed\x80O\x13w\xea@u\x94\xfc\xfc\x9d[\x1d\xa4\x92t\xa4\x01\xf0J\x99\x15\x10\xbb\x0e\xea\xc6\xa0\xdc\x9f\xb2\x11\xbeIx\xbc)u\xa1\xd8S_w\xb5\xe7\r5\x0e\xa4\x97\'\xcc\x95K\xff\x08\x84\x14EW\xe4\xdb\xeb\x8b\xb1B\xccx\xa6!$#\x97\x80[\x19\xe7\xb5\x12\xd7Z\xb9/\x1e\xf4\xe1\x1c\xb2u\x19\x85\xbd\xa2\xdf\xb0\xbb\xdaKW\xd0\xcb\x81\xb7b\xdcv\xe6|\x7f\nty\xcdjA2\xb9.\x85\xaa;\x0b[_\x1dI\xf4t\x93\xfe\xb4\x99\xd0b\xafU\xaaE<\x05\x9c\x9b\xabg\x9e\xc3\xfaB\xee')
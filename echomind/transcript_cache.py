@@ -0,0 +1,289 @@
+import io
+import os
+import json
+import time
+import wave
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------
+# Fingerprints
+# -------------------------------------------------
+FINGERPRINT_FRAMES = 9
+FINGERPRINT_BANDS = 9
+
+
+def normalized_pcm(wav_bytes: bytes) -> tuple[np.ndarray, int]:
+    """
+    Decode WAV bytes to a canonical form for hashing: mono int16,
+    DC removed and peak-normalized, so the same audio at a different
+    gain or channel layout hashes the same.
+    """
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        channels = wf.getnchannels()
+        samplerate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+
+    samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+    if channels > 1:
+        samples = samples[: len(samples) - len(samples) % channels]
+        samples = samples.reshape(-1, channels).mean(axis=1)
+
+    samples = samples - samples.mean() if len(samples) else samples
+    peak = float(np.max(np.abs(samples))) if len(samples) else 0.0
+    if peak > 0:
+        samples = samples * (32767.0 / peak)
+    return samples.astype(np.int16), samplerate
+
+
+def content_hash(pcm: np.ndarray, samplerate: int, namespace: str = "") -> str:
+    digest = hashlib.sha256()
+    digest.update(namespace.encode())
+    digest.update(samplerate.to_bytes(4, "little"))
+    digest.update(pcm.tobytes())
+    return digest.hexdigest()
+
+
+def perceptual_fingerprint(pcm: np.ndarray) -> int:
+    """
+    64-bit spectral fingerprint (Haitsma/Kalker style): the sign of the
+    band-energy difference across adjacent bands and frames. Robust to
+    gain and light noise; two fingerprints within a few bits of Hamming
+    distance are treated as the same content.
+    """
+    if len(pcm) < FINGERPRINT_FRAMES * 64:
+        return 0
+
+    frames = np.array_split(pcm.astype(np.float32), FINGERPRINT_FRAMES)
+    energies = np.empty((FINGERPRINT_FRAMES, FINGERPRINT_BANDS), dtype=np.float64)
+    for i, frame in enumerate(frames):
+        spectrum = np.abs(np.fft.rfft(frame)) ** 2
+        bands = np.array_split(spectrum[1:], FINGERPRINT_BANDS)
+        energies[i] = [band.sum() for band in bands]
+
+    energies = np.log1p(energies)
+    diff = (energies[1:, 1:] - energies[1:, :-1]) - (energies[:-1, 1:] - energies[:-1, :-1])
+    bits = (diff.ravel() > 0).astype(np.uint64)
+
+    fingerprint = 0
+    for bit in bits:
+        fingerprint = (fingerprint << 1) | int(bit)
+    return fingerprint
+
+
+# -------------------------------------------------
+# Cache
+# -------------------------------------------------
+class TranscriptionCache:
+    """
+    Two-tier cache of transcripts keyed by a hash of the normalized PCM.
+
+      - memory: LRU of the most recent `max_memory_entries` results
+      - disk:   one small JSON file per entry under `cache_dir`, evicted
+                oldest-first once the tier grows past `max_disk_bytes`
+
+    With `fingerprint=True`, a miss on the exact hash falls back to a
+    near-duplicate search over the in-memory entries by perceptual
+    fingerprint (same namespace and duration, Hamming distance <=
+    max_distance).
+
+    Everything here blocks (hashing, file I/O); async callers should run
+    it in an executor.
+    """
+
+    def __init__(
+        self,
+        cache_dir: os.PathLike[str] | str,
+        max_memory_entries: int = 512,
+        max_disk_bytes: int = 50 * 1024 * 1024,
+        fingerprint: bool = False,
+        max_distance: int = 6,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.fingerprint = fingerprint
+        self.max_distance = max_distance
+
+        # key -> {"text", "namespace", "fingerprint", "frames"}
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> file size of the disk tier, oldest first. Scanned from
+        # cache_dir on the first store, then kept up to date in place.
+        self._disk_index: "Optional[OrderedDict[str, int]]" = None
+        self._disk_bytes: Optional[int] = None
+
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "fuzzy_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    # ---- keys ----
+    def describe(self, wav_bytes: bytes, namespace: str = "") -> Dict[str, Any]:
+        pcm, samplerate = normalized_pcm(wav_bytes)
+        return {
+            "key": content_hash(pcm, samplerate, namespace),
+            "namespace": namespace,
+            "fingerprint": perceptual_fingerprint(pcm) if self.fingerprint else None,
+            "frames": len(pcm),
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    # ---- lookup ----
+    def get(self, wav_bytes: bytes, namespace: str = "") -> Optional[str]:
+        try:
+            entry = self.describe(wav_bytes, namespace)
+        except Exception as exc:
+            logger.debug("Cache key error: %s", exc)
+            return None
+        return self.lookup(entry)
+
+    def lookup(self, entry: Dict[str, Any]) -> Optional[str]:
+        key = entry["key"]
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return cached["text"]
+
+        path = self._path(key)
+        try:
+            cached = json.loads(path.read_text())
+        except (OSError, ValueError):
+            cached = None
+        if cached is not None:
+            self._remember(key, cached)
+            with self._lock:
+                self.counters["disk_hits"] += 1
+            return cached["text"]
+
+        if entry.get("fingerprint"):
+            text = self._fuzzy_lookup(entry)
+            if text is not None:
+                return text
+
+        with self._lock:
+            self.counters["misses"] += 1
+        return None
+
+    def _fuzzy_lookup(self, entry: Dict[str, Any]) -> Optional[str]:
+        fingerprint = entry["fingerprint"]
+        frames = entry["frames"]
+        namespace = entry.get("namespace", "")
+        with self._lock:
+            for key, cached in reversed(self._memory.items()):
+                # The exact key includes the namespace; a near match must too
+                if cached.get("namespace", "") != namespace:
+                    continue
+                other = cached.get("fingerprint")
+                if not other or abs(cached.get("frames", 0) - frames) > frames * 0.05:
+                    continue
+                if bin(fingerprint ^ other).count("1") <= self.max_distance:
+                    self._memory.move_to_end(key)
+                    self.counters["fuzzy_hits"] += 1
+                    return cached["text"]
+        return None
+
+    # ---- store ----
+    def put(self, wav_bytes: bytes, text: str, namespace: str = "") -> None:
+        try:
+            entry = self.describe(wav_bytes, namespace)
+        except Exception as exc:
+            logger.debug("Cache key error: %s", exc)
+            return
+        self.store(entry, text)
+
+    def store(self, entry: Dict[str, Any], text: str) -> None:
+        record = {
+            "text": text,
+            "namespace": entry.get("namespace", ""),
+            "fingerprint": entry.get("fingerprint"),
+            "frames": entry["frames"],
+            "created": time.time(),
+        }
+        self._remember(entry["key"], record)
+
+        self._load_disk_index()
+        key = entry["key"]
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = json.dumps(record)
+            path.write_text(data)
+        except OSError as exc:
+            logger.warning("Could not write cache entry: %s", exc)
+            return
+
+        with self._lock:
+            self.counters["stores"] += 1
+            self._disk_bytes += len(data) - self._disk_index.pop(key, 0)
+            self._disk_index[key] = len(data)
+        self._enforce_disk_budget()
+
+    def _remember(self, key: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = record
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _load_disk_index(self) -> None:
+        if self._disk_index is not None:
+            return
+        files = []
+        for f in self.cache_dir.glob("*/*.json"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, f.stem, st.st_size))
+        index = OrderedDict((key, size) for _, key, size in sorted(files))
+        with self._lock:
+            if self._disk_index is None:
+                self._disk_index = index
+                self._disk_bytes = sum(index.values())
+
+    def _enforce_disk_budget(self) -> None:
+        # Oldest first, down to 90% of the budget so we don't evict on every put
+        target = self.max_disk_bytes * 0.9
+        with self._lock:
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+            while self._disk_index and self._disk_bytes > target:
+                key, size = self._disk_index.popitem(last=False)
+                self._disk_bytes -= size
+                self.counters["evictions"] += 1
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    continue
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+            memory_entries = len(self._memory)
+        hits = counters["memory_hits"] + counters["disk_hits"] + counters["fuzzy_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            **counters,
+            "memory_entries": memory_entries,
+            "disk_bytes": self._disk_bytes,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+        }
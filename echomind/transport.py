@@ -0,0 +1,67 @@
+import socket
+from pathlib import Path
+from typing import Optional, Union
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+# -------------------------------------------------
+# Unix domain socket transport (client side)
+#   URLs stay http://localhost:<port>/... and ws://localhost:<port>/...;
+#   only the connection underneath goes to the service's socket file
+#   instead of TCP. See `control_socket` in the config.
+# -------------------------------------------------
+def connect_unix(path: Union[str, Path], timeout: Optional[float] = None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, socket_path: str, *args, **kwargs) -> None:
+        super().__init__("localhost", *args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        # urllib3 passes a sentinel object when no timeout was given
+        timeout = self.timeout if isinstance(self.timeout, (int, float)) else None
+        return connect_unix(self.socket_path, timeout)
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    def __init__(self, socket_path: str, **kwargs) -> None:
+        super().__init__("localhost", **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self) -> UnixHTTPConnection:
+        self.num_connections += 1
+        return UnixHTTPConnection(self.socket_path, timeout=self.timeout.connect_timeout)
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    requests adapter that sends every request it's mounted for to one
+    Unix socket, over a pool of keep-alive connections like HTTPAdapter.
+    """
+
+    def __init__(self, socket_path: Union[str, Path], pool_maxsize: int = 4, **kwargs) -> None:
+        self.socket_path = str(socket_path)
+        self._pool = UnixHTTPConnectionPool(self.socket_path, maxsize=pool_maxsize, block=False)
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool
+
+    # requests >= 2.32 asks for the pool through this instead
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def close(self) -> None:
+        super().close()
+        self._pool.close()
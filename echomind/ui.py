@@ -1,9 +1,12 @@
 import tkinter as tk
 from tkinter import scrolledtext, ttk, messagebox
 import threading
+import queue
+import time
+import math
 import json
-import requests
-import websocket
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json as json_lib
 
@@ -23,6 +26,130 @@ else:
 CONTROL_URL = f"http://localhost:{PORT}"
 WS_URL = f"ws://localhost:{PORT}/ws"
 
+STATS_URL = f"ws://localhost:{PORT}/stats/ws"
+# The service's session behind /ws until a message names it
+DEFAULT_SESSION = "default"
+# (connect, read) seconds for control calls
+CONTROL_TIMEOUT = (3.05, 15)
+SPINNER = "◐◓◑◒"
+
+# Transcript redraw rate; messages arriving in between are rendered together
+FRAME_MS = int(cfg.get("ui_frame_ms", 50))
+MAX_MESSAGES_PER_FRAME = 500
+SHOW_HEALTH = bool(cfg.get("ui_show_health", True))
+# Finals the capture->display latency (last, p95) is taken over
+LATENCY_WINDOW = 50
+
+# Scrollback kept per pane; older lines are re-fetched from the service
+MAX_LINES = int(cfg.get("ui_max_lines", 2000))
+TRIM_BATCH = int(cfg.get("ui_trim_batch", 200))
+HISTORY_PAGE = int(cfg.get("ui_history_page", 200))
+
+
+def level_bar(rms: float, width: int = 8) -> str:
+    """int16 RMS -> a small meter spanning -60..0 dBFS."""
+    db = 20 * math.log10(max(rms, 1.0) / 32768.0)
+    filled = max(0, min(width, round((db + 60) / 60 * width)))
+    return "▮" * filled + "▯" * (width - filled)
+
+
+def format_health(stats: dict) -> str:
+    level = stats.get("level", {})
+    parts = [
+        f"MIC {level_bar(level.get('mic', 0))}  SYS {level_bar(level.get('system', 0))}",
+        f"buffer {stats.get('buffer_s', 0):.1f}s",
+        f"in flight {stats.get('inflight', 0)}",
+    ]
+    api = stats.get("api") or {}
+    if api.get("avg") is not None:
+        parts.append(f"API {api['avg'] * 1000:.0f} ms (p95 {api['p95'] * 1000:.0f} ms)")
+    else:
+        parts.append("API –")
+    parts.append(f"dropped {stats.get('dropped', 0)}")
+    if stats.get("overflows"):
+        parts.append(f"overflows {stats['overflows']}")
+    if stats.get("capture_restarts"):
+        parts.append(f"capture restarts {stats['capture_restarts']}")
+    if stats.get("breaker") not in (None, "closed"):
+        parts.append(f"API circuit {stats['breaker']}")
+    return "  |  ".join(parts)
+
+
+def format_latency(samples, stages: dict) -> str:
+    """Capture->display latency of the last final, its p95 and its slowest stage."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    text = f"capture→display {samples[-1]:.1f}s (p95 {p95:.1f}s"
+    stages = {k: v for k, v in stages.items() if k != "total"}
+    if stages:
+        name = max(stages, key=stages.get)
+        text += f", {name} {stages[name]:.1f}s"
+    return text + ")"
+
+
+def line_tags(data: dict) -> tuple:
+    """Text tags for a transcript line: its segment, seq (finals) and interim style."""
+    tags = (f"seg-{data['segment_id']}",)
+    if data.get("seq") is not None:
+        tags += (f"seq-{data['seq']}",)
+    if data.get("type") == "partial":
+        tags += ("interim",)
+    return tags
+
+
+class ControlClient:
+    """
+    Runs control-API calls off the Tk thread, on a small worker pool that
+    shares one keep-alive requests.Session. `on_done(data, error)` is
+    handed to `deliver`, which must get it onto the Tk thread.
+
+    The session (and the requests import behind it) is created by the
+    first call, on a worker, so it stays off the window's startup path.
+    """
+
+    def __init__(self, deliver):
+        self.deliver = deliver
+        self.session = None
+        self._session_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="echomind-control")
+
+    def get_session(self):
+        with self._session_lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from instance import control_socket_path
+
+                session = requests.Session()
+                socket_path = control_socket_path(cfg)
+                if socket_path is not None:
+                    from transport import UnixSocketAdapter
+
+                    session.mount("http://", UnixSocketAdapter(socket_path, pool_maxsize=4))
+                else:
+                    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+                self.session = session
+            return self.session
+
+    def call(self, method: str, path: str, on_done, **kwargs):
+        kwargs.setdefault("timeout", CONTROL_TIMEOUT)
+
+        def run():
+            try:
+                # CONTROL_URL is read per call; saving settings may change it
+                r = self.get_session().request(method, f"{CONTROL_URL}{path}", **kwargs)
+                return r.json(), None
+            except Exception as e:
+                return None, e
+
+        future = self.executor.submit(run)
+        future.add_done_callback(lambda f: self.deliver(lambda: on_done(*f.result())))
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.session is not None:
+            self.session.close()
+
 
 class TranscriptionUI:
     def __init__(self):
@@ -33,6 +160,29 @@ class TranscriptionUI:
 
         self.status_label = None
         self.is_running = True
+        # Filled by the WebSocket thread, drained on the Tk thread
+        self.incoming: queue.Queue = queue.Queue()
+        # Per pane: lines were trimmed / a history page is on its way
+        self.has_older: dict = {}
+        self.history_loading: set = set()
+        self.history_retry_at: dict = {}
+        # Session whose transcript is shown; history is paged from it
+        self.session_id = DEFAULT_SESSION
+
+        # Control-call results, run on the Tk thread by flush_messages
+        self.ui_calls: queue.Queue = queue.Queue()
+        self.control = ControlClient(self.ui_calls.put)
+        self.busy_calls = 0
+        self.status_text = "Status: Idle"
+        self.spinner_frame = 0
+
+        # Latest stats-channel snapshot (replaced whole by its thread)
+        self.health = None
+        self.shown_health = None
+        # Capture->display seconds of recent finals, and the last one's stages
+        self.latency = deque(maxlen=LATENCY_WINDOW)
+        self.latency_stages: dict = {}
+        self.shown_latency = None
 
         # Settings window state
         self.settings_window = None
@@ -42,15 +192,15 @@ class TranscriptionUI:
         self.settings_bools: dict[str, tk.BooleanVar] = {}
 
         self.create_window()
+        self.has_older = {self.user_box: False, self.system_box: False}
+        self.root.after(FRAME_MS, self.flush_messages)
         threading.Thread(target=self.websocket_thread, daemon=True).start()
+        if SHOW_HEALTH:
+            threading.Thread(target=self.stats_thread, daemon=True).start()
 
     # -------------------------------------------------
     # UI LAYOUT
     # -------------------------------------------------
-    def disable_button_temporarily(self, button: ttk.Button, delay_ms: int = 800):
-        button.state(["disabled"])
-        button.after(delay_ms, lambda: button.state(["!disabled"]))
-
     def create_window(self):
         self.root = tk.Tk()
         self.root.title("EchoMind – Dual-Channel Transcription")
@@ -124,6 +274,10 @@ class TranscriptionUI:
         )
         self.system_box.grid(row=1, column=2, sticky="nsew", padx=(15, 0))
 
+        # Streaming partials are shown dimmed until the final text replaces them
+        for box in (self.user_box, self.system_box):
+            box.tag_configure("interim", foreground="#8a8a8a")
+
         # ---------- CONTROL BUTTONS ----------
         controls_frame = tk.Frame(self.root, bg="#1e1e1e")
         controls_frame.grid(row=1, column=0, pady=(0, 10))
@@ -192,32 +346,273 @@ class TranscriptionUI:
         )
         self.status_label.grid(row=2, column=0, pady=(0, 10))
 
+        # ---------- HEALTH OVERLAY ----------
+        self.health_label = tk.Label(
+            self.root,
+            text="",
+            fg="#8a8a8a",
+            bg="#1e1e1e",
+            font=("Menlo", 10),
+        )
+        self.health_label.grid(row=3, column=0, pady=(0, 8))
+
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     # -------------------------------------------------
     # CONTROL BUTTON HANDLERS
     # -------------------------------------------------
+    def set_status(self, text: str, error: bool = False):
+        self.status_text = text
+        self.status_label.config(text=text, fg="#e06c75" if error else "#cccccc")
+
+    def tick_status(self):
+        """Animate the status line while control calls are in flight."""
+        if not self.busy_calls:
+            return
+        self.spinner_frame = (self.spinner_frame + 1) % (len(SPINNER) * 4)
+        frame = SPINNER[self.spinner_frame // 4]
+        self.status_label.config(text=f"{frame} {self.status_text}")
+
+    def control_call(self, method: str, path: str, pending: str, on_done, button=None, **kwargs):
+        """Fire a control call in the background; the window keeps repainting."""
+        if button is not None:
+            button.state(["disabled"])
+        self.busy_calls += 1
+        self.set_status(pending)
+
+        def done(data, error):
+            self.busy_calls -= 1
+            if button is not None:
+                button.state(["!disabled"])
+            on_done(data, error)
+
+        self.control.call(method, path, done, **kwargs)
+
     def start_service(self):
-        try:
-            self.disable_button_temporarily(self.start_btn)
-            r = requests.post(f"{CONTROL_URL}/start", timeout=15)
-            data = r.json()
-            self.status_label.config(text=f"Status: {data.get('status')}")
-        except Exception as e:
-            self.status_label.config(text=f"Error starting: {str(e)}")
+        def done(data, error):
+            if error is not None:
+                self.set_status(f"Error starting: {error}", error=True)
+            else:
+                self.set_status(f"Status: {data.get('status')}")
+
+        self.control_call("POST", "/start", "Starting...", done, button=self.start_btn)
 
     def stop_service(self):
-        try:
-            self.disable_button_temporarily(self.stop_btn)
-            r = requests.post(f"{CONTROL_URL}/stop", timeout=15)
-            data = r.json()
-            self.status_label.config(text=f"Status: {data.get('status')}")
-        except Exception as e:
-            self.status_label.config(text=f"Error stopping: {str(e)}")
+        def done(data, error):
+            if error is not None:
+                self.set_status(f"Error stopping: {error}", error=True)
+            else:
+                self.set_status(f"Status: {data.get('status')}")
+
+        self.control_call("POST", "/stop", "Stopping...", done, button=self.stop_btn)
 
     def clear_text(self):
         self.user_box.delete("1.0", tk.END)
         self.system_box.delete("1.0", tk.END)
+        # Cleared on purpose: don't page it back in
+        self.has_older = {self.user_box: False, self.system_box: False}
+
+    # -------------------------------------------------
+    # TRANSCRIPT RENDERING
+    #   The WebSocket thread only queues messages; the Tk thread drains
+    #   the queue every FRAME_MS and renders the whole frame at once.
+    # -------------------------------------------------
+    def flush_messages(self):
+        if not self.is_running:
+            return
+
+        try:
+            while True:
+                self.ui_calls.get_nowait()()
+        except queue.Empty:
+            pass
+
+        batch = []
+        try:
+            while len(batch) < MAX_MESSAGES_PER_FRAME:
+                batch.append(self.incoming.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            if batch:
+                self.render_batch(batch)
+            self.maybe_load_history()
+            self.tick_status()
+            self.render_health()
+        except tk.TclError as e:
+            print("Render error:", e)
+        self.root.after(FRAME_MS, self.flush_messages)
+
+    def render_batch(self, messages: list[dict]):
+        """
+        Render one frame of service messages. New lines are collected per
+        box and written with a single insert() each; a message for a line
+        still waiting in this frame just updates it, so a burst of
+        partials collapses into its latest text. Partial, final and
+        retract messages share a segment_id, and lines already on screen
+        are replaced in place.
+        """
+        appends = {self.user_box: [], self.system_box: []}
+        # segment_id -> [text, tags] entry of appends still in this frame
+        waiting = {self.user_box: {}, self.system_box: {}}
+
+        for data in messages:
+            if data.get("session"):
+                self.session_id = data["session"]
+            box = self.user_box if data.get("source") == "mic" else self.system_box
+            kind = data.get("type", "final")
+            text = data.get("text", "")
+            segment_id = data.get("segment_id")
+            pending, queued = appends[box], waiting[box]
+
+            if not segment_id:
+                if text:
+                    pending.append([text, ()])
+                continue
+
+            tag = f"seg-{segment_id}"
+            if kind == "revision":
+                replaces = data.get("replaces", [])
+                replaced = [queued.pop(sid) for sid in replaces if sid in queued]
+                for entry in replaced:
+                    entry[0] = None
+                if any(box.tag_ranges(f"seg-{sid}") for sid in replaces):
+                    self.apply_revision(box, data)
+                elif replaced:
+                    replaced[0][:] = [text, line_tags(data)]
+                    queued[segment_id] = replaced[0]
+                else:
+                    queued[segment_id] = [text, line_tags(data)]
+                    pending.append(queued[segment_id])
+                continue
+
+            if kind == "final" and data.get("captured_at"):
+                # Drawn at the end of this frame; the stream clock and ours
+                # are both wall time on the same machine
+                self.latency.append(max(0.0, time.time() - data["captured_at"]))
+                self.latency_stages = data.get("latency") or {}
+
+            tags = line_tags(data)
+            keep = text if kind != "retract" else ""
+            entry = queued.get(segment_id)
+            if entry is not None:
+                entry[:] = [keep or None, tags]
+                if not keep:
+                    del queued[segment_id]
+            elif box.tag_ranges(tag):
+                self.replace_line(box, tag, keep, tags)
+            elif keep:
+                queued[segment_id] = [keep, tags]
+                pending.append(queued[segment_id])
+
+        for box, pending in appends.items():
+            chunks = []
+            for text, tags in pending:
+                if text is not None:
+                    chunks.extend([text + "\n", tags])
+            if chunks:
+                box.insert(tk.END, *chunks)
+                box.see(tk.END)
+                self.trim_scrollback(box)
+
+    def replace_line(self, box, tag: str, text: str, tags: tuple):
+        ranges = box.tag_ranges(tag)
+        box.delete(ranges[0], ranges[1])
+        if text:
+            box.insert(ranges[0], text + "\n", tags)
+
+    def apply_revision(self, box, data: dict):
+        """Two-pass mode: swap a run of draft lines for the revised text."""
+        index = None
+        for segment_id in data.get("replaces", []):
+            ranges = box.tag_ranges(f"seg-{segment_id}")
+            if ranges:
+                # Remember where the first draft was; later deletes don't move it
+                index = index or box.index(ranges[0])
+                box.delete(ranges[0], ranges[1])
+
+        if index is None:
+            box.insert(tk.END, data["text"] + "\n", line_tags(data))
+            box.see(tk.END)
+        else:
+            box.insert(index, data["text"] + "\n", line_tags(data))
+
+    def render_health(self):
+        health = self.health
+        latency = self.latency[-1] if self.latency else None
+        if health is self.shown_health and latency == self.shown_latency:
+            return
+        self.shown_health, self.shown_latency = health, latency
+        parts = []
+        if health:
+            parts.append(format_health(health))
+        if latency is not None and SHOW_HEALTH:
+            parts.append(format_latency(self.latency, self.latency_stages))
+        self.health_label.config(text="\n".join(parts))
+
+    # -------------------------------------------------
+    # SCROLLBACK & HISTORY
+    #   Each pane keeps at most MAX_LINES lines. Older lines are dropped
+    #   in TRIM_BATCH-sized steps and paged back in from the service's
+    #   history when the user scrolls to the top.
+    # -------------------------------------------------
+    def trim_scrollback(self, box):
+        # Never pull lines out from under someone reading older text
+        if box.yview()[1] < 1.0:
+            return
+        lines = int(box.index("end-1c").split(".")[0])
+        if lines <= MAX_LINES + TRIM_BATCH:
+            return
+        box.delete("1.0", f"{lines - MAX_LINES + 1}.0")
+        self.has_older[box] = True
+
+    def oldest_seq(self, box) -> int | None:
+        for tag in box.tag_names("1.0"):
+            if tag.startswith("seq-"):
+                return int(tag[4:])
+        return None
+
+    def maybe_load_history(self):
+        for box, source in ((self.user_box, "mic"), (self.system_box, "system")):
+            if not self.has_older[box] or box in self.history_loading:
+                continue
+            if time.monotonic() < self.history_retry_at.get(box, 0.0):
+                continue
+            if box.yview()[0] > 0.0:
+                continue
+            before = self.oldest_seq(box)
+            if before is None:
+                continue
+
+            self.history_loading.add(box)
+            self.control.call(
+                "GET",
+                f"/sessions/{self.session_id}/history",
+                lambda page, error, source=source: self.render_history(
+                    {"source": source, **(page or {"lines": [], "has_more": True, "failed": True})}
+                ),
+                params={"before": before, "limit": HISTORY_PAGE, "source": source},
+            )
+
+    def render_history(self, data: dict):
+        box = self.user_box if data.get("source") == "mic" else self.system_box
+        self.history_loading.discard(box)
+        self.has_older[box] = bool(data.get("has_more"))
+        if data.get("failed"):
+            self.history_retry_at[box] = time.monotonic() + 5.0
+
+        chunks = []
+        for line in data.get("lines", []):
+            chunks.extend([line["text"] + "\n", line_tags(line)])
+        if chunks:
+            # Keep the user's place instead of jumping to the new top. A
+            # mark rides along with the old first line; counting lines
+            # would be off as soon as one of them wraps.
+            box.mark_set("history_top", "@0,0")
+            box.insert("1.0", *chunks)
+            box.yview("history_top")
+            box.mark_unset("history_top")
 
     # -------------------------------------------------
     # SETTINGS WINDOW
@@ -338,11 +733,11 @@ class TranscriptionUI:
         save_btn = ttk.Button(
             btn_frame,
             text="Save",
-            command=self.save_settings_and_restart,
+            command=self.save_settings_and_apply,
         )
         save_btn.pack(side=tk.RIGHT)
 
-    def save_settings_and_restart(self):
+    def save_settings_and_apply(self):
         new_config: dict = {}
 
         # Parse each field
@@ -378,55 +773,60 @@ class TranscriptionUI:
             return
 
         # Update globals
-        global cfg, PORT, CONTROL_URL, WS_URL
+        global cfg, PORT, CONTROL_URL, WS_URL, STATS_URL
         cfg = new_config
         PORT = cfg.get("control_port", PORT)
         CONTROL_URL = f"http://localhost:{PORT}"
         WS_URL = f"ws://localhost:{PORT}/ws"
-
-        # Send restart
-        try:
-            r = requests.post(f"{CONTROL_URL}/restart", timeout=15)
-            data = r.json()
-            self.status_label.config(text=f"Status: {data.get('status')}")
-        except Exception as e:
-            messagebox.showwarning(
-                "Restart Error",
-                f"Config saved, but restart request failed:\n{e}",
-            )
-            self.status_label.config(text=f"Config saved. Restart failed: {e}")
-        else:
-            messagebox.showinfo(
-                "Success",
-                "Settings saved and service restart requested.",
-            )
+        STATS_URL = f"ws://localhost:{PORT}/stats/ws"
 
         if self.settings_window is not None and self.settings_window.winfo_exists():
             self.settings_window.destroy()
             self.settings_window = None
 
+        # Ask the service to apply the new config in place (it also
+        # watches config.json, this just makes it immediate).
+        def done(data, error):
+            if error is not None:
+                self.set_status(f"Config saved. Reload failed: {error}", error=True)
+                messagebox.showwarning(
+                    "Reload Error",
+                    f"Config saved, but reload request failed:\n{error}",
+                )
+            else:
+                self.set_status(f"Status: config {data.get('status')}")
+                messagebox.showinfo(
+                    "Success",
+                    "Settings saved and applied.",
+                )
+
+        self.control_call("POST", "/config/reload", "Applying settings...", done)
+
     # -------------------------------------------------
     # WEBSOCKET LISTEN THREAD
     # -------------------------------------------------
+    @staticmethod
+    def connect_socket():
+        """A connected Unix socket for WebSocketApp when control_socket is set, else None (TCP)."""
+        from instance import control_socket_path
+
+        socket_path = control_socket_path(cfg)
+        if socket_path is None:
+            return None
+        from transport import connect_unix
+
+        return connect_unix(socket_path, timeout=CONTROL_TIMEOUT[0])
+
     def websocket_thread(self):
+        import websocket  # imported here, off the window's startup path
+
         def on_message(ws, message: str):
             try:
                 data = json.loads(message)
             except Exception:
                 return
 
-            text = data.get("text", "")
-            source = data.get("source", "system")
-
-            if not text:
-                return
-
-            if source == "mic":
-                self.user_box.insert(tk.END, text + "\n")
-                self.user_box.see(tk.END)
-            else:
-                self.system_box.insert(tk.END, text + "\n")
-                self.system_box.see(tk.END)
+            self.incoming.put(data)
 
         def on_error(ws, error):
             print("WebSocket error:", error)
@@ -445,6 +845,7 @@ class TranscriptionUI:
                     on_error=on_error,
                     on_close=on_close,
                     on_open=on_open,
+                    socket=self.connect_socket(),
                 )
                 ws.run_forever()
             except Exception as e:
@@ -453,11 +854,40 @@ class TranscriptionUI:
                 import time
                 time.sleep(3)
 
+    # -------------------------------------------------
+    # STATS CHANNEL THREAD
+    #   Separate socket from the transcript stream; the service pushes a
+    #   small snapshot a few times per second, only when it changes.
+    # -------------------------------------------------
+    def stats_thread(self):
+        import websocket
+
+        def on_message(ws, message: str):
+            try:
+                self.health = json.loads(message)
+            except Exception:
+                pass
+
+        def on_close(ws, close_status_code, close_msg):
+            self.health = None
+
+        while self.is_running:
+            try:
+                ws = websocket.WebSocketApp(
+                    STATS_URL, on_message=on_message, on_close=on_close, socket=self.connect_socket()
+                )
+                ws.run_forever()
+            except Exception as e:
+                print("Stats connection failed, retrying in 3s:", e)
+            if self.is_running:
+                time.sleep(3)
+
     # -------------------------------------------------
     # SHUTDOWN
     # -------------------------------------------------
     def on_closing(self):
         self.is_running = False
+        self.control.close()
         self.root.destroy()
 
     def run(self):
@@ -465,7 +895,13 @@ class TranscriptionUI:
 
 
 if __name__ == "__main__":
-    TranscriptionUI().run()
+    from instance import InstanceLock
+
+    ui_lock = InstanceLock("ui")
+    if ui_lock.acquire():
+        TranscriptionUI().run()
+    else:
+        print("EchoMind UI is already running")
 
 
 
@@ -0,0 +1,214 @@
+import io
+import time
+import wave
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+# USD per audio minute; models not listed (e.g. local ones) cost nothing.
+DEFAULT_PRICES_PER_MINUTE = {
+    "whisper-1": 0.006,
+    "gpt-4o-transcribe": 0.006,
+    "gpt-4o-mini-transcribe": 0.003,
+}
+
+
+def wav_duration(wav_bytes: bytes) -> float:
+    try:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except Exception:
+        return 0.0
+
+
+# -------------------------------------------------
+# Metering
+# -------------------------------------------------
+@dataclass
+class UsageRecord:
+    at: float
+    model: str
+    source: str
+    seconds: float
+    bytes: int
+    latency: float
+    cost: float
+    # False for attempts that failed, timed out or were cancelled
+    ok: bool = True
+
+
+class UsageMeter:
+    """
+    Rolling log of every API request (audio seconds, payload bytes,
+    latency, model, source), kept for `retention` seconds and summarized
+    per window, model and source on demand. Failed attempts count
+    towards spend; latencies are of the successful ones.
+    """
+
+    def __init__(
+        self,
+        prices: Optional[Dict[str, float]] = None,
+        retention: float = 3600.0,
+    ) -> None:
+        self.prices = {**DEFAULT_PRICES_PER_MINUTE, **(prices or {})}
+        self.retention = retention
+        self._records: "deque[UsageRecord]" = deque()
+        self._lock = threading.Lock()
+        self.totals = {"requests": 0, "failed": 0, "audio_seconds": 0.0, "bytes": 0, "cost": 0.0}
+
+    def price(self, model: str) -> float:
+        return self.prices.get(model, 0.0)
+
+    def record(
+        self, model: str, source: str, seconds: float, nbytes: int, latency: float, ok: bool = True
+    ) -> None:
+        now = time.time()
+        cost = seconds / 60.0 * self.price(model)
+        with self._lock:
+            self._records.append(
+                UsageRecord(now, model, source or "unknown", seconds, nbytes, latency, cost, ok)
+            )
+            self.totals["requests"] += 1
+            self.totals["failed"] += not ok
+            self.totals["audio_seconds"] += seconds
+            self.totals["bytes"] += nbytes
+            self.totals["cost"] += cost
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        while self._records and now - self._records[0].at > self.retention:
+            self._records.popleft()
+
+    def _recent(self, window: float) -> list[UsageRecord]:
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            return [r for r in self._records if now - r.at <= window]
+
+    @staticmethod
+    def _summarize(records: list[UsageRecord]) -> Dict[str, Any]:
+        latencies = [r.latency for r in records if r.ok]
+        return {
+            "requests": len(records),
+            "failed": sum(not r.ok for r in records),
+            "audio_seconds": round(sum(r.seconds for r in records), 2),
+            "bytes": sum(r.bytes for r in records),
+            "cost": round(sum(r.cost for r in records), 5),
+            "avg_latency": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        }
+
+    def window(self, seconds: float) -> Dict[str, Any]:
+        records = self._recent(seconds)
+        summary = self._summarize(records)
+        for key in ("model", "source"):
+            groups: Dict[str, list] = {}
+            for r in records:
+                groups.setdefault(getattr(r, key), []).append(r)
+            summary[f"by_{key}"] = {name: self._summarize(rs) for name, rs in groups.items()}
+        return summary
+
+    def latency(self, window: float = 30.0) -> Dict[str, Any]:
+        """Average and p95 request latency over the last `window` seconds."""
+        latencies = sorted(r.latency for r in self._recent(window) if r.ok)
+        if not latencies:
+            return {"requests": 0, "avg": None, "p95": None}
+        return {
+            "requests": len(latencies),
+            "avg": round(sum(latencies) / len(latencies), 3),
+            "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+        }
+
+    def spend_rate(self, window: float = 600.0) -> float:
+        """Cost over the last `window` seconds, extrapolated to USD/hour."""
+        cost = sum(r.cost for r in self._recent(window))
+        return cost * 3600.0 / window
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            totals = dict(self.totals)
+        return {
+            "last_minute": self.window(60.0),
+            "last_hour": self.window(3600.0),
+            "spend_rate_per_hour": round(self.spend_rate(), 4),
+            "totals": {**totals, "cost": round(totals["cost"], 5)},
+        }
+
+
+# -------------------------------------------------
+# Budget
+# -------------------------------------------------
+@dataclass
+class BudgetSettings:
+    # USD per hour, measured over `window` seconds of spend
+    hourly_budget: float
+    # Above this share of the budget, switch to `economy_model`
+    economy_ratio: float = 0.8
+    economy_model: str = "gpt-4o-mini-transcribe"
+    # Over budget: also multiply the gating thresholds by this
+    strict_gate_factor: float = 1.5
+    window: float = 600.0
+
+
+class BudgetPolicy:
+    """
+    Maps the meter's spend rate to a level:
+      - normal:  nothing changes
+      - economy: requests use the cheaper economy_model
+      - strict:  economy model plus stricter gating, so fewer chunks go out
+    """
+
+    NORMAL, ECONOMY, STRICT = "normal", "economy", "strict"
+
+    def __init__(self, settings: BudgetSettings, meter: UsageMeter) -> None:
+        self.settings = settings
+        self.meter = meter
+        self._level = self.NORMAL
+        self._checked = 0.0
+
+    def level(self) -> str:
+        # Re-evaluated at most once a second; it's read for every chunk
+        now = time.monotonic()
+        if now - self._checked < 1.0:
+            return self._level
+        self._checked = now
+
+        rate = self.meter.spend_rate(self.settings.window)
+        budget = self.settings.hourly_budget
+        if rate >= budget:
+            level = self.STRICT
+        elif rate >= budget * self.settings.economy_ratio:
+            level = self.ECONOMY
+        else:
+            level = self.NORMAL
+
+        if level != self._level:
+            logger.warning(
+                "Budget level %s -> %s (spend %.4f/h, budget %.4f/h)",
+                self._level, level, rate, budget,
+            )
+            self._level = level
+        return level
+
+    def model_override(self, model: str) -> Optional[str]:
+        if self.level() == self.NORMAL or not self.settings.economy_model:
+            return None
+        economy = self.settings.economy_model
+        if self.meter.price(economy) >= self.meter.price(model):
+            return None  # already on the cheaper (or a free) model
+        return economy
+
+    def gate_factor(self) -> float:
+        return self.settings.strict_gate_factor if self.level() == self.STRICT else 1.0
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "level": self.level(),
+            "hourly_budget": self.settings.hourly_budget,
+            "economy_model": self.settings.economy_model,
+            "gate_factor": self.gate_factor(),
+        }